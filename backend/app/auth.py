@@ -4,7 +4,9 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 from app.config import get_settings
 from app.database import get_db
 from app import models, schemas
@@ -33,17 +35,18 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 
-def authenticate_user(db: Session, username: str, password: str):
-    user = db.query(models.User).filter(models.User.username == username).first()
+async def authenticate_user(db: AsyncSession, username: str, password: str):
+    user = await db.scalar(select(models.User).where(models.User.username == username))
     if not user:
         return False
-    if not verify_password(password, user.hashed_password):
+    # bcrypt is deliberately slow; keep it off the event loop
+    if not await run_in_threadpool(verify_password, password, user.hashed_password):
         return False
     return user
 
 
 async def get_current_user(
-    token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
 ) -> models.User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -58,7 +61,7 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    user = db.query(models.User).filter(models.User.username == username).first()
+    user = await db.scalar(select(models.User).where(models.User.username == username))
     if user is None:
         raise credentials_exception
     return user
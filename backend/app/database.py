@@ -1,19 +1,178 @@
+import os
+import threading
+import time
+import uuid
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+from typing import Tuple
 from app.config import get_settings
 
 settings = get_settings()
 
-engine = create_engine(settings.DATABASE_URL)
+
+class PoolWaitStats:
+    """Time spent waiting for a pooled connection, across checkouts"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            waits = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_seconds / waits * 1000, 2) if waits else 0.0,
+                "max_wait_ms": round(self.max_seconds * 1000, 2),
+            }
+
+
+class _TimedPoolMixin:
+    """Records how long each checkout waited for a free connection"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.wait_stats.record(time.perf_counter() - start)
+        return connection
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_options(poolclass) -> dict:
+    """Pool arguments from the DB_POOL_* settings"""
+    if settings.DB_PGBOUNCER:
+        # PgBouncer does the pooling; holding server connections here too
+        # would pin them and defeat transaction pooling
+        return {"poolclass": NullPool}
+    return {
+        "poolclass": poolclass,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+# Sync engine: ingestion, background jobs, scripts and migrations
+engine = create_engine(settings.DATABASE_URL, **engine_options(TimedQueuePool))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+# libpq (psycopg2) URL options asyncpg has no connect() argument for
+LIBPQ_ONLY_OPTIONS = {
+    "sslrootcert", "sslcert", "sslkey", "sslcrl", "sslpassword", "gssencmode", "krbsrvname",
+    "keepalives", "keepalives_idle", "keepalives_interval", "keepalives_count", "options",
+}
+
+
+def async_database_url() -> Tuple[str, dict]:
+    """
+    ASYNC_DATABASE_URL, or DATABASE_URL with the asyncpg driver, plus the
+    connect_args for it. asyncpg rejects libpq query options, so those of
+    a derived URL are translated (sslmode -> ssl, connect_timeout ->
+    timeout, application_name -> server_settings) or dropped.
+    """
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL, {}
+
+    url = make_url(settings.DATABASE_URL).set(drivername="postgresql+asyncpg")
+    query = {name: value if isinstance(value, str) else value[-1] for name, value in url.query.items()}
+    connect_args = {}
+    if "sslmode" in query:
+        connect_args["ssl"] = query.pop("sslmode")
+    if "connect_timeout" in query:
+        connect_args["timeout"] = float(query.pop("connect_timeout"))
+    if "application_name" in query:
+        connect_args["server_settings"] = {"application_name": query.pop("application_name")}
+    dropped = sorted(set(query) & LIBPQ_ONLY_OPTIONS)
+    if dropped:
+        print(f"⚠️  Ignoring {', '.join(dropped)} for the API connection; set ASYNC_DATABASE_URL to configure them")
+        for name in dropped:
+            query.pop(name)
+    return url.set(query=query).render_as_string(hide_password=False), connect_args
+
+
+ASYNC_DATABASE_URL, async_connect_args = async_database_url()
+if settings.DB_PGBOUNCER:
+    # PgBouncer in transaction mode can hand each transaction a different
+    # server connection, so asyncpg must not cache prepared statements, and
+    # their names must be unique so they never collide with another
+    # client's on a shared server connection
+    async_connect_args.update({
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+    })
+
+# Async engine: API requests, so a query never blocks the event loop
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    connect_args=async_connect_args,
+    **engine_options(TimedAsyncQueuePool)
+)
+# Objects stay usable after commit; attributes can't be lazy-loaded on an
+# AsyncSession, so routes load what they return explicitly
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+
 Base = declarative_base()
 
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+def pool_stats(pool) -> dict:
+    """Live state of a connection pool (of this process only)"""
+    stats = {"pool_class": type(pool).__name__, "pid": os.getpid()}
+    if not isinstance(pool, QueuePool):
+        return stats
+
+    stats.update({
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        # Connections opened beyond pool_size; negative while the pool
+        # hasn't opened pool_size connections yet
+        "overflow": pool.overflow(),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "timeout_seconds": pool.timeout(),
+    })
+    wait_stats = getattr(pool, "wait_stats", None)
+    if wait_stats is not None:
+        stats.update(wait_stats.snapshot())
+    return stats
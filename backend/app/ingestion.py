@@ -0,0 +1,1778 @@
+"""
+Shared building blocks for loading translations from object storage
+"""
+import hashlib
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+import uuid
+import zlib
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import partial
+from itertools import chain
+from io import StringIO
+from typing import Callable, ContextManager, Dict, Any, Iterable, Iterator, List, Optional, Tuple
+from sqlalchemy import Float, String, column, func, literal_column, text, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from app import models
+from app.config import get_settings
+from app.database import SessionLocal
+from app.report_aggregates import refresh_report_aggregates
+from app.s3_service import GetResult, ObjectInfo, json_loads, parse_object_key, s3_service
+
+settings = get_settings()
+
+# Maximum number of per-pair errors kept in a progress snapshot
+MAX_REPORTED_ERRORS = 100
+
+# Parsed shard records buffered between the shard readers and the writer
+SHARD_QUEUE_SIZE = 1000
+
+# Target shard records indexed in memory for a shard join; larger shards
+# are joined on disk, split into SHARD_JOIN_PARTITIONS partitions by hash of
+# the record ID
+SHARD_INDEX_MAX_RECORDS = 100000
+SHARD_JOIN_PARTITIONS = 64
+
+# Folder names (and .jsonl stems) taken as languages: the configured codes
+# plus the source language
+LANGUAGE_CODES = frozenset(
+    code.strip() for code in settings.LANGUAGE_CODES.split(',') if code.strip()
+) | {settings.SOURCE_LANGUAGE}
+
+# Most recent object latencies kept for the p50/p95 in progress snapshots
+LATENCY_SAMPLES = 10000
+
+# Seconds between progress lines of a verbose load
+PROGRESS_LOG_INTERVAL = 5
+
+# Timed ingestion stages, in pipeline order
+STAGES = ("list", "fetch", "decode", "prompts", "insert", "commit", "manifest", "aggregates")
+
+# Columns written by the bulk translation writer (COPY column order)
+TRANSLATION_COLUMNS = [
+    'execution_id',
+    'prompt_id',
+    'original_content',
+    'translated_content',
+    'source_language',
+    'target_language',
+    'automated_coherence',
+    'automated_fidelity',
+    'automated_naturalness',
+    'automated_overall',
+    's3_insights_path',
+    's3_automated_qa_path',
+    'source_key',
+]
+
+# Natural key of a loaded translation (see models.Translation.source_key)
+TRANSLATION_KEY_CONSTRAINT = "uq_translations_execution_source_key_target"
+
+# Automated QA scores, as written by parse_scores
+SCORE_COLUMNS = [
+    'automated_coherence',
+    'automated_fidelity',
+    'automated_naturalness',
+    'automated_overall',
+]
+
+# Columns an upsert refreshes when the translation already exists
+UPSERT_UPDATE_COLUMNS = [
+    column for column in TRANSLATION_COLUMNS if column not in ('execution_id', 'source_key', 'target_language')
+]
+
+
+class LoadProgress:
+    """
+    Thread-safe progress of one ingestion run.
+
+    The loader updates it as it goes; the jobs API reads snapshots of it
+    while the load is still running.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.phase = "pending"
+        self.listing_complete = False
+        self.total = 0
+        self.processed = 0
+        self.loaded = 0
+        self.skipped = 0
+        self.errors: List[Tuple[str, str]] = []
+        # Seconds spent per stage (list, fetch, decode, prompts, insert,
+        # commit, manifest); fetch and decode run on several threads, so
+        # they add up the time of every object
+        self.stage_seconds: Dict[str, float] = {}
+        # Event counts (objects_fetched, bytes_fetched, batches_written, ...)
+        self.counters: Dict[str, int] = {}
+        self.latencies: deque = deque(maxlen=LATENCY_SAMPLES)
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def set_phase(self, phase: str):
+        with self._lock:
+            if self.started_at is None:
+                self.started_at = time.time()
+            self.phase = phase
+            if phase in ("done", "failed"):
+                self.finished_at = time.time()
+
+    def mark_listed(self):
+        """The listing finished, so `total` is final"""
+        with self._lock:
+            self.listing_complete = True
+
+    def set_total(self, total: int):
+        with self._lock:
+            self.total = total
+
+    def advance(self, processed: int = 0, loaded: int = 0, skipped: int = 0):
+        with self._lock:
+            self.processed += processed
+            self.loaded += loaded
+            self.skipped += skipped
+
+    def add_error(self, key: str, error: str):
+        with self._lock:
+            self.errors.append((key, error))
+
+    def add_stage_time(self, stage: str, seconds: float):
+        with self._lock:
+            self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+
+    def count(self, counter: str, amount: int = 1):
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def record_object(self, fetched: GetResult):
+        """Account one get_many result: request/decode time, latency and bytes"""
+        with self._lock:
+            self.stage_seconds["fetch"] = self.stage_seconds.get("fetch", 0.0) + fetched.seconds
+            self.stage_seconds["decode"] = self.stage_seconds.get("decode", 0.0) + fetched.decode_seconds
+            self.latencies.append(fetched.seconds)
+            self.counters["objects_fetched"] = self.counters.get("objects_fetched", 0) + 1
+            self.counters["bytes_fetched"] = self.counters.get("bytes_fetched", 0) + fetched.size
+            if fetched.error:
+                self.counters["objects_failed"] = self.counters.get("objects_failed", 0) + 1
+
+    @contextmanager
+    def timed(self, stage: str):
+        """Add the duration of the with-block to `stage`"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_stage_time(stage, time.perf_counter() - start)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            end = self.finished_at or time.time()
+            elapsed = end - self.started_at if self.started_at else 0.0
+            return {
+                "phase": self.phase,
+                "listing_complete": self.listing_complete,
+                "total": self.total,
+                "processed": self.processed,
+                "loaded": self.loaded,
+                "skipped": self.skipped,
+                "error_count": len(self.errors),
+                "errors": [
+                    {"key": key, "error": error}
+                    for key, error in self.errors[:MAX_REPORTED_ERRORS]
+                ],
+                "stage_seconds": {stage: round(seconds, 3) for stage, seconds in self.stage_seconds.items()},
+                "counters": dict(self.counters),
+                "object_latency_ms": latency_percentiles(self.latencies),
+                "bytes_per_second": round(self.counters.get("bytes_fetched", 0) / elapsed) if elapsed > 0 else 0,
+                "elapsed_seconds": round(elapsed, 2),
+                "pairs_per_second": round(self.processed / elapsed, 2) if elapsed > 0 else 0.0,
+            }
+
+    def latency_samples(self) -> List[float]:
+        with self._lock:
+            return list(self.latencies)
+
+    def status_line(self) -> str:
+        """One-line progress summary for periodic logging"""
+        snapshot = self.snapshot()
+        latency = snapshot["object_latency_ms"]
+        return (
+            f"⏳ {snapshot['processed']}/{snapshot['total']} pair(s), "
+            f"{snapshot['pairs_per_second']} pairs/s, "
+            f"{snapshot['bytes_per_second'] / (1024 * 1024):.1f} MiB/s, "
+            f"object p50/p95 {latency['p50']}/{latency['p95']} ms, "
+            f"{snapshot['error_count']} error(s)"
+        )
+
+
+def latency_percentiles(seconds: Iterable[float]) -> Dict[str, float]:
+    """p50/p95/max of latencies given in seconds, in milliseconds"""
+    ordered = sorted(seconds)
+    if not ordered:
+        return {"p50": 0.0, "p95": 0.0, "max": 0.0}
+
+    def percentile(q):
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000, 1)
+
+    return {"p50": percentile(0.5), "p95": percentile(0.95), "max": round(ordered[-1] * 1000, 1)}
+
+
+class MultiLoadProgress:
+    """
+    Progress of several executions loaded together (see load_many_from_s3).
+
+    Holds one LoadProgress per prefix; snapshots add them up and list each
+    execution, so it can stand in for a LoadProgress in the jobs API.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.phase = "pending"
+        self.executions: Dict[str, Tuple[str, LoadProgress]] = {}
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def add(self, prefix: str, execution_id: str) -> LoadProgress:
+        with self._lock:
+            progress = LoadProgress()
+            self.executions[prefix] = (execution_id, progress)
+            return progress
+
+    def set_phase(self, phase: str):
+        with self._lock:
+            if self.started_at is None:
+                self.started_at = time.time()
+            self.phase = phase
+            if phase in ("done", "failed"):
+                self.finished_at = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            executions = [
+                {"prefix": prefix, "execution_id": execution_id, **progress.snapshot()}
+                for prefix, (execution_id, progress) in self.executions.items()
+            ]
+            latencies = [
+                seconds for _, progress in self.executions.values() for seconds in progress.latency_samples()
+            ]
+            end = self.finished_at or time.time()
+            elapsed = end - self.started_at if self.started_at else 0.0
+
+        processed = sum(execution["processed"] for execution in executions)
+        stage_seconds: Dict[str, float] = {}
+        counters: Dict[str, int] = {}
+        for execution in executions:
+            for stage, seconds in execution["stage_seconds"].items():
+                stage_seconds[stage] = round(stage_seconds.get(stage, 0.0) + seconds, 3)
+            for counter, amount in execution["counters"].items():
+                counters[counter] = counters.get(counter, 0) + amount
+
+        return {
+            "phase": self.phase,
+            "listing_complete": all(execution["listing_complete"] for execution in executions),
+            "total": sum(execution["total"] for execution in executions),
+            "processed": processed,
+            "loaded": sum(execution["loaded"] for execution in executions),
+            "skipped": sum(execution["skipped"] for execution in executions),
+            "error_count": sum(execution["error_count"] for execution in executions),
+            "errors": [
+                error for execution in executions for error in execution["errors"]
+            ][:MAX_REPORTED_ERRORS],
+            "stage_seconds": stage_seconds,
+            "counters": counters,
+            "object_latency_ms": latency_percentiles(latencies),
+            "bytes_per_second": round(counters.get("bytes_fetched", 0) / elapsed) if elapsed > 0 else 0,
+            "elapsed_seconds": round(elapsed, 2),
+            "pairs_per_second": round(processed / elapsed, 2) if elapsed > 0 else 0.0,
+            "executions": executions,
+        }
+
+
+class IngestionBudget:
+    """
+    Fetch and DB connection limits shared by executions loaded together.
+
+    At most `fetch_workers` object requests (or shard chunk reads) run at
+    once across all executions. While other executions are waiting, none may
+    hold more than its fair share (fetch_workers / active executions), so a
+    large prefix can't starve small ones; an execution alone may use the
+    whole budget. At most `db_connections` executions write at once.
+    """
+
+    def __init__(self, fetch_workers: int, db_connections: int):
+        self.fetch_workers = max(1, fetch_workers)
+        self._db_slots = threading.BoundedSemaphore(max(1, db_connections))
+        self._condition = threading.Condition()
+        self._in_use: Dict[str, int] = {}
+        self._waiting: Dict[str, int] = {}
+
+    def join(self, owner: str):
+        with self._condition:
+            self._in_use.setdefault(owner, 0)
+            self._waiting.setdefault(owner, 0)
+            self._condition.notify_all()
+
+    def leave(self, owner: str):
+        with self._condition:
+            self._in_use.pop(owner, None)
+            self._waiting.pop(owner, None)
+            self._condition.notify_all()
+
+    def _must_wait(self, owner: str) -> bool:
+        if sum(self._in_use.values()) >= self.fetch_workers:
+            return True
+        fair_share = max(1, self.fetch_workers // max(1, len(self._in_use)))
+        others_waiting = any(count for name, count in self._waiting.items() if name != owner)
+        return self._in_use[owner] >= fair_share and others_waiting
+
+    @contextmanager
+    def fetch_slot(self, owner: str):
+        """Hold one of `owner`'s fetch slots for the with-block"""
+        with self._condition:
+            self._waiting[owner] += 1
+            try:
+                while self._must_wait(owner):
+                    self._condition.wait()
+            finally:
+                self._waiting[owner] -= 1
+            self._in_use[owner] += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_use[owner] -= 1
+                self._condition.notify_all()
+
+    @contextmanager
+    def db_slot(self):
+        """Hold one of the shared DB connections for the with-block"""
+        with self._db_slots:
+            yield
+
+
+def compute_execution_id(prefix: str, description: str) -> str:
+    """Deterministic execution ID from prefix + description"""
+    combined = f"{prefix}|{description}"
+    combined_hash = hashlib.md5(combined.encode()).hexdigest()
+    return str(uuid.UUID(combined_hash))
+
+
+def _quiet(*args, **kwargs):
+    pass
+
+
+def _untimed(stage: str) -> ContextManager:
+    return nullcontext()
+
+
+def _timed_iter(iterable: Iterable, progress: LoadProgress, stage: str) -> Iterator:
+    """Yield from `iterable`, adding the time spent waiting for items to `stage`"""
+    iterator = iter(iterable)
+    while True:
+        start = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            progress.add_stage_time(stage, time.perf_counter() - start)
+            return
+        progress.add_stage_time(stage, time.perf_counter() - start)
+        yield item
+
+
+def extract_text_content(data):
+    """Extract summary and insight texts from JSON"""
+    texts = []
+
+    # Add summary
+    if 'summary' in data:
+        texts.append(data['summary'])
+
+    # Add insight texts
+    for i in range(1, 4):
+        insight_key = f'insight{i}'
+        if insight_key in data and 'text' in data[insight_key]:
+            texts.append(data[insight_key]['text'])
+
+    return '\n\n'.join(texts)
+
+
+def translation_id_from_path(path: str) -> str:
+    """Return the translation ID (file stem) of an object key"""
+    return parse_object_key(path).name
+
+
+def is_language_code(name: str) -> bool:
+    """Whether a folder name or .jsonl stem is one of LANGUAGE_CODES"""
+    return name in LANGUAGE_CODES
+
+
+def check_source_language(source_language: str):
+    """Reject a source language that language folders could never match"""
+    if not is_language_code(source_language):
+        raise ValueError(
+            f"Unknown source language '{source_language}'; add it to LANGUAGE_CODES"
+        )
+
+
+def language_of(key: str) -> Optional[str]:
+    """
+    Language of a per-translation JSON object, i.e. the name of the folder
+    holding it (<prefix>/<language>/<id>.json), or None when the key is not
+    one.
+    """
+    if parse_object_key(key).format != "json":
+        return None
+    parts = key.split('/')
+    if len(parts) >= 2 and is_language_code(parts[-2]):
+        return parts[-2]
+    return None
+
+
+def shard_of(key: str) -> Optional[Tuple[str, Tuple[str, str]]]:
+    """
+    Return (language, shard) of a JSON Lines object (.jsonl/.ndjson, may be
+    compressed), or None when the key is not one. Both layouts are supported:
+
+        <prefix>/en/<shard>.jsonl  and  <prefix>/es/<shard>.jsonl
+        <prefix>/en.jsonl          and  <prefix>/es.jsonl
+
+    The shard identifies the matching objects in the other languages.
+    """
+    object_key = parse_object_key(key)
+    if object_key.format != "jsonl":
+        return None
+
+    parts = key.split('/')
+    stem = object_key.name
+    if len(parts) >= 2 and is_language_code(parts[-2]):
+        return parts[-2], ('/'.join(parts[:-2]), stem)
+    if is_language_code(stem):
+        return stem, ('/'.join(parts[:-1]), "")
+    return None
+
+
+class LanguageJoin:
+    """
+    Streaming hash join of listed objects across languages.
+
+    Objects are added as the listing returns them, with a join key (the
+    translation ID, or the shard location). Each target-language object is
+    paired with the source-language object of the same key as soon as both
+    have been seen, in whatever order the languages are listed. Source
+    objects are kept until the listing ends, since a target language listed
+    later may still need them.
+    """
+
+    def __init__(self, source_language: str):
+        self.source_language = source_language
+        self.sources: Dict[Any, ObjectInfo] = {}
+        # Join key -> target objects listed before their source
+        self.waiting: Dict[Any, List[Tuple[ObjectInfo, str]]] = {}
+        # Objects listed per language
+        self.listed: Dict[str, int] = {}
+
+    def add(self, language: str, key: Any, obj: ObjectInfo) -> List[Tuple[ObjectInfo, ObjectInfo, str]]:
+        """Add a listed object; return the (source, target, target_language) pairs it completes"""
+        self.listed[language] = self.listed.get(language, 0) + 1
+        if language == self.source_language:
+            self.sources[key] = obj
+            return [(obj, target, target_language) for target, target_language in self.waiting.pop(key, [])]
+
+        source = self.sources.get(key)
+        if source is None:
+            self.waiting.setdefault(key, []).append((obj, language))
+            return []
+        return [(source, obj, language)]
+
+    @property
+    def target_languages(self) -> List[str]:
+        return sorted(language for language in self.listed if language != self.source_language)
+
+
+def record_id(record: Dict[str, Any]) -> str:
+    """The translation ID of a JSON Lines record ("id" or "translation_id")"""
+    return str(record.get('id') or record.get('translation_id') or '')
+
+
+def _automated_scores(source_data: Dict[Any, Any], target_data: Dict[Any, Any]) -> Dict[str, Any]:
+    """The automated QA scores of a pair: the source object's, else the target's"""
+    return (
+        source_data.get('automated_scores') or target_data.get('automated_scores') or target_data.get('score') or {}
+    )
+
+
+def parse_pair(source_data: Dict[Any, Any], target_data: Dict[Any, Any]) -> Dict[str, Any]:
+    """Extract the translation fields from a source/target JSON pair"""
+    original_content = (
+        source_data.get('original_content') or source_data.get('original') or extract_text_content(source_data)
+    )
+    translated_content = (
+        target_data.get('translated_content') or target_data.get('translation') or extract_text_content(target_data)
+    )
+    prompt_id_str = source_data.get('prompt_id', 'default')
+    prompt_name = source_data.get('prompt_name', prompt_id_str)
+
+    automated_scores = _automated_scores(source_data, target_data)
+
+    return {
+        'original_content': original_content,
+        'translated_content': translated_content,
+        'prompt_id': prompt_id_str,
+        'prompt_name': prompt_name,
+        'coherence': automated_scores.get('coherence', 0),
+        'fidelity': automated_scores.get('fidelity', 0),
+        'naturalness': automated_scores.get('naturalness', 0),
+        'overall': automated_scores.get('overall', 0),
+    }
+
+
+def parse_scores(source_data: Dict[Any, Any], target_data: Dict[Any, Any]) -> Optional[Dict[str, float]]:
+    """
+    Extract the automated QA scores of a source/target JSON pair, looked up
+    in the same order as parse_pair; None when neither object has any.
+    """
+    scores = _automated_scores(source_data, target_data)
+    if not scores:
+        return None
+    return {
+        'automated_coherence': scores.get('coherence', 0),
+        'automated_fidelity': scores.get('fidelity', 0),
+        'automated_naturalness': scores.get('naturalness', 0),
+        'automated_overall': scores.get('overall', 0),
+    }
+
+
+def fetch_pairs(
+    pairs: Iterable[Tuple[ObjectInfo, ObjectInfo, str]],
+    workers: int,
+    storage=None,
+    progress: Optional[LoadProgress] = None,
+    slot: Optional[Callable[[], ContextManager]] = None,
+    parse: Callable[[Dict[Any, Any], Dict[Any, Any]], Optional[Dict[str, Any]]] = parse_pair
+) -> Iterator[Dict[str, Any]]:
+    """
+    Download and parse (source, target, target_language) object pairs from
+    `storage` (default: s3_service) with `parse` (default: parse_pair; a
+    pair it returns None for is skipped).
+
+    Both objects of every pair go through one storage.get_many() call, so
+    all downloads share the backend's connection pool and at most `workers`
+    requests run at once. The listed ETags let the object cache serve
+    unchanged objects (a source paired with several target languages is
+    requested once per pair). Pairs are yielded as soon as both halves
+    arrived (completion order), each as a dict with the translation ID,
+    target language, both paths and either the parsed fields, a skip reason
+    (missing file) or an error.
+    """
+    storage = storage or s3_service
+    progress = progress or LoadProgress()
+
+    # Object key -> pairs waiting for it, in request order; a source object
+    # can be in flight for several target languages at once
+    waiting: Dict[str, deque] = {}
+
+    def objects():
+        for pair in pairs:
+            source, target, _ = pair
+            waiting.setdefault(source.key, deque()).append(pair)
+            waiting.setdefault(target.key, deque()).append(pair)
+            yield source
+            yield target
+
+    halves: Dict[Tuple[str, str], Any] = {}
+
+    for fetched in storage.get_many(objects(), max_workers=workers, slot=slot):
+        progress.record_object(fetched)
+        pending = waiting[fetched.key]
+        pair_objects = pending.popleft()
+        if not pending:
+            del waiting[fetched.key]
+
+        source_info, target_info, target_language = pair_objects
+        pair_key = (source_info.key, target_info.key)
+        other = halves.pop(pair_key, None)
+        if other is None:
+            halves[pair_key] = fetched
+            continue
+
+        source, target = (fetched, other) if fetched.key == source_info.key else (other, fetched)
+        result = {
+            'translation_id': translation_id_from_path(source_info.key),
+            'target_language': target_language,
+            'source_path': source_info.key,
+            'target_path': target_info.key,
+            'objects': (source_info, target_info),
+            'shard': False,
+            'fields': None,
+            'skipped': None,
+            'error': source.error or target.error,
+        }
+
+        if result['error']:
+            pass
+        elif not source.data:
+            result['skipped'] = "Could not load source file"
+        elif not target.data:
+            result['skipped'] = f"Could not load {target_language} file"
+        else:
+            try:
+                with progress.timed("decode"):
+                    result['fields'] = parse(source.data, target.data)
+                if result['fields'] is None:
+                    result['skipped'] = "Nothing to load"
+            except Exception as e:
+                result['error'] = str(e)
+
+        yield result
+
+
+def _spill_dumps(record: Dict[str, Any]) -> bytes:
+    """One-line JSON for the shard join partition files"""
+    return json.dumps(record, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _spilled_records(path: str) -> Iterator[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return
+    with open(path, 'rb') as f:
+        for line in f:
+            yield json_loads(line)
+
+
+def _partition_of(translation_id: str) -> int:
+    return zlib.crc32(translation_id.encode('utf-8')) % SHARD_JOIN_PARTITIONS
+
+
+def _read_shard(
+    source: ObjectInfo,
+    target: ObjectInfo,
+    target_language: str,
+    storage,
+    progress: LoadProgress,
+    emit,
+    stop: Optional[threading.Event] = None,
+    parse: Callable[[Dict[Any, Any], Dict[Any, Any]], Optional[Dict[str, Any]]] = parse_pair,
+    slot: Optional[Callable[[], ContextManager]] = None
+):
+    """
+    Hash-join one source/target JSON Lines shard pair by record ID and emit
+    a fetch_pairs-style result per source record, parsed with `parse`.
+
+    The target shard is indexed in memory while it holds at most
+    SHARD_INDEX_MAX_RECORDS records and the source one is then streamed
+    line by line. Larger target shards (e.g. a whole language in one
+    `es.jsonl`) are joined on disk instead: both shards are split by hash
+    of the record ID into SHARD_JOIN_PARTITIONS temporary files, which are
+    then joined one partition at a time. Reading stops early once `stop`
+    is set. `slot` is held per chunk read from storage (see iter_jsonl),
+    not for the whole shard.
+    """
+    def check_stop():
+        if stop is not None and stop.is_set():
+            raise InterruptedError("Shard reading stopped")
+
+    def result(translation_id, **values):
+        return {
+            'translation_id': translation_id,
+            'target_language': target_language,
+            'source_path': f"{source.key}#{translation_id}",
+            'target_path': f"{target.key}#{translation_id}",
+            'objects': (source, target),
+            'shard': True,
+            'fields': None,
+            'skipped': None,
+            'error': None,
+            **values,
+        }
+
+    def join(translation_id, record, target_records):
+        target_record = target_records.pop(translation_id, None)
+        if target_record is None:
+            emit(result(translation_id, skipped=f"No {target_language} record"))
+            return
+        try:
+            with progress.timed("decode"):
+                fields = parse(record, target_record)
+        except Exception as e:
+            emit(result(translation_id, error=str(e)))
+            return
+        if fields is None:
+            emit(result(translation_id, skipped="Nothing to load"))
+            return
+        emit(result(translation_id, fields=fields))
+
+    def source_records():
+        """(translation_id, record) of the source shard; records without an id are reported"""
+        for line_number, record in enumerate(_timed_iter(storage.iter_jsonl(source.key, slot=slot), progress, "fetch"), 1):
+            check_stop()
+            translation_id = record_id(record)
+            if translation_id:
+                yield translation_id, record
+            else:
+                emit(result(f"line{line_number}", error=f"Record at line {line_number} has no id/translation_id"))
+        progress.count("objects_fetched")
+        progress.count("bytes_fetched", source.size or 0)
+
+    with tempfile.TemporaryDirectory(prefix="shard-join-") as spill_dir:
+        def partition_path(side, partition):
+            return os.path.join(spill_dir, f"{side}-{partition}.jsonl")
+
+        def spill(side, records):
+            files = {}
+            try:
+                for translation_id, record in records:
+                    partition = _partition_of(translation_id)
+                    if partition not in files:
+                        files[partition] = open(partition_path(side, partition), 'ab')
+                    files[partition].write(_spill_dumps(record))
+                    files[partition].write(b'\n')
+            finally:
+                for f in files.values():
+                    f.close()
+
+        def target_shard_records():
+            for record in _timed_iter(storage.iter_jsonl(target.key, slot=slot), progress, "fetch"):
+                check_stop()
+                translation_id = record_id(record)
+                if translation_id:
+                    yield translation_id, record
+
+        records = target_shard_records()
+        target_records = {}
+        spilled = False
+        for translation_id, record in records:
+            target_records[translation_id] = record
+            if len(target_records) > SHARD_INDEX_MAX_RECORDS:
+                # Too large to index: move what was read and the rest to disk
+                spill("target", chain(target_records.items(), records))
+                target_records = {}
+                spilled = True
+                break
+        progress.count("objects_fetched")
+        progress.count("bytes_fetched", target.size or 0)
+
+        if not spilled:
+            for translation_id, record in source_records():
+                join(translation_id, record, target_records)
+            return
+
+        spill("source", source_records())
+        for partition in range(SHARD_JOIN_PARTITIONS):
+            check_stop()
+            target_records = {
+                record_id(record): record for record in _spilled_records(partition_path("target", partition))
+            }
+            for record in _spilled_records(partition_path("source", partition)):
+                check_stop()
+                join(record_id(record), record, target_records)
+
+
+def fetch_shards(
+    shard_pairs: Iterable[Tuple[ObjectInfo, ObjectInfo, str]],
+    workers: int,
+    storage=None,
+    progress: Optional[LoadProgress] = None,
+    slot: Optional[Callable[[], ContextManager]] = None,
+    parse: Callable[[Dict[Any, Any], Dict[Any, Any]], Optional[Dict[str, Any]]] = parse_pair
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the records of (source, target, target_language) JSON Lines
+    shard pairs, parsed with `parse` as in fetch_pairs.
+
+    Up to `workers` shard pairs are read at once, each by one thread
+    holding `slot` (if given) around every chunk it reads, and their records are
+    yielded as fetch_pairs-style results (paths are "<shard key>#<id>"). A
+    bounded queue lets the DB writer apply back-pressure. A shard pair that
+    can't be read yields one result with `error` set and the source shard
+    key as its translation ID.
+    """
+    storage = storage or s3_service
+    progress = progress or LoadProgress()
+    shard_pairs = list(shard_pairs)
+    if not shard_pairs:
+        return
+
+    results: queue.Queue = queue.Queue(maxsize=SHARD_QUEUE_SIZE)
+    stop = threading.Event()
+    finished = object()
+
+    def emit(item):
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+        raise InterruptedError("Shard reading stopped")
+
+    def read(source, target, target_language):
+        try:
+            _read_shard(source, target, target_language, storage, progress, emit, stop, parse, slot)
+        except InterruptedError:
+            return
+        except Exception as e:
+            emit({
+                'translation_id': source.key,
+                'target_language': target_language,
+                'source_path': source.key,
+                'target_path': target.key,
+                'objects': (source, target),
+                'shard': True,
+                'fields': None,
+                'skipped': None,
+                'error': f"Could not read shard: {e}",
+            })
+        finally:
+            results.put(finished)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(shard_pairs))), thread_name_prefix="shard-read") as executor:
+        try:
+            for source, target, target_language in shard_pairs:
+                executor.submit(read, source, target, target_language)
+
+            remaining = len(shard_pairs)
+            while remaining:
+                item = results.get()
+                if item is finished:
+                    remaining -= 1
+                    continue
+                yield item
+        finally:
+            # The consumer stopped early: unblock and stop the running
+            # readers, and drop the shard pairs not started yet
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            while True:
+                try:
+                    results.get_nowait()
+                except queue.Empty:
+                    break
+
+
+class PromptCache:
+    """
+    In-memory map of prompt_id -> prompts.id for loaders.
+
+    All prompts are read once up front; prompts that are still missing are
+    created in a single INSERT ... ON CONFLICT DO NOTHING, so concurrent
+    loaders never race on the unique prompts.prompt_id constraint.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.ids: Dict[str, int] = {
+            prompt_id: id_ for prompt_id, id_ in db.query(models.Prompt.prompt_id, models.Prompt.id)
+        }
+        self.created = set()
+
+    def resolve(self, prompts: Dict[str, Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Return prompts.id for every prompt_id in `prompts`, creating the
+        missing ones. `prompts` maps prompt_id -> {"name": ..., "description": ...}.
+        """
+        missing = {prompt_id: data for prompt_id, data in prompts.items() if prompt_id not in self.ids}
+
+        if missing:
+            stmt = pg_insert(models.Prompt).values([
+                {"prompt_id": prompt_id, "name": data["name"], "description": data.get("description")}
+                for prompt_id, data in missing.items()
+            ]).on_conflict_do_nothing(
+                index_elements=[models.Prompt.prompt_id]
+            ).returning(models.Prompt.prompt_id, models.Prompt.id)
+
+            for prompt_id, id_ in self.db.execute(stmt):
+                self.ids[prompt_id] = id_
+                self.created.add(prompt_id)
+
+            # Rows skipped by ON CONFLICT were created by another loader
+            remaining = [prompt_id for prompt_id in missing if prompt_id not in self.ids]
+            if remaining:
+                for prompt_id, id_ in self.db.query(models.Prompt.prompt_id, models.Prompt.id).filter(
+                    models.Prompt.prompt_id.in_(remaining)
+                ):
+                    self.ids[prompt_id] = id_
+
+            self.db.commit()
+
+        return {prompt_id: self.ids[prompt_id] for prompt_id in prompts}
+
+
+def _copy_value(value) -> str:
+    """Encode a value for COPY ... FROM STDIN in text format"""
+    if value is None:
+        return '\\N'
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
+
+
+def _supports_copy(db: Session) -> bool:
+    """
+    COPY is only available on PostgreSQL through psycopg2. Behind PgBouncer
+    (DB_PGBOUNCER) the VALUES path is used instead: the COPY path keeps a
+    session temp table on the server connection, which transaction pooling
+    hands to other clients between transactions.
+    """
+    if settings.DB_PGBOUNCER:
+        return False
+    dialect = db.get_bind().dialect
+    return dialect.name == 'postgresql' and dialect.driver == 'psycopg2'
+
+
+def _upsert_returning_clause() -> str:
+    """
+    ON CONFLICT clause for translation upserts. Every written row returns
+    its execution_id and (xmax = 0), true for inserted rows and false for
+    updated ones.
+    """
+    assignments = ', '.join(f"{column} = EXCLUDED.{column}" for column in UPSERT_UPDATE_COLUMNS)
+    return (
+        f"ON CONFLICT ON CONSTRAINT {TRANSLATION_KEY_CONSTRAINT} DO UPDATE SET {assignments} "
+        "RETURNING execution_id, (xmax = 0)"
+    )
+
+
+def _copy_upsert_translations(db: Session, rows: List[Dict[str, Any]]) -> List[Tuple[str, bool]]:
+    """
+    Upsert a batch of translation rows: COPY into a session temp table,
+    then one INSERT ... SELECT ... ON CONFLICT into translations.
+    Returns (execution_id, inserted) of every written row.
+    """
+    columns = ', '.join(TRANSLATION_COLUMNS)
+    connection = db.connection()
+    # Column types only (no id sequence or constraints); emptied on commit
+    connection.execute(text(
+        "CREATE TEMP TABLE IF NOT EXISTS translations_staging ON COMMIT DELETE ROWS "
+        f"AS SELECT {columns} FROM translations WITH NO DATA"
+    ))
+
+    buffer = StringIO()
+    for row in rows:
+        buffer.write('\t'.join(_copy_value(row.get(column)) for column in TRANSLATION_COLUMNS))
+        buffer.write('\n')
+    buffer.seek(0)
+
+    cursor = connection.connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY translations_staging ({columns}) FROM STDIN", buffer)
+    finally:
+        cursor.close()
+
+    result = connection.execute(text(
+        f"INSERT INTO translations ({columns}) SELECT {columns} FROM translations_staging "
+        + _upsert_returning_clause()
+    ))
+    return [(execution_id, inserted) for execution_id, inserted in result]
+
+
+def _values_upsert_translations(db: Session, rows: List[Dict[str, Any]]) -> List[Tuple[str, bool]]:
+    """Upsert a batch of translation rows with one multi-row INSERT; returns (execution_id, inserted) per row"""
+    stmt = pg_insert(models.Translation).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        constraint=TRANSLATION_KEY_CONSTRAINT,
+        set_={column: stmt.excluded[column] for column in UPSERT_UPDATE_COLUMNS}
+    ).returning(models.Translation.execution_id, literal_column("xmax = 0"))
+    return [(execution_id, inserted) for execution_id, inserted in db.execute(stmt)]
+
+
+def ensure_execution(db: Session, execution_id: str, description: str, source_prefix: Optional[str] = None):
+    """
+    Create the executions row translations of `execution_id` reference, if
+    missing, and commit. The ID is derived from prefix + description, so an
+    existing row only gets its source prefix filled in.
+    """
+    stmt = pg_insert(models.Execution).values(
+        id=execution_id, description=description, source_prefix=source_prefix
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['id'],
+        set_={"source_prefix": func.coalesce(models.Execution.source_prefix, stmt.excluded.source_prefix)}
+    )
+    db.execute(stmt)
+    db.commit()
+
+
+def _count_translations(db: Session, written: List[Tuple[str, bool]]):
+    """
+    Add the newly inserted rows to their executions' translation_count,
+    from the (execution_id, inserted) rows an upsert returned (RETURNING
+    order is not the input order)
+    """
+    inserted = Counter()
+    for execution_id, flag in written:
+        inserted[execution_id] += 1 if flag else 0
+
+    for execution_id, count in inserted.items():
+        db.execute(
+            update(models.Execution)
+            .where(models.Execution.id == execution_id)
+            .values(translation_count=models.Execution.translation_count + count, last_loaded_at=func.now())
+        )
+
+
+def upsert_translations(
+    db: Session,
+    rows: List[Tuple[str, Dict[str, Any]]],
+    use_copy: bool = True,
+    progress: Optional[LoadProgress] = None
+) -> Tuple[int, int, List[Tuple[str, str]]]:
+    """
+    Insert or update a batch of translations, keyed by (execution_id,
+    source_key, target_language), and commit it as one transaction. Loading the same objects
+    again updates their rows in place, so an interrupted load can simply
+    be run again.
+
+    `rows` is a list of (label, column values) tuples; the label is only used
+    for error reporting. The batch is written with COPY (through a staging
+    table) when available and with a multi-row INSERT otherwise. If the
+    batch fails, it is retried row by row so a single bad record only loses
+    itself. The executions' translation_count and last_loaded_at are
+    updated in the same transaction (see ensure_execution). Statement and
+    commit time go to the insert/commit stages of `progress`, if given.
+
+    Returns (inserted_count, updated_count, [(label, error), ...]).
+    """
+    if not rows:
+        return 0, 0, []
+
+    values = [row for _, row in rows]
+    timed = progress.timed if progress else _untimed
+
+    try:
+        with timed("insert"):
+            if use_copy and _supports_copy(db):
+                written = _copy_upsert_translations(db, values)
+            else:
+                written = _values_upsert_translations(db, values)
+            _count_translations(db, written)
+        with timed("commit"):
+            db.commit()
+        inserted = sum(1 for _, flag in written if flag)
+        return inserted, len(written) - inserted, []
+    except Exception:
+        db.rollback()
+
+    # Fallback: one transaction per row
+    inserted = 0
+    updated = 0
+    errors = []
+    for label, row in rows:
+        try:
+            with timed("insert"):
+                written = _values_upsert_translations(db, [row])
+                _count_translations(db, written)
+            _, flag = written[0]
+            with timed("commit"):
+                db.commit()
+            if flag:
+                inserted += 1
+            else:
+                updated += 1
+        except Exception as e:
+            db.rollback()
+            errors.append((label, str(e)))
+
+    return inserted, updated, errors
+
+
+def _copy_update_scores(db: Session, execution_id: str, rows: List[Dict[str, Any]]) -> int:
+    """COPY score rows into a session temp table and join it onto translations"""
+    staging_columns = ['source_key', 'target_language'] + SCORE_COLUMNS
+    connection = db.connection()
+    connection.execute(text(
+        "CREATE TEMP TABLE IF NOT EXISTS score_staging ON COMMIT DELETE ROWS "
+        f"AS SELECT {', '.join(staging_columns)} FROM translations WITH NO DATA"
+    ))
+
+    buffer = StringIO()
+    for row in rows:
+        buffer.write('\t'.join(_copy_value(row.get(name)) for name in staging_columns))
+        buffer.write('\n')
+    buffer.seek(0)
+
+    cursor = connection.connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY score_staging ({', '.join(staging_columns)}) FROM STDIN", buffer)
+    finally:
+        cursor.close()
+
+    assignments = ', '.join(f"{name} = s.{name}" for name in SCORE_COLUMNS)
+    result = connection.execute(text(
+        f"UPDATE translations t SET {assignments} FROM score_staging s "
+        "WHERE t.execution_id = :execution_id AND t.source_key = s.source_key "
+        "AND t.target_language = s.target_language"
+    ), {"execution_id": execution_id})
+    return result.rowcount
+
+
+def _values_update_scores(db: Session, execution_id: str, rows: List[Dict[str, Any]]) -> int:
+    """UPDATE translations ... FROM (VALUES ...) with the score rows"""
+    scores = values(
+        column('source_key', String),
+        column('target_language', String),
+        *(column(name, Float) for name in SCORE_COLUMNS),
+        name='scores'
+    ).data([
+        (row['source_key'], row['target_language'], *(row[name] for name in SCORE_COLUMNS))
+        for row in rows
+    ])
+    stmt = update(models.Translation).where(
+        models.Translation.execution_id == execution_id,
+        models.Translation.source_key == scores.c.source_key,
+        models.Translation.target_language == scores.c.target_language
+    ).values(
+        {name: scores.c[name] for name in SCORE_COLUMNS}
+    ).execution_options(synchronize_session=False)
+    return db.execute(stmt).rowcount
+
+
+def update_scores(
+    db: Session,
+    execution_id: str,
+    rows: List[Dict[str, Any]],
+    use_copy: bool = True,
+    progress: Optional[LoadProgress] = None
+) -> int:
+    """
+    Apply automated scores to an execution's translations in one statement
+    and commit. `rows` hold source_key and target_language plus the
+    SCORE_COLUMNS; keys without a translation are ignored. Statement and commit time go to the
+    insert/commit stages of `progress`, if given. Returns the number of
+    translations updated.
+    """
+    if not rows:
+        return 0
+
+    timed = progress.timed if progress else _untimed
+    try:
+        with timed("insert"):
+            if use_copy and _supports_copy(db):
+                updated = _copy_update_scores(db, execution_id, rows)
+            else:
+                updated = _values_update_scores(db, execution_id, rows)
+        with timed("commit"):
+            db.commit()
+        return updated
+    except Exception:
+        db.rollback()
+        raise
+
+
+def load_manifest(db: Session, execution_id: str) -> Dict[str, Tuple[Optional[str], Optional[int]]]:
+    """Return {object_key: (etag, size)} of everything loaded for an execution"""
+    return {
+        key: (etag, size)
+        for key, etag, size in db.query(
+            models.S3ObjectManifest.object_key,
+            models.S3ObjectManifest.etag,
+            models.S3ObjectManifest.size
+        ).filter(models.S3ObjectManifest.execution_id == execution_id)
+    }
+
+
+def record_manifest(db: Session, execution_id: str, objects: List[ObjectInfo]):
+    """
+    Upsert the key, ETag and size of loaded objects into the manifest.
+    An object may be listed more than once (a source paired with several
+    target languages); it is written once.
+    """
+    if not objects:
+        return
+
+    unique = {info.key: info for info in objects}
+    stmt = pg_insert(models.S3ObjectManifest).values([
+        {"execution_id": execution_id, "object_key": info.key, "etag": info.etag, "size": info.size}
+        for info in unique.values()
+    ])
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_s3_object_manifest_execution_key",
+        set_={"etag": stmt.excluded.etag, "size": stmt.excluded.size, "loaded_at": func.now()}
+    )
+    db.execute(stmt)
+    db.commit()
+
+
+def _is_unchanged(manifest: Dict[str, Tuple[Optional[str], Optional[int]]], info: ObjectInfo) -> bool:
+    return manifest.get(info.key) == (info.etag, info.size)
+
+
+def _refresh_after_failure(db: Session, execution_id: str):
+    """
+    Recompute the report groups of a load that failed after committing some
+    batches, so reports and later score deltas start from the rows written
+    """
+    try:
+        refresh_report_aggregates(db, execution_id)
+    except Exception as e:
+        db.rollback()
+        print(f"  ⚠️  Could not refresh the report aggregates of {execution_id}: {e}")
+
+
+def load_from_s3(
+    prefix: str,
+    description: str,
+    workers: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    incremental: bool = False,
+    progress: Optional[LoadProgress] = None,
+    verbose: bool = False,
+    storage=None,
+    budget: Optional[IngestionBudget] = None,
+    source_language: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Load all translations from S3 with given prefix and description.
+
+    Every language folder under the prefix is discovered in the same
+    listing pass: `source_language` (default SOURCE_LANGUAGE) holds the
+    originals and every other language folder is a translation target, so
+    a multilingual execution loads one row per source -> target pair in a
+    single run.
+
+    Translations are upserted by (execution_id, source_key,
+    target_language), so running a load again (e.g. after a crash) resumes
+    it without duplicates, updating rows that were already written. Every
+    loaded object's key, ETag and size is recorded in the execution's
+    manifest; with `incremental`, only pairs whose source or target object
+    is new or changed since the manifest was written are fetched.
+
+    Objects are hash-joined while the listing is still streaming (see
+    LanguageJoin), so fetching starts with the first complete pair;
+    `progress.total` keeps growing until the listing completes. Besides one JSON object per translation,
+    the prefix may hold JSON Lines shards (see shard_of) whose records are
+    streamed after the per-file pairs; a changed shard is reloaded whole.
+    Progress, per-stage timings and counters are reported through
+    `progress` (phases: loading, done, failed). With `verbose`, a progress
+    line is printed every PROGRESS_LOG_INTERVAL seconds, plus errors.
+    Objects are read from `storage` (default: the configured s3_service).
+    With a shared `budget`, fetches and DB writes count against it (see
+    load_many_from_s3). Returns a summary dict with the execution ID and
+    counters.
+    """
+    log = print if verbose else _quiet
+    progress = progress or LoadProgress()
+    storage = storage or s3_service
+    db = SessionLocal()
+
+    # Remove trailing slash for consistency
+    prefix = prefix.strip().rstrip('/')
+    source_language = source_language or settings.SOURCE_LANGUAGE
+    check_source_language(source_language)
+    execution_id = compute_execution_id(prefix, description)
+    fetch_slot = partial(budget.fetch_slot, execution_id) if budget else None
+    db_slot = budget.db_slot if budget else nullcontext
+    if budget:
+        budget.join(execution_id)
+    result = {
+        "execution_id": execution_id,
+        "translations_loaded": 0,
+        "translations_updated": 0,
+        "prompts_created": 0,
+        "pairs_found": 0,
+        "pairs_unchanged": 0,
+        "pairs_skipped": 0,
+        "pairs_failed": 0,
+        "shards_found": 0,
+        "shards_unchanged": 0,
+        "source_language": source_language,
+        "target_languages": [],
+    }
+
+    try:
+        log(f"\n📋 Execution ID: {execution_id}")
+        log("   (generated from prefix + description hash)")
+
+        # Stream the listing: pairs are fetched while listing continues
+        progress.set_phase("loading")
+        log(f"\n🔍 Scanning S3 for prefix: {prefix}")
+        with db_slot():
+            manifest = load_manifest(db, execution_id) if incremental else {}
+            prompt_cache = PromptCache(db)
+            # Return the connection until the first batch is written
+            db.commit()
+        files = LanguageJoin(source_language)
+        shards = LanguageJoin(source_language)
+        shard_pairs = []
+
+        def stream_pairs():
+            """
+            Hash-join the listed objects across languages and yield each
+            (source, target, target_language) pair as soon as both objects
+            have been seen. JSON Lines shards are joined the same way and
+            collected in shard_pairs. In incremental mode only pairs with a
+            new or changed object are kept.
+            """
+            for obj in _timed_iter(storage.iter_objects(prefix=prefix), progress, "list"):
+                shard = shard_of(obj.key)
+                if shard:
+                    for source, target, target_language in shards.add(*shard, obj):
+                        if incremental and _is_unchanged(manifest, source) and _is_unchanged(manifest, target):
+                            result["shards_unchanged"] += 1
+                        else:
+                            shard_pairs.append((source, target, target_language))
+                            result["shards_found"] += 1
+                    continue
+
+                language = language_of(obj.key)
+                if language is None:
+                    continue
+
+                for source, target, target_language in files.add(language, translation_id_from_path(obj.key), obj):
+                    if incremental and _is_unchanged(manifest, source) and _is_unchanged(manifest, target):
+                        result["pairs_unchanged"] += 1
+                        continue
+
+                    result["pairs_found"] += 1
+                    progress.set_total(result["pairs_found"])
+                    yield source, target, target_language
+
+            progress.mark_listed()
+            result["target_languages"] = sorted(set(files.target_languages) | set(shards.target_languages))
+            listed = ", ".join(f"{count} {language}" for language, count in sorted(files.listed.items()))
+            log(f"\n✓ Listing complete: {listed or 'no'} file(s)")
+            log(f"✓ Found {result['pairs_found'] + result['pairs_unchanged']} complete translation pairs "
+                f"({source_language} -> {', '.join(result['target_languages']) or 'no target language'})")
+            if incremental:
+                log(f"✓ {result['pairs_unchanged']} unchanged since the last sync, {result['pairs_found']} to load")
+            if shard_pairs or result["shards_unchanged"]:
+                log(f"✓ Found {len(shard_pairs) + result['shards_unchanged']} JSON Lines shard pair(s), "
+                    f"{len(shard_pairs)} to load")
+
+        workers = workers or settings.S3_LOAD_WORKERS
+        batch_size = max(1, batch_size or settings.S3_LOAD_BATCH_SIZE)
+        log(f"🚀 Fetching with {workers} worker(s), writing in batches of {batch_size}\n")
+
+        batch = []
+        # (source, target) shard keys with a failed record: left out of the
+        # manifest so the next incremental sync reloads them
+        failed_shards = set()
+
+        def record_error(translation_id, error, pair=None):
+            result["pairs_failed"] += 1
+            progress.add_error(translation_id, error)
+            if pair and pair['shard']:
+                failed_shards.add((pair['objects'][0].key, pair['objects'][1].key))
+
+        # The executions row is only created once there is a batch to write,
+        # so a prefix without pairs doesn't leave an empty execution behind
+        execution_created = False
+
+        def flush_batch():
+            nonlocal execution_created
+            if not batch:
+                return
+
+            if not execution_created:
+                ensure_execution(db, execution_id, description, prefix)
+                execution_created = True
+
+            # Resolve (and create in one statement) every prompt used by this batch
+            batch_prompts = {}
+            for pair, _ in batch:
+                fields = pair['fields']
+                batch_prompts.setdefault(fields['prompt_id'], {
+                    "name": fields['prompt_name'],
+                    "description": f"Auto-created from S3 import: {prefix}"
+                })
+            already_created = set(prompt_cache.created)
+            try:
+                with progress.timed("prompts"):
+                    prompt_ids = prompt_cache.resolve(batch_prompts)
+            except Exception as e:
+                db.rollback()
+                for pair, _ in batch:
+                    log(f"  ❌ Error resolving prompt for {pair['label']}: {e}")
+                    record_error(pair['label'], str(e), pair)
+                progress.advance(processed=len(batch))
+                batch.clear()
+                return
+            for prompt_id_str in prompt_cache.created - already_created:
+                log(f"  ✓ Created prompt: {batch_prompts[prompt_id_str]['name']}")
+
+            rows = []
+            for pair, row in batch:
+                row['prompt_id'] = prompt_ids[pair['fields']['prompt_id']]
+                rows.append((pair['label'], row))
+
+            # Rows that already exist (resumed or changed pairs) are updated in place
+            inserted, updated, batch_errors = upsert_translations(
+                db, rows, use_copy=settings.S3_LOAD_USE_COPY, progress=progress
+            )
+            progress.count("batches_written")
+            progress.count("rows_written", inserted + updated)
+            result["translations_loaded"] += inserted
+            result["translations_updated"] += updated
+            failed = dict(batch_errors)
+            for pair, _ in batch:
+                if pair['label'] in failed:
+                    log(f"  ❌ Error inserting {pair['label']}: {failed[pair['label']]}")
+                    record_error(pair['label'], failed[pair['label']], pair)
+
+            # Remember what was loaded so the next incremental sync can skip
+            # it (shards are recorded once all their records are in)
+            loaded_objects = []
+            for pair, _ in batch:
+                if pair['label'] not in failed and not pair['shard']:
+                    loaded_objects.extend(pair['objects'])
+            try:
+                with progress.timed("manifest"):
+                    record_manifest(db, execution_id, loaded_objects)
+            except Exception as e:
+                db.rollback()
+                log(f"  ⚠️  Could not update the S3 manifest: {e}")
+
+            progress.advance(processed=len(batch), loaded=inserted + updated)
+            batch.clear()
+
+        fetched = chain(
+            fetch_pairs(stream_pairs(), workers, storage=storage, progress=progress, slot=fetch_slot),
+            # Runs once the listing is complete and shard_pairs is final
+            fetch_shards(shard_pairs, workers, storage=storage, progress=progress, slot=fetch_slot)
+        )
+        next_report = time.monotonic() + PROGRESS_LOG_INTERVAL
+        for pair in fetched:
+            if time.monotonic() >= next_report:
+                log(progress.status_line())
+                next_report = time.monotonic() + PROGRESS_LOG_INTERVAL
+
+            translation_id = pair['translation_id']
+            # Errors are reported per translation and target language
+            pair['label'] = f"{translation_id} ({pair['target_language']})"
+            if pair['shard']:
+                # Shard records are only counted once read
+                result["pairs_found"] += 1
+                progress.set_total(result["pairs_found"])
+
+            if pair['skipped']:
+                log(f"  ⚠️  {pair['label']}: {pair['skipped']}, skipping...")
+                result["pairs_skipped"] += 1
+                progress.advance(processed=1, skipped=1)
+                continue
+
+            if pair['error']:
+                log(f"  ❌ Error fetching {pair['source_path']}: {pair['error']}")
+                record_error(pair['label'], pair['error'], pair)
+                progress.advance(processed=1)
+                continue
+
+            fields = pair['fields']
+            if not (fields['coherence'] or fields['fidelity'] or fields['naturalness']):
+                progress.count("pairs_without_scores")
+
+            batch.append((pair, {
+                'execution_id': execution_id,
+                'original_content': fields['original_content'],
+                'translated_content': fields['translated_content'],
+                'source_language': source_language,
+                'target_language': pair['target_language'],
+                'automated_coherence': fields['coherence'],
+                'automated_fidelity': fields['fidelity'],
+                'automated_naturalness': fields['naturalness'],
+                'automated_overall': fields['overall'],
+                's3_insights_path': pair['source_path'],
+                's3_automated_qa_path': pair['target_path'],
+                'source_key': translation_id,
+            }))
+
+            if len(batch) >= batch_size:
+                with db_slot():
+                    flush_batch()
+
+        with db_slot():
+            flush_batch()
+
+            loaded_shards = [
+                (source, target) for source, target, _ in shard_pairs
+                if (source.key, target.key) not in failed_shards
+            ]
+            try:
+                with progress.timed("manifest"):
+                    record_manifest(db, execution_id, [info for objects in loaded_shards for info in objects])
+            except Exception as e:
+                db.rollback()
+                log(f"  ⚠️  Could not update the S3 manifest: {e}")
+
+            # Translations were written in bulk: recompute the report groups
+            with progress.timed("aggregates"):
+                refresh_report_aggregates(db, execution_id)
+
+        if not result["pairs_found"] and (result["pairs_unchanged"] or result["shards_unchanged"]):
+            log("✓ Everything is up to date.")
+        elif not result["pairs_found"]:
+            log("⚠️  No complete translation pairs found in S3.")
+            log("   Make sure you have matching files in:")
+            log(f"   s3://your-bucket/base-path/llm-output/2025/10/latest/{source_language}/*.json")
+            log("   s3://your-bucket/base-path/llm-output/2025/10/latest/<target language>/*.json")
+            log(f"   (or JSON Lines shards: .../latest/{source_language}/<shard>.jsonl and "
+                ".../latest/<target language>/<shard>.jsonl)")
+
+        result["prompts_created"] = len(prompt_cache.created)
+        progress.count("prompts_created", result["prompts_created"])
+        progress.set_phase("done")
+        return result
+
+    except Exception:
+        db.rollback()
+        progress.set_phase("failed")
+        if result["translations_loaded"] or result["translations_updated"]:
+            # The batches committed before the failure stay loaded
+            with db_slot():
+                _refresh_after_failure(db, execution_id)
+        raise
+    finally:
+        db.close()
+        if budget:
+            budget.leave(execution_id)
+
+
+def load_scores_from_s3(
+    prefix: str,
+    description: str,
+    workers: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    progress: Optional[LoadProgress] = None,
+    verbose: bool = False,
+    storage=None,
+    source_language: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Re-import the automated QA scores of an already loaded execution.
+
+    Source and target objects (per-file JSON and JSON Lines shards) are
+    paired as in load_from_s3 and their scores are looked up in the same
+    order as on a full load (see parse_scores). Both objects of every pair
+    are still downloaded in full; only the DB writes are limited to the
+    score columns (no text, prompts or manifest). Scores are applied in
+    batches of S3_SCORES_BATCH_SIZE with one UPDATE ... FROM join on
+    (execution_id, source_key, target_language) each. Pairs
+    without scores are skipped, keeping the stored ones, and pairs without
+    a loaded translation are counted as unmatched. Progress phases and
+    `storage` work as in load_from_s3.
+    """
+    log = print if verbose else _quiet
+    progress = progress or LoadProgress()
+    storage = storage or s3_service
+    db = SessionLocal()
+
+    prefix = prefix.strip().rstrip('/')
+    source_language = source_language or settings.SOURCE_LANGUAGE
+    check_source_language(source_language)
+    execution_id = compute_execution_id(prefix, description)
+    result = {
+        "execution_id": execution_id,
+        "scores_found": 0,
+        "translations_updated": 0,
+        "scores_unmatched": 0,
+        "scores_skipped": 0,
+        "scores_failed": 0,
+    }
+
+    try:
+        log(f"\n📋 Execution ID: {execution_id}")
+        progress.set_phase("loading")
+        log(f"\n🔍 Scanning S3 for score objects under: {prefix}")
+        files = LanguageJoin(source_language)
+        shards = LanguageJoin(source_language)
+        shard_pairs = []
+
+        def score_pairs():
+            """Yield per-file (source, target, target_language) pairs; collect shard pairs in shard_pairs"""
+            for obj in _timed_iter(storage.iter_objects(prefix=prefix), progress, "list"):
+                shard = shard_of(obj.key)
+                if shard:
+                    shard_pairs.extend(shards.add(*shard, obj))
+                    continue
+                language = language_of(obj.key)
+                if language is None:
+                    continue
+                for pair in files.add(language, translation_id_from_path(obj.key), obj):
+                    result["scores_found"] += 1
+                    progress.set_total(result["scores_found"])
+                    yield pair
+            progress.mark_listed()
+            log(f"✓ Listing complete: {result['scores_found']} file pair(s), {len(shard_pairs)} shard pair(s)")
+
+        batch_size = max(1, batch_size or settings.S3_SCORES_BATCH_SIZE)
+        batch = []
+
+        def flush_batch():
+            if not batch:
+                return
+            try:
+                updated = update_scores(
+                    db, execution_id, batch, use_copy=settings.S3_LOAD_USE_COPY, progress=progress
+                )
+            except Exception as e:
+                log(f"  ❌ Error applying {len(batch)} score(s): {e}")
+                result["scores_failed"] += len(batch)
+                progress.add_error(batch[0]['source_key'], f"Batch of {len(batch)} failed: {e}")
+                progress.advance(processed=len(batch))
+                batch.clear()
+                return
+
+            result["translations_updated"] += updated
+            result["scores_unmatched"] += len(batch) - updated
+            progress.count("batches_written")
+            progress.count("rows_written", updated)
+            progress.advance(processed=len(batch), loaded=updated, skipped=len(batch) - updated)
+            batch.clear()
+
+        workers = workers or settings.S3_LOAD_WORKERS
+        fetched = chain(
+            fetch_pairs(score_pairs(), workers, storage=storage, progress=progress, parse=parse_scores),
+            # Runs once the listing is complete and shard_pairs is final
+            fetch_shards(shard_pairs, workers, storage=storage, progress=progress, parse=parse_scores)
+        )
+        next_report = time.monotonic() + PROGRESS_LOG_INTERVAL
+        for pair in fetched:
+            if time.monotonic() >= next_report:
+                log(progress.status_line())
+                next_report = time.monotonic() + PROGRESS_LOG_INTERVAL
+
+            label = f"{pair['translation_id']} ({pair['target_language']})"
+            if pair['shard']:
+                # Shard records are only counted once read
+                result["scores_found"] += 1
+                progress.set_total(result["scores_found"])
+
+            if pair['error']:
+                result["scores_failed"] += 1
+                progress.add_error(label, pair['error'])
+                progress.advance(processed=1)
+                continue
+
+            if pair['skipped']:
+                # No scores (or a missing object): the stored ones are kept
+                result["scores_skipped"] += 1
+                progress.advance(processed=1, skipped=1)
+                continue
+
+            batch.append({
+                'source_key': pair['translation_id'],
+                'target_language': pair['target_language'],
+                **pair['fields'],
+            })
+            if len(batch) >= batch_size:
+                flush_batch()
+
+        flush_batch()
+
+        with progress.timed("aggregates"):
+            refresh_report_aggregates(db, execution_id)
+
+        progress.set_phase("done")
+        return result
+
+    except Exception:
+        db.rollback()
+        progress.set_phase("failed")
+        if result["translations_updated"]:
+            # The batches committed before the failure stay applied
+            _refresh_after_failure(db, execution_id)
+        raise
+    finally:
+        db.close()
+
+
+def language_folders(prefix: str, storage=None) -> List[str]:
+    """Language folders directly under `prefix` (one delimiter listing)"""
+    storage = storage or s3_service
+    folders = (folder.rstrip('/').split('/')[-1] for folder in storage.list_prefixes(prefix))
+    return sorted(folder for folder in folders if is_language_code(folder))
+
+
+def _has_language_folders(prefix: str, storage, source_language: str) -> bool:
+    languages = language_folders(prefix, storage)
+    return source_language in languages and len(languages) > 1
+
+
+def discover_prefixes(parent: str, storage=None, source_language: Optional[str] = None) -> List[str]:
+    """
+    Execution prefixes under `parent`: the parent itself when it holds a
+    source-language folder and at least one target-language folder, plus
+    every direct sub-folder that does (e.g. the per-day folders of
+    .../llm-output/2025/10).
+    """
+    storage = storage or s3_service
+    source_language = source_language or settings.SOURCE_LANGUAGE
+    parent = parent.strip().rstrip('/')
+    prefixes = [parent] if _has_language_folders(parent, storage, source_language) else []
+    for folder in storage.list_prefixes(parent):
+        folder = folder.rstrip('/')
+        if _has_language_folders(folder, storage, source_language):
+            prefixes.append(folder)
+    return prefixes
+
+
+def load_many_from_s3(
+    prefixes: List[str],
+    description: str,
+    fetch_workers: Optional[int] = None,
+    db_connections: Optional[int] = None,
+    incremental: bool = False,
+    progress: Optional[MultiLoadProgress] = None,
+    storage=None,
+    source_language: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Load several prefixes (one execution each) in parallel.
+
+    Up to S3_MULTI_LOAD_EXECUTIONS executions run at once. They share one
+    IngestionBudget: `fetch_workers` concurrent object fetches in total
+    (default INGESTION_FETCH_BUDGET), split fairly between the running
+    executions, and `db_connections` concurrent batch writes (default
+    INGESTION_DB_CONNECTIONS). Each execution's fetch and shard threads
+    are sized to its share of the fetch budget, so the executions together
+    start about `fetch_workers` threads rather than that many each. Each execution is loaded by load_from_s3 and
+    reports to its own entry in `progress`. A failed execution doesn't stop
+    the others. Returns {"executions": [results], "failed": [{prefix, error}]}.
+    """
+    progress = progress or MultiLoadProgress()
+    storage = storage or s3_service
+    budget = IngestionBudget(
+        fetch_workers or settings.INGESTION_FETCH_BUDGET,
+        db_connections or settings.INGESTION_DB_CONNECTIONS
+    )
+    prefixes = list(dict.fromkeys(prefix.strip().rstrip('/') for prefix in prefixes))
+    result = {"executions": [], "failed": []}
+    progress.set_phase("loading")
+
+    executions = max(1, min(settings.S3_MULTI_LOAD_EXECUTIONS, len(prefixes)))
+    # Fetch threads per execution: its share of the budget while all run
+    share = max(1, budget.fetch_workers // executions)
+
+    def load(prefix):
+        execution_progress = progress.add(prefix, compute_execution_id(prefix, description))
+        return load_from_s3(
+            prefix,
+            description,
+            workers=share,
+            incremental=incremental,
+            progress=execution_progress,
+            storage=storage,
+            budget=budget,
+            source_language=source_language
+        )
+
+    with ThreadPoolExecutor(max_workers=executions, thread_name_prefix="multi-load") as executor:
+        futures = [(prefix, executor.submit(load, prefix)) for prefix in prefixes]
+        for prefix, future in futures:
+            try:
+                result["executions"].append({"prefix": prefix, **future.result()})
+            except Exception as e:
+                print(f"Error loading {prefix}: {e}")
+                result["failed"].append({"prefix": prefix, "error": str(e)})
+
+    progress.set_phase("failed" if prefixes and len(result["failed"]) == len(prefixes) else "done")
+    return result
@@ -0,0 +1,137 @@
+"""
+In-process background jobs (S3 ingestion) with pollable status
+"""
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from app.config import get_settings
+from app.ingestion import LoadProgress
+
+settings = get_settings()
+
+
+class Job:
+    """A background job and its progress"""
+
+    def __init__(self, job_type: str, keys: Iterable[str], params: Dict[str, Any], progress=None):
+        self.id = str(uuid.uuid4())
+        self.job_type = job_type
+        # What the job writes to, e.g. the IDs of the executions it loads
+        self.keys = frozenset(keys)
+        self.params = params
+        self.status = "queued"  # queued, running, succeeded, failed
+        # Anything with set_phase() and snapshot(), e.g. MultiLoadProgress
+        self.progress = progress or LoadProgress()
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in ("queued", "running")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "job_type": self.job_type,
+            "status": self.status,
+            "params": self.params,
+            "created_at": self.created_at,
+            "result": self.result,
+            "error": self.error,
+            **self.progress.snapshot(),
+        }
+
+
+class JobConflictError(Exception):
+    """Another job is already active for one of the keys"""
+
+    def __init__(self, job: Job, keys: Iterable[str]):
+        super().__init__(
+            f"A {job.job_type} job is already running for {', '.join(sorted(keys))} (job {job.id})"
+        )
+        self.job = job
+
+
+class JobRegistry:
+    """
+    Runs jobs on a small thread pool and keeps their state in memory.
+
+    State is per process: with several uvicorn workers, poll the worker that
+    accepted the job (or run a single worker for admin traffic).
+    """
+
+    def __init__(self, max_workers: int, max_finished: int = 100):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._max_finished = max_finished
+
+    def submit(
+        self,
+        job_type: str,
+        keys: Iterable[str],
+        params: Dict[str, Any],
+        func: Callable[..., Dict[str, Any]],
+        progress=None
+    ) -> Job:
+        """
+        Queue `func(progress=...)` as a job. `keys` are what the job writes
+        to (e.g. the execution IDs it loads), so two jobs never write to the
+        same execution at once: the active job of the same type and keys is
+        returned instead, and JobConflictError is raised when any other
+        active job (another type, or a multi-prefix load sharing one
+        execution) holds one of the keys. `progress` replaces the job's
+        default LoadProgress.
+        """
+        keys = frozenset(keys)
+        with self._lock:
+            for active in self._active():
+                if active.job_type == job_type and active.keys == keys:
+                    return active
+                if active.keys & keys:
+                    raise JobConflictError(active, active.keys & keys)
+
+            job = Job(job_type, keys, params, progress)
+            self._jobs[job.id] = job
+            self._prune()
+
+        self._executor.submit(self._run, job, func)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+    def _active(self) -> List[Job]:
+        return [job for job in self._jobs.values() if job.is_active]
+
+    def _prune(self):
+        """Drop the oldest finished jobs beyond max_finished"""
+        finished = sorted(
+            (job for job in self._jobs.values() if not job.is_active),
+            key=lambda job: job.created_at
+        )
+        for job in finished[:max(0, len(finished) - self._max_finished)]:
+            del self._jobs[job.id]
+
+    def _run(self, job: Job, func: Callable[..., Dict[str, Any]]):
+        job.status = "running"
+        try:
+            job.result = func(progress=job.progress)
+            job.status = "succeeded"
+        except Exception as e:
+            job.error = str(e)
+            job.status = "failed"
+            job.progress.set_phase("failed")
+            print(f"Job {job.id} ({job.job_type}) failed: {e}")
+
+
+# Global instance
+job_registry = JobRegistry(max_workers=settings.INGESTION_JOB_WORKERS)
@@ -1,12 +1,10 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.database import engine, Base
-from app import models
+from app.database import async_engine
 from app.routers import auth, translations, scores, reports, prompts, admin
 from app.init_db import init_database
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+# The schema is managed by Alembic migrations (`alembic upgrade head`)
 
 app = FastAPI(
     title="Translation QA API",
@@ -38,6 +36,11 @@ async def startup_event():
     init_database()
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    await async_engine.dispose()
+
+
 @app.get("/")
 async def root():
     return {
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Boolean, Text
+from sqlalchemy import Column, Integer, BigInteger, String, Float, ForeignKey, DateTime, Boolean, Text, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -31,12 +31,42 @@ class Prompt(Base):
     translations = relationship("Translation", back_populates="prompt")
 
 
+class Execution(Base):
+    """A loaded run (one S3 prefix + description) and its maintained counters"""
+    __tablename__ = "executions"
+
+    id = Column(String(100), primary_key=True)
+    description = Column(Text)
+    source_prefix = Column(String(1024))
+
+    # Kept up to date by ingestion and the scores API, so listings never
+    # have to aggregate translations
+    translation_count = Column(Integer, nullable=False, default=0, server_default="0")
+    manual_score_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_loaded_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    translations = relationship("Translation", back_populates="execution")
+
+
 class Translation(Base):
     __tablename__ = "translations"
+    __table_args__ = (
+        UniqueConstraint(
+            "execution_id", "source_key", "target_language",
+            name="uq_translations_execution_source_key_target"
+        ),
+        # Listings and reports filter by execution and prompt, or list an
+        # execution in load order
+        Index("ix_translations_execution_prompt", "execution_id", "prompt_id"),
+        Index("ix_translations_execution_created", "execution_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    execution_id = Column(String(100), index=True, nullable=False)
-    execution_description = Column(Text)
+    execution_id = Column(
+        String(100), ForeignKey("executions.id", name="fk_translations_execution_id"), index=True, nullable=False
+    )
     prompt_id = Column(Integer, ForeignKey("prompts.id"), nullable=False)
 
     # Content
@@ -54,19 +84,28 @@ class Translation(Base):
     # S3 references
     s3_insights_path = Column(String(500))
     s3_automated_qa_path = Column(String(500))
+    # Translation ID in the source data (JSON file stem or JSON Lines record
+    # id), shared by the rows of every target language; NULL for
+    # translations not loaded from storage
+    source_key = Column(String(255))
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    execution = relationship("Execution", back_populates="translations")
     prompt = relationship("Prompt", back_populates="translations")
     manual_scores = relationship("ManualScore", back_populates="translation")
 
 
 class ManualScore(Base):
     __tablename__ = "manual_scores"
+    __table_args__ = (
+        # One score per user and translation; also serves the score joins
+        UniqueConstraint("translation_id", "user_id", name="uq_manual_scores_translation_user"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     translation_id = Column(Integer, ForeignKey("translations.id"), nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=False)
 
     # Manual scores
     coherence = Column(Float)
@@ -81,3 +120,66 @@ class ManualScore(Base):
 
     translation = relationship("Translation", back_populates="manual_scores")
     user = relationship("User", back_populates="manual_scores")
+
+
+class S3ObjectManifest(Base):
+    """Objects loaded per execution, used by incremental S3 sync"""
+    __tablename__ = "s3_object_manifest"
+    __table_args__ = (
+        UniqueConstraint("execution_id", "object_key", name="uq_s3_object_manifest_execution_key"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    execution_id = Column(String(100), nullable=False)
+    object_key = Column(String(1024), nullable=False)
+    etag = Column(String(100))
+    size = Column(BigInteger)
+    loaded_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class ReportAggregate(Base):
+    """
+    Sums and counts of every automated and manual metric per (execution,
+    prompt), so reports read one row per group (see app.report_aggregates)
+    """
+    __tablename__ = "report_aggregates"
+
+    execution_id = Column(String(100), ForeignKey("executions.id"), primary_key=True)
+    prompt_id = Column(Integer, ForeignKey("prompts.id"), primary_key=True)
+
+    translation_count = Column(Integer, nullable=False, default=0, server_default="0")
+    # Translations with at least one manual score, and manual score rows
+    reviewed_translation_count = Column(Integer, nullable=False, default=0, server_default="0")
+    manual_score_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Automated scores of all translations
+    automated_coherence_sum = Column(Float, nullable=False, default=0, server_default="0")
+    automated_coherence_count = Column(Integer, nullable=False, default=0, server_default="0")
+    automated_fidelity_sum = Column(Float, nullable=False, default=0, server_default="0")
+    automated_fidelity_count = Column(Integer, nullable=False, default=0, server_default="0")
+    automated_naturalness_sum = Column(Float, nullable=False, default=0, server_default="0")
+    automated_naturalness_count = Column(Integer, nullable=False, default=0, server_default="0")
+    automated_overall_sum = Column(Float, nullable=False, default=0, server_default="0")
+    automated_overall_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Automated scores of the reviewed translations (manual_only reports)
+    reviewed_automated_coherence_sum = Column(Float, nullable=False, default=0, server_default="0")
+    reviewed_automated_coherence_count = Column(Integer, nullable=False, default=0, server_default="0")
+    reviewed_automated_fidelity_sum = Column(Float, nullable=False, default=0, server_default="0")
+    reviewed_automated_fidelity_count = Column(Integer, nullable=False, default=0, server_default="0")
+    reviewed_automated_naturalness_sum = Column(Float, nullable=False, default=0, server_default="0")
+    reviewed_automated_naturalness_count = Column(Integer, nullable=False, default=0, server_default="0")
+    reviewed_automated_overall_sum = Column(Float, nullable=False, default=0, server_default="0")
+    reviewed_automated_overall_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Manual scores
+    manual_coherence_sum = Column(Float, nullable=False, default=0, server_default="0")
+    manual_coherence_count = Column(Integer, nullable=False, default=0, server_default="0")
+    manual_fidelity_sum = Column(Float, nullable=False, default=0, server_default="0")
+    manual_fidelity_count = Column(Integer, nullable=False, default=0, server_default="0")
+    manual_naturalness_sum = Column(Float, nullable=False, default=0, server_default="0")
+    manual_naturalness_count = Column(Integer, nullable=False, default=0, server_default="0")
+    manual_overall_sum = Column(Float, nullable=False, default=0, server_default="0")
+    manual_overall_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    prompt = relationship("Prompt")
@@ -0,0 +1,150 @@
+"""
+On-disk LRU cache for object storage reads
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+from app.config import get_settings
+
+settings = get_settings()
+
+# Bytes a process writes between directory rescans, as a share of max_bytes
+RESCAN_SHARE = 0.1
+
+
+class ObjectCache:
+    """
+    Read-through cache of object bodies, keyed by namespace (backend +
+    bucket), object key and ETag.
+
+    An object that changes gets a new ETag and therefore a new entry, so
+    cached bodies never need invalidation; stale versions simply age out.
+    When the cached bytes exceed `max_bytes`, the least recently used
+    entries are evicted. Entries are plain files, so the cache survives
+    restarts and can be shared by several processes (uvicorn workers, CLI
+    scripts): reads look for the file itself, the LRU order is the files'
+    modification times, and each process re-reads the directory's usage
+    before evicting and after every RESCAN_SHARE of `max_bytes` it writes,
+    so the directory stays within about `max_bytes` plus that share per
+    writing process.
+    """
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # entry name -> size, least recently used first
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._written_since_scan = 0
+        self._load_index()
+
+    @classmethod
+    def from_settings(cls) -> Optional["ObjectCache"]:
+        """The configured cache, or None when STORAGE_CACHE_DIR is empty"""
+        if not settings.STORAGE_CACHE_DIR:
+            return None
+        return cls(settings.STORAGE_CACHE_DIR, settings.STORAGE_CACHE_MAX_BYTES)
+
+    def _load_index(self):
+        """Rebuild the LRU order and usage from the files in the directory"""
+        entries = []
+        for path in self.root.iterdir():
+            if path.name.startswith('.'):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                # Evicted by another process meanwhile
+                continue
+            entries.append((stat.st_mtime_ns, path.name, stat.st_size))
+
+        self._entries.clear()
+        self._total_bytes = 0
+        self._written_since_scan = 0
+        for _, name, size in sorted(entries):
+            self._entries[name] = size
+            self._total_bytes += size
+
+    @staticmethod
+    def _entry_name(namespace: str, key: str, etag: str) -> str:
+        return hashlib.sha256(f"{namespace}\0{key}\0{etag}".encode()).hexdigest()
+
+    def get(self, namespace: str, key: str, etag: str) -> Optional[bytes]:
+        name = self._entry_name(namespace, key, etag)
+        path = self.root / name
+        try:
+            # The file itself, which another process may have written
+            data = path.read_bytes()
+            # The mtime keeps the LRU order across restarts and processes
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self._forget(name)
+                self.misses += 1
+            return None
+
+        with self._lock:
+            if name not in self._entries:
+                self._total_bytes += len(data)
+            self._entries[name] = len(data)
+            self._entries.move_to_end(name)
+            self.hits += 1
+        return data
+
+    def put(self, namespace: str, key: str, etag: str, data: bytes):
+        if len(data) > self.max_bytes:
+            return
+
+        name = self._entry_name(namespace, key, etag)
+        path = self.root / name
+        # Write then rename so concurrent readers never see a partial entry
+        tmp_path = self.root / f".{name}.{threading.get_ident()}.tmp"
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error writing to storage cache: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            self._forget(name)
+            self._entries[name] = len(data)
+            self._total_bytes += len(data)
+            self._written_since_scan += len(data)
+            if self._total_bytes > self.max_bytes or self._written_since_scan >= self.max_bytes * RESCAN_SHARE:
+                # Other processes add and evict entries too: evict from
+                # the directory's actual usage
+                self._load_index()
+            self._evict()
+
+    def _forget(self, name: str):
+        size = self._entries.pop(name, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def _evict(self):
+        while self._total_bytes > self.max_bytes and self._entries:
+            name, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                (self.root / name).unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
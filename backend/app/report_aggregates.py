@@ -0,0 +1,174 @@
+"""
+Per-(execution, prompt) sums and counts behind the reports
+
+The API applies each manual score change and each created translation to
+its group as a delta, in the write's own transaction. Ingestion and score
+re-imports change translations in bulk, so they recompute the execution's
+groups from scratch (refresh_report_aggregates). Both take the execution's
+advisory lock (lock_report_groups) first: a refresh waits for the score
+writes in flight and they wait for it, so none of them is lost.
+"""
+from typing import Any, Dict, Optional
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from app import models
+
+METRICS = ("coherence", "fidelity", "naturalness", "overall")
+
+# Every column besides the (execution_id, prompt_id) key, in insert order
+AGGREGATE_COLUMNS = [
+    "translation_count",
+    "reviewed_translation_count",
+    "manual_score_count",
+] + [
+    f"{kind}_{metric}_{part}"
+    for kind in ("automated", "reviewed_automated", "manual")
+    for metric in METRICS
+    for part in ("sum", "count")
+]
+
+
+def _group_selects() -> str:
+    selects = [
+        "count(*)",
+        "count(s.translation_id)",
+        "COALESCE(sum(s.scores), 0)",
+    ]
+    for metric in METRICS:
+        selects += [f"COALESCE(sum(t.automated_{metric}), 0)", f"count(t.automated_{metric})"]
+    for metric in METRICS:
+        # Automated scores of the translations that have a manual score
+        reviewed = "FILTER (WHERE s.translation_id IS NOT NULL)"
+        selects += [f"COALESCE(sum(t.automated_{metric}) {reviewed}, 0)", f"count(t.automated_{metric}) {reviewed}"]
+    for metric in METRICS:
+        selects += [f"COALESCE(sum(s.{metric}_sum), 0)", f"COALESCE(sum(s.{metric}_count), 0)"]
+    return ",\n            ".join(
+        f"{expression} AS {name}" for expression, name in zip(selects, AGGREGATE_COLUMNS)
+    )
+
+
+_SCORE_TOTALS = ", ".join(
+    f"sum(m.{metric}) AS {metric}_sum, count(m.{metric}) AS {metric}_count" for metric in METRICS
+)
+_COLUMNS = ", ".join(AGGREGATE_COLUMNS)
+_ASSIGNMENTS = ", ".join(f"{name} = EXCLUDED.{name}" for name in AGGREGATE_COLUMNS)
+
+# Recompute the groups of one execution; groups whose translations are all
+# gone are removed
+REFRESH_SQL = text(f"""
+    WITH scored AS (
+        SELECT m.translation_id, count(*) AS scores, {_SCORE_TOTALS}
+        FROM manual_scores m
+        JOIN translations t ON t.id = m.translation_id
+        WHERE t.execution_id = :execution_id
+        GROUP BY m.translation_id
+    ), groups AS (
+        SELECT t.execution_id, t.prompt_id,
+            {_group_selects()}
+        FROM translations t
+        LEFT JOIN scored s ON s.translation_id = t.id
+        WHERE t.execution_id = :execution_id
+        GROUP BY t.execution_id, t.prompt_id
+    ), upserted AS (
+        INSERT INTO report_aggregates (execution_id, prompt_id, {_COLUMNS})
+        SELECT execution_id, prompt_id, {_COLUMNS} FROM groups
+        ON CONFLICT (execution_id, prompt_id) DO UPDATE SET {_ASSIGNMENTS}
+    )
+    DELETE FROM report_aggregates
+    WHERE execution_id = :execution_id AND prompt_id NOT IN (SELECT prompt_id FROM groups)
+""")
+
+# Transaction-level lock on one execution's groups, released on commit
+LOCK_SQL = text("SELECT pg_advisory_xact_lock(hashtext(:execution_id))")
+
+# The execution's counters, from the groups just refreshed
+EXECUTION_COUNTS_SQL = text("""
+    UPDATE executions e
+    SET translation_count = COALESCE(totals.translation_count, 0),
+        manual_score_count = COALESCE(totals.manual_score_count, 0)
+    FROM (
+        SELECT sum(translation_count) AS translation_count, sum(manual_score_count) AS manual_score_count
+        FROM report_aggregates WHERE execution_id = :execution_id
+    ) totals
+    WHERE e.id = :execution_id
+""")
+
+
+def lock_report_groups(execution_id: str):
+    """Statement taking the lock that serializes the writers of an execution's groups"""
+    return LOCK_SQL.bindparams(execution_id=execution_id)
+
+
+def refresh_report_aggregates(db: Session, execution_id: str):
+    """Recompute an execution's report groups and counters, and commit"""
+    params = {"execution_id": execution_id}
+    # Score writes committed while waiting are then part of the snapshot
+    db.execute(lock_report_groups(execution_id))
+    db.execute(REFRESH_SQL, params)
+    db.execute(EXECUTION_COUNTS_SQL, params)
+    db.commit()
+
+
+def score_values(score) -> Dict[str, Optional[float]]:
+    """The metric values of a ManualScore"""
+    return {metric: getattr(score, metric) for metric in METRICS}
+
+
+def manual_score_deltas(
+    old: Optional[Dict[str, Any]],
+    new: Optional[Dict[str, Any]]
+) -> Dict[str, float]:
+    """
+    Column deltas of a manual score going from `old` to `new` metric values;
+    None stands for no score (create / delete)
+    """
+    deltas = {"manual_score_count": (new is not None) - (old is not None)}
+    for metric in METRICS:
+        before = old.get(metric) if old else None
+        after = new.get(metric) if new else None
+        deltas[f"manual_{metric}_sum"] = (after or 0) - (before or 0)
+        deltas[f"manual_{metric}_count"] = (after is not None) - (before is not None)
+    return deltas
+
+
+def translation_deltas(translation) -> Dict[str, float]:
+    """Column deltas of a new translation"""
+    deltas = {"translation_count": 1}
+    for metric in METRICS:
+        value = getattr(translation, f"automated_{metric}")
+        deltas[f"automated_{metric}_sum"] = value or 0
+        deltas[f"automated_{metric}_count"] = int(value is not None)
+    return deltas
+
+
+def reviewed_deltas(translation, sign: int) -> Dict[str, float]:
+    """
+    Column deltas of a translation getting its first manual score (sign 1)
+    or losing its last one (sign -1)
+    """
+    deltas = {"reviewed_translation_count": sign}
+    for metric in METRICS:
+        value = getattr(translation, f"automated_{metric}")
+        deltas[f"reviewed_automated_{metric}_sum"] = sign * (value or 0)
+        deltas[f"reviewed_automated_{metric}_count"] = sign * (value is not None)
+    return deltas
+
+
+def apply_deltas(execution_id: str, prompt_id: int, deltas: Dict[str, float]):
+    """
+    Upsert adding `deltas` to a group's columns (a missing group starts
+    from zero), or None if nothing changes
+    """
+    table = models.ReportAggregate
+    changes = {name: delta for name, delta in deltas.items() if delta}
+    if not changes:
+        return None
+    return pg_insert(table).values(
+        execution_id=execution_id,
+        prompt_id=prompt_id,
+        **{name: changes.get(name, 0) for name in AGGREGATE_COLUMNS}
+    ).on_conflict_do_update(
+        index_elements=["execution_id", "prompt_id"],
+        set_={name: getattr(table, name) + delta for name, delta in changes.items()}
+    )
@@ -1,14 +1,24 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import List
-import uuid
-import hashlib
+from typing import Any, Dict, List, Optional
 import subprocess
-from app.database import get_db
+from app.database import async_engine, engine, get_db, pool_stats
 from app import models
 from app.auth import get_current_active_user
-from app.s3_service import s3_service
+from app.ingestion import (
+    MultiLoadProgress,
+    compute_execution_id,
+    discover_prefixes,
+    language_folders,
+    load_from_s3,
+    load_many_from_s3,
+    load_scores_from_s3,
+    shard_of,
+)
+from app.jobs import JobConflictError, job_registry
+from app.s3_service import parse_object_key, s3_service
 from app.config import get_settings
 
 settings = get_settings()
@@ -18,29 +28,116 @@ router = APIRouter(prefix="/api/admin", tags=["admin"])
 # Pydantic models
 class ValidatePrefixRequest(BaseModel):
     prefix: str
+    source_language: Optional[str] = None  # Defaults to SOURCE_LANGUAGE
 
 
 class ValidatePrefixResponse(BaseModel):
     valid: bool
     message: str
-    has_en_folder: bool = False
-    has_es_folder: bool = False
+    source_language: str = ""
+    has_source_folder: bool = False
+    target_languages: List[str] = []  # Every other language folder found
     sample_files: List[str] = []
+    # Objects in the validation sample; only a lower bound of the prefix's
+    # object count when object_count_capped
+    sample_count: int = 0
+    object_count_capped: bool = False  # True when the prefix holds more objects than were sampled
 
 
 class LoadTranslationsRequest(BaseModel):
     prefix: str
     description: str
+    incremental: bool = False  # Only load objects that are new or changed since the last load
+    scores_only: bool = False  # Only re-import the automated scores of an already loaded execution
+    source_language: Optional[str] = None  # Defaults to SOURCE_LANGUAGE
 
 
 class LoadTranslationsResponse(BaseModel):
     success: bool
     message: str
     execution_id: str = ""
+    job_id: str = ""
     translations_loaded: int = 0
     prompts_created: int = 0
 
 
+class LoadManyRequest(BaseModel):
+    prefixes: List[str]
+    description: str
+    discover: bool = False  # Treat each prefix as a parent and load every sub-folder with language folders
+    incremental: bool = False
+    source_language: Optional[str] = None  # Defaults to SOURCE_LANGUAGE
+
+
+class LoadManyResponse(BaseModel):
+    success: bool
+    message: str
+    job_id: str = ""
+    prefixes: List[str] = []
+    execution_ids: List[str] = []
+
+
+class JobError(BaseModel):
+    key: str
+    error: str
+
+
+class JobStatusResponse(BaseModel):
+    job_id: str
+    job_type: str
+    status: str
+    phase: str
+    params: Dict[str, Any] = {}
+    listing_complete: bool = False
+    total: int = 0
+    processed: int = 0
+    loaded: int = 0
+    skipped: int = 0
+    error_count: int = 0
+    errors: List[JobError] = []
+    elapsed_seconds: float = 0.0
+    pairs_per_second: float = 0.0
+    stage_seconds: Dict[str, float] = {}  # Time per ingestion stage (see app.ingestion.STAGES)
+    counters: Dict[str, int] = {}
+    object_latency_ms: Dict[str, float] = {}  # p50/p95/max of object requests
+    bytes_per_second: int = 0
+    executions: List[Dict[str, Any]] = []  # Per-execution progress of multi-prefix loads
+    created_at: float
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+def inspect_prefix(prefix: str, source_language: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Check a prefix in constant time regardless of its size: one delimiter
+    listing for the language sub-folders plus a capped object sample
+    (which also finds en.jsonl/es.jsonl shards next to the folders).
+    """
+    source_language = source_language or settings.SOURCE_LANGUAGE
+    folders = set(language_folders(prefix))
+    sample_size = settings.S3_VALIDATION_SAMPLE_SIZE
+    sample = [info.key for info in s3_service.iter_objects(prefix=prefix, max_keys=sample_size)]
+    languages = folders | {shard[0] for shard in map(shard_of, sample) if shard}
+
+    return {
+        "source_language": source_language,
+        "has_source": source_language in languages,
+        "target_languages": sorted(languages - {source_language}),
+        "sample": sample,
+        "sample_count": len(sample),
+        "capped": len(sample) >= sample_size,
+    }
+
+
+def missing_folders(inspection: Dict[str, Any]) -> List[str]:
+    missing = []
+    if not inspection["has_source"]:
+        missing.append(f"{inspection['source_language']}/")
+    if not inspection["target_languages"]:
+        missing.append("a target language folder (e.g. es/)")
+    return missing
+
+
 def is_admin(current_user: models.User = Depends(get_current_active_user)):
     """Dependency to verify user is admin"""
     if not current_user.is_admin:
@@ -54,7 +151,8 @@ async def validate_s3_prefix(
     current_user: models.User = Depends(is_admin)
 ):
     """
-    Validate that S3 prefix exists and contains en/ and es/ folders
+    Validate that S3 prefix exists and contains a source-language folder
+    plus at least one target-language folder
     """
     prefix = request.prefix.strip().rstrip('/')
 
@@ -65,8 +163,9 @@ async def validate_s3_prefix(
         )
 
     try:
-        # List objects with the prefix
-        objects = s3_service.list_objects(prefix=prefix)
+        # Storage listings block: run them off the event loop
+        inspection = await run_in_threadpool(inspect_prefix, prefix, request.source_language)
+        objects = inspection["sample"]
 
         if not objects:
             return ValidatePrefixResponse(
@@ -74,34 +173,37 @@ async def validate_s3_prefix(
                 message=f"No objects found at prefix: {prefix}"
             )
 
-        # Check for en/ and es/ folders
-        has_en = any(obj.startswith(f"{prefix}/en/") or obj.startswith("en/") for obj in objects)
-        has_es = any(obj.startswith(f"{prefix}/es/") or obj.startswith("es/") for obj in objects)
-
-        if not has_en or not has_es:
-            missing = []
-            if not has_en:
-                missing.append("en/")
-            if not has_es:
-                missing.append("es/")
+        count = inspection["sample_count"]
+        count_label = f"{count}+" if inspection["capped"] else str(count)
+        missing = missing_folders(inspection)
 
+        if missing:
             return ValidatePrefixResponse(
                 valid=False,
                 message=f"Missing required folders: {', '.join(missing)}",
-                has_en_folder=has_en,
-                has_es_folder=has_es,
-                sample_files=objects[:5]
+                source_language=inspection["source_language"],
+                has_source_folder=inspection["has_source"],
+                target_languages=inspection["target_languages"],
+                sample_files=objects[:5],
+                sample_count=count,
+                object_count_capped=inspection["capped"]
             )
 
         # Get sample files
-        sample_files = [obj for obj in objects[:10] if obj.endswith('.json')]
+        sample_files = [obj for obj in objects[:10] if parse_object_key(obj).format]
 
         return ValidatePrefixResponse(
             valid=True,
-            message=f"Valid prefix with {len(objects)} objects found",
-            has_en_folder=True,
-            has_es_folder=True,
-            sample_files=sample_files
+            message=(
+                f"Valid prefix with {count_label} objects found "
+                f"({inspection['source_language']} -> {', '.join(inspection['target_languages'])})"
+            ),
+            source_language=inspection["source_language"],
+            has_source_folder=True,
+            target_languages=inspection["target_languages"],
+            sample_files=sample_files,
+            sample_count=count,
+            object_count_capped=inspection["capped"]
         )
 
     except Exception as e:
@@ -114,12 +216,12 @@ async def validate_s3_prefix(
 @router.post("/s3/load-translations", response_model=LoadTranslationsResponse)
 async def load_translations_from_s3(
     request: LoadTranslationsRequest,
-    db: Session = Depends(get_db),
     current_user: models.User = Depends(is_admin)
 ):
     """
-    Load translations from S3 prefix into database using load_from_s3.py script
-    Validates prefix first, then executes the script
+    Start loading translations from an S3 prefix as a background job.
+    Validates the prefix first and returns the job ID immediately;
+    poll GET /api/admin/jobs/{job_id} for progress.
     """
     prefix = request.prefix.strip().rstrip('/')
 
@@ -128,101 +230,211 @@ async def load_translations_from_s3(
 
     try:
         # First, validate the prefix
-        objects = s3_service.list_objects(prefix=prefix)
+        source_language = request.source_language or settings.SOURCE_LANGUAGE
+        inspection = await run_in_threadpool(inspect_prefix, prefix, source_language)
 
-        if not objects:
+        if not inspection["sample"]:
             raise HTTPException(
                 status_code=400,
                 detail=f"No objects found at prefix: {prefix}"
             )
 
-        # Check for en/ and es/ folders
-        has_en = any(obj.startswith(f"{prefix}/en/") or obj.startswith("en/") for obj in objects)
-        has_es = any(obj.startswith(f"{prefix}/es/") or obj.startswith("es/") for obj in objects)
-
-        if not has_en or not has_es:
-            missing = []
-            if not has_en:
-                missing.append("en/")
-            if not has_es:
-                missing.append("es/")
+        missing = missing_folders(inspection)
+        if missing:
             raise HTTPException(
                 status_code=400,
                 detail=f"Missing required folders: {', '.join(missing)}"
             )
 
-        # Generate execution_id from prefix + description to check for duplicates
-        combined = f"{prefix}|{request.description}"
-        combined_hash = hashlib.md5(combined.encode()).hexdigest()
-        execution_id = str(uuid.UUID(combined_hash))
-
-        # Check if this execution_id already exists
-        existing_count = db.query(models.Translation).filter(
-            models.Translation.execution_id == execution_id
-        ).count()
-
-        if existing_count > 0:
-            return LoadTranslationsResponse(
-                success=False,
-                message=f"Translations from this prefix already loaded (execution_id: {execution_id})",
-                execution_id=execution_id,
-                translations_loaded=0
+        # Same prefix + description -> same execution; loading it again
+        # upserts, so an interrupted load is resumed without duplicates
+        execution_id = compute_execution_id(prefix, request.description)
+
+        description = request.description
+        incremental = request.incremental
+        params = {
+            "prefix": prefix,
+            "description": description,
+            "incremental": incremental,
+            "source_language": source_language,
+            "target_languages": inspection["target_languages"],
+        }
+        if request.scores_only:
+            job = job_registry.submit(
+                "s3-scores",
+                [execution_id],
+                {**params, "scores_only": True},
+                lambda progress: load_scores_from_s3(
+                    prefix, description, progress=progress, source_language=source_language
+                )
+            )
+        else:
+            job = job_registry.submit(
+                "s3-sync" if incremental else "s3-load",
+                [execution_id],
+                params,
+                lambda progress: load_from_s3(
+                    prefix, description, incremental=incremental, progress=progress,
+                    source_language=source_language
+                )
             )
 
-        # Execute the load_from_s3.py script with the prefix and description
-        result = subprocess.run(
-            ['python', 'load_from_s3.py', prefix, request.description],
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minutes timeout
+        return LoadTranslationsResponse(
+            success=True,
+            message="Load started",
+            execution_id=execution_id,
+            job_id=job.id
         )
 
-        if result.returncode == 0:
-            # Parse output to extract counts
-            output = result.stdout
-
-            # Extract translations_loaded and prompts_created from output
-            translations_loaded = 0
-            prompts_created = 0
-
-            for line in output.split('\n'):
-                if 'Translations loaded:' in line:
-                    translations_loaded = int(line.split(':')[-1].strip())
-                elif 'Prompts created:' in line:
-                    prompts_created = int(line.split(':')[-1].strip())
-
-            return LoadTranslationsResponse(
-                success=True,
-                message=f"Successfully loaded {translations_loaded} translations",
-                execution_id=execution_id,
-                translations_loaded=translations_loaded,
-                prompts_created=prompts_created
-            )
+    except HTTPException:
+        raise
+    except JobConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error loading translations: {str(e)}")
+
+
+@router.post("/s3/load-many", response_model=LoadManyResponse)
+async def load_many_from_s3_prefixes(
+    request: LoadManyRequest,
+    current_user: models.User = Depends(is_admin)
+):
+    """
+    Start loading several S3 prefixes in parallel as one background job.
+    The executions share the INGESTION_FETCH_BUDGET fetches and
+    INGESTION_DB_CONNECTIONS writes; the job status lists each execution.
+    """
+    prefixes = [prefix.strip().rstrip('/') for prefix in request.prefixes if prefix.strip()]
+    if not prefixes:
+        raise HTTPException(status_code=400, detail="At least one prefix is required")
+
+    source_language = request.source_language or settings.SOURCE_LANGUAGE
+    try:
+        if request.discover:
+            discovered = []
+            for parent in prefixes:
+                discovered += await run_in_threadpool(discover_prefixes, parent, source_language=source_language)
+            prefixes = discovered
+            if not prefixes:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"No prefixes with {source_language}/ and target language folders found"
+                )
         else:
-            error_msg = result.stderr or result.stdout
-            raise HTTPException(
-                status_code=500,
-                detail=f"Error loading translations: {error_msg}"
-            )
+            for prefix in prefixes:
+                missing = missing_folders(await run_in_threadpool(inspect_prefix, prefix, source_language))
+                if missing:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Missing required folders in {prefix}: {', '.join(missing)}"
+                    )
+
+        prefixes = list(dict.fromkeys(prefixes))
+        description = request.description
+        incremental = request.incremental
+        execution_ids = [compute_execution_id(prefix, description) for prefix in prefixes]
+        job = job_registry.submit(
+            "s3-load-many",
+            execution_ids,
+            {
+                "prefixes": prefixes,
+                "description": description,
+                "incremental": incremental,
+                "source_language": source_language,
+            },
+            lambda progress: load_many_from_s3(
+                prefixes, description, incremental=incremental, progress=progress,
+                source_language=source_language
+            ),
+            progress=MultiLoadProgress()
+        )
+
+        return LoadManyResponse(
+            success=True,
+            message=f"Load of {len(prefixes)} prefix(es) started",
+            job_id=job.id,
+            prefixes=prefixes,
+            execution_ids=execution_ids
+        )
 
-    except subprocess.TimeoutExpired:
-        raise HTTPException(status_code=408, detail="Operation timed out (max 5 minutes)")
     except HTTPException:
         raise
+    except JobConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading translations: {str(e)}")
 
 
+@router.get("/jobs", response_model=List[JobStatusResponse])
+async def list_jobs(current_user: models.User = Depends(is_admin)):
+    """
+    List recent background jobs of this API worker, newest first
+    """
+    return [job.to_dict() for job in job_registry.list()]
+
+
+@router.get("/jobs/{job_id}", response_model=JobStatusResponse)
+async def get_job(job_id: str, current_user: models.User = Depends(is_admin)):
+    """
+    Get phase, processed/total pairs, throughput and errors of a background job
+    """
+    job = job_registry.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
+
+
 @router.get("/s3/bucket-info")
 async def get_bucket_info(current_user: models.User = Depends(is_admin)):
     """
     Get S3 bucket configuration info
     """
+    backend = settings.STORAGE_BACKEND
+    buckets = {
+        "s3": settings.AWS_S3_BUCKET,
+        "minio": settings.MINIO_BUCKET,
+        "local": settings.LOCAL_STORAGE_ROOT,
+    }
+    return {
+        "storage_backend": backend,
+        "bucket": buckets.get(backend),
+        "region": settings.AWS_REGION if backend == "s3" else None,
+        "prefix": settings.AWS_S3_PREFIX if backend == "s3" else None
+    }
+
+
+class PoolStatsResponse(BaseModel):
+    pool_class: str
+    pid: int
+    size: Optional[int] = None
+    checked_out: Optional[int] = None
+    checked_in: Optional[int] = None
+    overflow: Optional[int] = None
+    max_overflow: Optional[int] = None
+    timeout_seconds: Optional[float] = None
+    checkouts: Optional[int] = None
+    timeouts: Optional[int] = None
+    avg_wait_ms: Optional[float] = None
+    max_wait_ms: Optional[float] = None
+
+
+class DbPoolResponse(BaseModel):
+    pgbouncer: bool
+    api: PoolStatsResponse
+    ingestion: PoolStatsResponse
+
+
+@router.get("/db/pool", response_model=DbPoolResponse)
+async def get_db_pool(current_user: models.User = Depends(is_admin)):
+    """
+    Live connection pool stats of this API worker: the async pool serving
+    API requests and the sync pool used by ingestion jobs. Checkouts that
+    wait or time out mean the pool is too small for the load.
+    """
     return {
-        "storage_backend": settings.STORAGE_BACKEND,
-        "bucket": settings.AWS_S3_BUCKET if settings.STORAGE_BACKEND == "s3" else settings.MINIO_BUCKET,
-        "region": settings.AWS_REGION if settings.STORAGE_BACKEND == "s3" else None,
-        "prefix": settings.AWS_S3_PREFIX if settings.STORAGE_BACKEND == "s3" else None
+        "pgbouncer": settings.DB_PGBOUNCER,
+        "api": pool_stats(async_engine.pool),
+        "ingestion": pool_stats(engine.pool),
     }
 
 
@@ -234,17 +446,19 @@ class CleanTablesResponse(BaseModel):
 
 @router.post("/clean-tables", response_model=CleanTablesResponse)
 async def clean_database_tables(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(is_admin)
 ):
     """
-    Clean all data from prompts, translations, and manual_scores tables.
+    Clean all data from prompts, executions, translations, manual_scores, report_aggregates
+    and s3_object_manifest tables.
     This is a destructive operation that cannot be undone.
     """
     try:
         # Execute the clean_tables.py script with auto-confirmation
         # We use echo "yes" to automatically confirm the operation
-        result = subprocess.run(
+        result = await run_in_threadpool(
+            subprocess.run,
             'echo "yes" | python clean_tables.py',
             shell=True,
             capture_output=True,
@@ -258,7 +472,10 @@ async def clean_database_tables(
                 return CleanTablesResponse(
                     success=True,
                     message="All tables have been cleaned successfully",
-                    tables_cleaned=["manual_scores", "translations", "prompts"]
+                    tables_cleaned=[
+                        "manual_scores", "translations", "report_aggregates", "executions", "prompts",
+                        "s3_object_manifest"
+                    ]
                 )
             else:
                 return CleanTablesResponse(
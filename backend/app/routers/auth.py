@@ -1,7 +1,9 @@
 from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 from app.database import get_db
 from app import models, schemas
 from app.auth import (
@@ -20,9 +22,9 @@ settings = get_settings()
 @router.post("/login", response_model=schemas.Token)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    user = authenticate_user(db, form_data.username, form_data.password)
+    user = await authenticate_user(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -39,18 +41,18 @@ async def login(
 @router.post("/register", response_model=schemas.User)
 async def register(
     user_data: schemas.UserCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_admin_user)
 ):
     # Check if username exists
-    if db.query(models.User).filter(models.User.username == user_data.username).first():
+    if await db.scalar(select(models.User.id).where(models.User.username == user_data.username)):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already registered"
         )
 
     # Check if email exists
-    if db.query(models.User).filter(models.User.email == user_data.email).first():
+    if await db.scalar(select(models.User.id).where(models.User.email == user_data.email)):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
@@ -60,12 +62,12 @@ async def register(
     db_user = models.User(
         username=user_data.username,
         email=user_data.email,
-        hashed_password=get_password_hash(user_data.password),
+        hashed_password=await run_in_threadpool(get_password_hash, user_data.password),
         is_admin=user_data.is_admin
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     return db_user
 
 
@@ -76,8 +78,8 @@ async def get_me(current_user: models.User = Depends(get_current_active_user)):
 
 @router.get("/users", response_model=list[schemas.User])
 async def list_users(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_admin_user)
 ):
-    users = db.query(models.User).all()
-    return users
+    users = await db.scalars(select(models.User))
+    return users.all()
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from app.database import get_db
 from app import models, schemas
@@ -10,20 +11,20 @@ router = APIRouter(prefix="/api/prompts", tags=["prompts"])
 
 @router.get("/", response_model=List[schemas.Prompt])
 async def list_prompts(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
-    prompts = db.query(models.Prompt).all()
-    return prompts
+    prompts = await db.scalars(select(models.Prompt))
+    return prompts.all()
 
 
 @router.get("/{prompt_id}", response_model=schemas.Prompt)
 async def get_prompt(
     prompt_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
-    prompt = db.query(models.Prompt).filter(models.Prompt.id == prompt_id).first()
+    prompt = await db.get(models.Prompt, prompt_id)
     if not prompt:
         raise HTTPException(status_code=404, detail="Prompt not found")
     return prompt
@@ -32,13 +33,13 @@ async def get_prompt(
 @router.post("/", response_model=schemas.Prompt)
 async def create_prompt(
     prompt_data: schemas.PromptCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_admin_user)
 ):
     # Check if prompt_id already exists
-    existing = db.query(models.Prompt).filter(
+    existing = await db.scalar(select(models.Prompt).where(
         models.Prompt.prompt_id == prompt_data.prompt_id
-    ).first()
+    ))
     if existing:
         raise HTTPException(
             status_code=400,
@@ -47,6 +48,6 @@ async def create_prompt(
 
     db_prompt = models.Prompt(**prompt_data.model_dump())
     db.add(db_prompt)
-    db.commit()
-    db.refresh(db_prompt)
+    await db.commit()
+    await db.refresh(db_prompt)
     return db_prompt
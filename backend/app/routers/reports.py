@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import func, case, distinct
+from sqlalchemy import func, case, distinct, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from io import BytesIO
 from openpyxl import Workbook
@@ -10,6 +10,7 @@ from datetime import datetime
 from app.database import get_db
 from app import models, schemas
 from app.auth import get_current_active_user
+from app.report_aggregates import METRICS
 
 router = APIRouter(prefix="/api/reports", tags=["reports"])
 
@@ -19,52 +20,42 @@ async def get_reports(
     execution_id: Optional[str] = None,
     prompt_id: Optional[int] = None,
     manual_only: bool = False,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
-    # Base query grouping by execution_id and prompt_id
-    query = db.query(
-        models.Translation.execution_id,
-        models.Translation.prompt_id,
+    # One precomputed row per (execution_id, prompt_id), see app.report_aggregates
+    aggregates = models.ReportAggregate
+    # manual_only: automated scores of the reviewed translations only
+    automated = "reviewed_automated" if manual_only else "automated"
+    total_column = aggregates.reviewed_translation_count if manual_only else aggregates.translation_count
+
+    def average(kind, metric):
+        total = getattr(aggregates, f"{kind}_{metric}_sum")
+        count = getattr(aggregates, f"{kind}_{metric}_count")
+        return (total / func.nullif(count, 0)).label(f"avg_{kind.split('_')[-1]}_{metric}")
+
+    query = select(
+        aggregates.execution_id,
+        aggregates.prompt_id,
         models.Prompt.name.label('prompt_name'),
-        func.count(models.Translation.id).label('total_translations'),
-        func.count(func.distinct(models.ManualScore.translation_id)).label('translations_with_manual_scores'),
-
-        # Automated scores averages
-        func.avg(models.Translation.automated_coherence).label('avg_automated_coherence'),
-        func.avg(models.Translation.automated_fidelity).label('avg_automated_fidelity'),
-        func.avg(models.Translation.automated_naturalness).label('avg_automated_naturalness'),
-        func.avg(models.Translation.automated_overall).label('avg_automated_overall'),
-
-        # Manual scores averages
-        func.avg(models.ManualScore.coherence).label('avg_manual_coherence'),
-        func.avg(models.ManualScore.fidelity).label('avg_manual_fidelity'),
-        func.avg(models.ManualScore.naturalness).label('avg_manual_naturalness'),
-        func.avg(models.ManualScore.overall).label('avg_manual_overall'),
+        total_column.label('total_translations'),
+        aggregates.reviewed_translation_count.label('translations_with_manual_scores'),
+        *(average(automated, metric) for metric in METRICS),
+        *(average("manual", metric) for metric in METRICS),
     ).join(
         models.Prompt,
-        models.Translation.prompt_id == models.Prompt.id
-    ).outerjoin(
-        models.ManualScore,
-        models.Translation.id == models.ManualScore.translation_id
+        aggregates.prompt_id == models.Prompt.id
+    ).where(
+        total_column > 0
     )
 
     # Apply filters
     if execution_id:
-        query = query.filter(models.Translation.execution_id == execution_id)
+        query = query.where(aggregates.execution_id == execution_id)
     if prompt_id:
-        query = query.filter(models.Translation.prompt_id == prompt_id)
-    if manual_only:
-        query = query.filter(models.ManualScore.id.isnot(None))
-
-    # Group by
-    query = query.group_by(
-        models.Translation.execution_id,
-        models.Translation.prompt_id,
-        models.Prompt.name
-    )
+        query = query.where(aggregates.prompt_id == prompt_id)
 
-    results = query.all()
+    results = (await db.execute(query)).all()
 
     reports = []
     for result in results:
@@ -115,34 +106,34 @@ async def get_reports(
 @router.get("/summary", response_model=schemas.SummaryReport)
 async def get_summary(
     execution_id: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
     """
     Get overall quality summary based on manual scores from all users
     """
     # Base query for total translations
-    translations_query = db.query(func.count(models.Translation.id))
+    translations_query = select(func.count(models.Translation.id))
     if execution_id:
-        translations_query = translations_query.filter(models.Translation.execution_id == execution_id)
-    total_translations = translations_query.scalar()
+        translations_query = translations_query.where(models.Translation.execution_id == execution_id)
+    total_translations = await db.scalar(translations_query)
 
     # Translations with at least one manual score
-    reviewed_query = db.query(
+    reviewed_query = select(
         func.count(distinct(models.ManualScore.translation_id))
     ).join(
         models.Translation,
         models.ManualScore.translation_id == models.Translation.id
     )
     if execution_id:
-        reviewed_query = reviewed_query.filter(models.Translation.execution_id == execution_id)
-    translations_reviewed = reviewed_query.scalar() or 0
+        reviewed_query = reviewed_query.where(models.Translation.execution_id == execution_id)
+    translations_reviewed = await db.scalar(reviewed_query) or 0
 
     # Calculate review percentage
     review_percentage = round((translations_reviewed / total_translations * 100) if total_translations > 0 else 0, 2)
 
     # Average manual scores across all translations
-    avg_scores_query = db.query(
+    avg_scores_query = select(
         func.avg(models.ManualScore.overall).label('avg_overall'),
         func.avg(models.ManualScore.coherence).label('avg_coherence'),
         func.avg(models.ManualScore.fidelity).label('avg_fidelity'),
@@ -152,11 +143,11 @@ async def get_summary(
         models.ManualScore.translation_id == models.Translation.id
     )
     if execution_id:
-        avg_scores_query = avg_scores_query.filter(models.Translation.execution_id == execution_id)
-    avg_scores = avg_scores_query.first()
+        avg_scores_query = avg_scores_query.where(models.Translation.execution_id == execution_id)
+    avg_scores = (await db.execute(avg_scores_query)).one()
 
     # Get contributors (users who have submitted manual scores)
-    contributors_query = db.query(
+    contributors_query = select(
         models.User.username,
         func.count(models.ManualScore.id).label('contributions')
     ).join(
@@ -167,14 +158,14 @@ async def get_summary(
         models.ManualScore.translation_id == models.Translation.id
     )
     if execution_id:
-        contributors_query = contributors_query.filter(models.Translation.execution_id == execution_id)
+        contributors_query = contributors_query.where(models.Translation.execution_id == execution_id)
 
-    contributors_results = contributors_query.group_by(
+    contributors_results = await db.execute(contributors_query.group_by(
         models.User.id,
         models.User.username
     ).order_by(
         func.count(models.ManualScore.id).desc()
-    ).all()
+    ))
 
     contributors = [
         schemas.ContributorUser(username=c.username, contributions=c.contributions)
@@ -198,7 +189,7 @@ async def export_reviews(
     execution_ids: Optional[List[str]] = Query(None),
     my_reviews_only: bool = Query(True),
     include_unreviewed: bool = Query(False),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
     """
@@ -212,7 +203,7 @@ async def export_reviews(
     # Base query
     if include_unreviewed:
         # Include all translations (with or without reviews)
-        translations_query = db.query(
+        translations_query = select(
             models.Translation,
             models.ManualScore,
             models.Prompt.name.label('prompt_name'),
@@ -229,7 +220,7 @@ async def export_reviews(
         )
     else:
         # Only translations with reviews
-        translations_query = db.query(
+        translations_query = select(
             models.Translation,
             models.ManualScore,
             models.Prompt.name.label('prompt_name'),
@@ -247,7 +238,7 @@ async def export_reviews(
 
     # Apply execution filter
     if execution_ids and len(execution_ids) > 0:
-        translations_query = translations_query.filter(
+        translations_query = translations_query.where(
             models.Translation.execution_id.in_(execution_ids)
         )
 
@@ -255,12 +246,12 @@ async def export_reviews(
     if my_reviews_only:
         if include_unreviewed:
             # Include unreviewed translations OR translations reviewed by current user
-            translations_query = translations_query.filter(
+            translations_query = translations_query.where(
                 (models.ManualScore.user_id == current_user.id) |
                 (models.ManualScore.user_id == None)
             )
         else:
-            translations_query = translations_query.filter(
+            translations_query = translations_query.where(
                 models.ManualScore.user_id == current_user.id
             )
 
@@ -268,7 +259,7 @@ async def export_reviews(
         models.Translation.created_at.desc()
     )
 
-    results = translations_query.all()
+    results = (await db.execute(translations_query)).all()
 
     # Create workbook
     wb = Workbook()
@@ -420,7 +411,7 @@ async def export_reviews(
 
 @router.get("/export/user-reviews")
 async def export_user_reviews(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
     """
@@ -429,7 +420,7 @@ async def export_user_reviews(
     Excludes execution_id and prompt_id fields
     """
     # Query translations with manual scores from current user
-    translations_query = db.query(
+    translations_query = await db.execute(select(
         models.Translation,
         models.ManualScore,
         models.Prompt.name.label('prompt_name')
@@ -439,11 +430,11 @@ async def export_user_reviews(
     ).join(
         models.Prompt,
         models.Translation.prompt_id == models.Prompt.id
-    ).filter(
+    ).where(
         models.ManualScore.user_id == current_user.id
     ).order_by(
         models.Translation.created_at.desc()
-    ).all()
+    ))
 
     # Create workbook
     wb = Workbook()
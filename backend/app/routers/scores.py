@@ -1,30 +1,75 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app import models, schemas
 from app.auth import get_current_active_user
+from app.report_aggregates import (
+    METRICS, apply_deltas, lock_report_groups, manual_score_deltas, reviewed_deltas, score_values
+)
 
 router = APIRouter(prefix="/api/scores", tags=["scores"])
 
 
+def _count_manual_scores(execution_id: str, delta: int):
+    """Keep executions.manual_score_count in step, in the score's transaction"""
+    return update(models.Execution).where(
+        models.Execution.id == execution_id
+    ).values(manual_score_count=models.Execution.manual_score_count + delta)
+
+
+async def _translation_group(db: AsyncSession, translation_id: int, lock: bool = False):
+    """
+    Execution, prompt and automated scores of a translation. With `lock`,
+    the translation row is locked until commit, so concurrent score writes
+    on it agree on whether it is reviewed.
+    """
+    query = select(
+        models.Translation.execution_id,
+        models.Translation.prompt_id,
+        *(getattr(models.Translation, f"automated_{metric}") for metric in METRICS)
+    ).where(models.Translation.id == translation_id)
+    if lock:
+        query = query.with_for_update()
+    return (await db.execute(query)).first()
+
+
+async def _has_other_scores(db: AsyncSession, translation_id: int, score_id=None) -> bool:
+    query = select(models.ManualScore.id).where(models.ManualScore.translation_id == translation_id)
+    if score_id is not None:
+        query = query.where(models.ManualScore.id != score_id)
+    return await db.scalar(query.limit(1)) is not None
+
+
+async def _update_report_aggregates(db: AsyncSession, group, deltas):
+    """
+    Apply a score change to its report group, in the score's transaction.
+    The execution's lock is held until commit, so a refresh running
+    meanwhile can't overwrite the change.
+    """
+    stmt = apply_deltas(group.execution_id, group.prompt_id, deltas)
+    if stmt is not None:
+        await db.execute(lock_report_groups(group.execution_id))
+        await db.execute(stmt)
+
+
 @router.post("/", response_model=schemas.ManualScore)
 async def create_manual_score(
     score_data: schemas.ManualScoreCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
     # Check if translation exists
-    translation = db.query(models.Translation).filter(
-        models.Translation.id == score_data.translation_id
-    ).first()
-    if not translation:
+    group = await _translation_group(db, score_data.translation_id, lock=True)
+    if not group:
         raise HTTPException(status_code=404, detail="Translation not found")
 
     # Check if user already scored this translation
-    existing_score = db.query(models.ManualScore).filter(
+    existing_score = await db.scalar(select(models.ManualScore.id).where(
         models.ManualScore.translation_id == score_data.translation_id,
         models.ManualScore.user_id == current_user.id
-    ).first()
+    ))
 
     if existing_score:
         raise HTTPException(
@@ -38,8 +83,22 @@ async def create_manual_score(
         user_id=current_user.id
     )
     db.add(db_score)
-    db.commit()
-    db.refresh(db_score)
+
+    deltas = manual_score_deltas(None, score_values(db_score))
+    if not await _has_other_scores(db, score_data.translation_id):
+        deltas.update(reviewed_deltas(group, 1))
+    await _update_report_aggregates(db, group, deltas)
+    await db.execute(_count_manual_scores(group.execution_id, 1))
+    try:
+        await db.commit()
+    except IntegrityError:
+        # A concurrent request created the score first
+        await db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail="Score already exists. Use PUT to update."
+        )
+    await db.refresh(db_score)
     return db_score
 
 
@@ -47,14 +106,14 @@ async def create_manual_score(
 async def update_manual_score(
     score_id: int,
     score_data: schemas.ManualScoreUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
     # Get existing score
-    db_score = db.query(models.ManualScore).filter(
+    db_score = await db.scalar(select(models.ManualScore).where(
         models.ManualScore.id == score_id,
         models.ManualScore.user_id == current_user.id
-    ).first()
+    ))
 
     if not db_score:
         raise HTTPException(
@@ -63,24 +122,25 @@ async def update_manual_score(
         )
 
     # Update score
+    old_values = score_values(db_score)
     update_data = score_data.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(db_score, key, value)
 
-    db.commit()
-    db.refresh(db_score)
+    group = await _translation_group(db, db_score.translation_id)
+    await _update_report_aggregates(db, group, manual_score_deltas(old_values, score_values(db_score)))
+    await db.commit()
+    await db.refresh(db_score)
     return db_score
 
 
 @router.get("/{score_id}", response_model=schemas.ManualScore)
 async def get_manual_score(
     score_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
-    score = db.query(models.ManualScore).filter(
-        models.ManualScore.id == score_id
-    ).first()
+    score = await db.get(models.ManualScore, score_id)
 
     if not score:
         raise HTTPException(status_code=404, detail="Score not found")
@@ -91,13 +151,13 @@ async def get_manual_score(
 @router.delete("/{score_id}")
 async def delete_manual_score(
     score_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
-    score = db.query(models.ManualScore).filter(
+    score = await db.scalar(select(models.ManualScore).where(
         models.ManualScore.id == score_id,
         models.ManualScore.user_id == current_user.id
-    ).first()
+    ))
 
     if not score:
         raise HTTPException(
@@ -105,6 +165,13 @@ async def delete_manual_score(
             detail="Score not found or you don't have permission to delete it"
         )
 
-    db.delete(score)
-    db.commit()
+    group = await _translation_group(db, score.translation_id, lock=True)
+    deltas = manual_score_deltas(score_values(score), None)
+    if not await _has_other_scores(db, score.translation_id, score.id):
+        deltas.update(reviewed_deltas(group, -1))
+
+    await db.delete(score)
+    await _update_report_aggregates(db, group, deltas)
+    await db.execute(_count_manual_scores(group.execution_id, -1))
+    await db.commit()
     return {"message": "Score deleted successfully"}
@@ -1,10 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from typing import List, Optional
 from app.database import get_db
 from app import models, schemas
 from app.auth import get_current_active_user
+from app.report_aggregates import apply_deltas, lock_report_groups, translation_deltas
 
 router = APIRouter(prefix="/api/translations", tags=["translations"])
 
@@ -15,30 +18,34 @@ async def list_translations(
     prompt_id: Optional[int] = None,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
-    query = db.query(models.Translation).options(
-        joinedload(models.Translation.prompt),
-        joinedload(models.Translation.manual_scores)
+    query = select(models.Translation).options(
+        selectinload(models.Translation.prompt)
     )
 
     if execution_id:
-        query = query.filter(models.Translation.execution_id == execution_id)
+        query = query.where(models.Translation.execution_id == execution_id)
     if prompt_id:
-        query = query.filter(models.Translation.prompt_id == prompt_id)
+        query = query.where(models.Translation.prompt_id == prompt_id)
 
-    translations = query.offset(skip).limit(limit).all()
+    translations = (await db.scalars(query.offset(skip).limit(limit))).all()
+
+    # Current user's manual scores for the page, in one query
+    manual_scores = {}
+    if translations:
+        scores = await db.scalars(select(models.ManualScore).where(
+            models.ManualScore.translation_id.in_([translation.id for translation in translations]),
+            models.ManualScore.user_id == current_user.id
+        ))
+        manual_scores = {score.translation_id: score for score in scores}
 
     # Attach manual scores for current user
     result = []
     for translation in translations:
         trans_dict = schemas.Translation.model_validate(translation).model_dump()
-        # Get current user's manual score if exists
-        manual_score = db.query(models.ManualScore).filter(
-            models.ManualScore.translation_id == translation.id,
-            models.ManualScore.user_id == current_user.id
-        ).first()
+        manual_score = manual_scores.get(translation.id)
         trans_dict['manual_score'] = schemas.ManualScore.model_validate(manual_score) if manual_score else None
         result.append(trans_dict)
 
@@ -48,12 +55,12 @@ async def list_translations(
 @router.get("/{translation_id}", response_model=schemas.TranslationWithScores)
 async def get_translation(
     translation_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
-    translation = db.query(models.Translation).options(
-        joinedload(models.Translation.prompt)
-    ).filter(models.Translation.id == translation_id).first()
+    translation = await db.scalar(select(models.Translation).options(
+        selectinload(models.Translation.prompt)
+    ).where(models.Translation.id == translation_id))
 
     if not translation:
         raise HTTPException(status_code=404, detail="Translation not found")
@@ -61,10 +68,10 @@ async def get_translation(
     trans_dict = schemas.Translation.model_validate(translation).model_dump()
 
     # Get current user's manual score if exists
-    manual_score = db.query(models.ManualScore).filter(
+    manual_score = await db.scalar(select(models.ManualScore).where(
         models.ManualScore.translation_id == translation_id,
         models.ManualScore.user_id == current_user.id
-    ).first()
+    ))
 
     trans_dict['manual_score'] = schemas.ManualScore.model_validate(manual_score) if manual_score else None
 
@@ -73,36 +80,49 @@ async def get_translation(
 
 @router.get("/executions/list")
 async def list_executions(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
-    executions = db.query(
-        models.Translation.execution_id,
-        func.count(models.Translation.id).label('count'),
-        func.max(models.Translation.created_at).label('latest_date'),
-        func.max(models.Translation.execution_description).label('description')
-    ).group_by(
-        models.Translation.execution_id
-    ).order_by(
-        func.max(models.Translation.created_at).desc()
-    ).all()
+    executions = await db.scalars(select(models.Execution).order_by(
+        models.Execution.last_loaded_at.desc()
+    ))
 
     return [{
-        "execution_id": e.execution_id,
-        "count": e.count,
-        "latest_date": e.latest_date.isoformat() if e.latest_date else None,
-        "description": e.description
+        "execution_id": e.id,
+        "count": e.translation_count,
+        "manual_score_count": e.manual_score_count,
+        "latest_date": e.last_loaded_at.isoformat() if e.last_loaded_at else None,
+        "description": e.description,
+        "source_prefix": e.source_prefix
     } for e in executions]
 
 
 @router.post("/", response_model=schemas.Translation)
 async def create_translation(
     translation: schemas.TranslationCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
+    await db.execute(pg_insert(models.Execution).values(
+        id=translation.execution_id
+    ).on_conflict_do_nothing(index_elements=['id']))
+    await db.execute(update(models.Execution).where(
+        models.Execution.id == translation.execution_id
+    ).values(
+        last_loaded_at=func.now(),
+        translation_count=models.Execution.translation_count + 1
+    ))
+
     db_translation = models.Translation(**translation.model_dump())
     db.add(db_translation)
-    db.commit()
-    db.refresh(db_translation)
-    return db_translation
+    await db.flush()
+    # Adds the translation to its report group
+    await db.execute(lock_report_groups(translation.execution_id))
+    await db.execute(apply_deltas(
+        translation.execution_id, translation.prompt_id, translation_deltas(db_translation)
+    ))
+    await db.commit()
+    # The response includes the prompt, which can't be lazy-loaded here
+    return await db.scalar(select(models.Translation).options(
+        selectinload(models.Translation.prompt)
+    ).where(models.Translation.id == db_translation.id).execution_options(populate_existing=True))
@@ -1,43 +1,531 @@
+import gzip
 import json
+import mmap
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from contextlib import ExitStack, contextmanager, nullcontext
+from functools import cached_property, partial
+from itertools import islice
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from pathlib import Path
+from typing import BinaryIO, Callable, ContextManager, Dict, Any, Iterable, Iterator, List, NamedTuple, Optional, Union
 from io import BytesIO
 from app.config import get_settings
+from app.object_cache import ObjectCache
+
+try:
+    import orjson
+except ImportError:  # Optional fast codec; the stdlib json module is the fallback
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # Optional: only needed to read .zst objects
+    zstandard = None
 
 settings = get_settings()
 
+# Bytes read per call when streaming an object
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Object formats and compressions recognised by file extension
+FORMAT_EXTENSIONS = {'.json': 'json', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+COMPRESSION_EXTENSIONS = {'.gz': 'gzip', '.zst': 'zstd'}
+
+# Leading bytes of compressed bodies
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+class ObjectKey(NamedTuple):
+    """What an object key says about its content"""
+    name: str  # File name without format/compression extensions (e.g. the translation ID)
+    format: Optional[str]  # "json", "jsonl" or None
+    compression: Optional[str]  # "gzip", "zstd" or None
+
+
+def parse_object_key(key: str) -> ObjectKey:
+    """
+    Split an object key's file name into name, format and compression, e.g.
+    'latest/en/abc.json.gz' -> ObjectKey('abc', 'json', 'gzip').
+    """
+    name = key.rsplit('/', 1)[-1]
+    compression = None
+    stem, dot, extension = name.rpartition('.')
+    if dot and f".{extension}" in COMPRESSION_EXTENSIONS:
+        compression = COMPRESSION_EXTENSIONS[f".{extension}"]
+        name = stem
+
+    stem, dot, extension = name.rpartition('.')
+    if dot and f".{extension}" in FORMAT_EXTENSIONS:
+        return ObjectKey(stem, FORMAT_EXTENSIONS[f".{extension}"], compression)
+    return ObjectKey(name, None, compression)
+
+
+def sniff_compression(head) -> Optional[str]:
+    """
+    Compression of a body from its first bytes. Detecting it from the
+    content covers both compressed file names and Content-Encoding, and
+    never decompresses twice when an HTTP client already decoded it.
+    """
+    head = bytes(head[:4])
+    if head.startswith(GZIP_MAGIC):
+        return "gzip"
+    if head.startswith(ZSTD_MAGIC):
+        return "zstd"
+    return None
+
+
+def _zstd_decompressor():
+    if zstandard is None:
+        raise ValueError("Reading .zst objects requires the zstandard package")
+    return zstandard.ZstdDecompressor()
+
+
+def decompress(body):
+    """Return the body decompressed, or unchanged when it isn't compressed"""
+    compression = sniff_compression(body)
+    if compression == "gzip":
+        return gzip.decompress(body)
+    if compression == "zstd":
+        # decompressobj also handles frames without a content size
+        return _zstd_decompressor().decompressobj().decompress(bytes(body))
+    return body
+
+
+class _PrefixedStream:
+    """A stream whose first bytes were already read (to sniff compression)"""
+
+    def __init__(self, head: bytes, stream: BinaryIO):
+        self._head = head
+        self._stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        if not self._head:
+            return self._stream.read(size)
+        if size is None or size < 0:
+            data, self._head = self._head + self._stream.read(), b''
+            return data
+        data, self._head = self._head[:size], self._head[size:]
+        if len(data) < size:
+            data += self._stream.read(size - len(data))
+        return data
+
+
+class _SlottedStream:
+    """A stream that holds `slot` around each read, not while idle"""
+
+    def __init__(self, stream: BinaryIO, slot: Callable[[], ContextManager]):
+        self._stream = stream
+        self._slot = slot
+
+    def read(self, size: int = -1) -> bytes:
+        with self._slot():
+            return self._stream.read(size)
+
+
+def decompressing_stream(stream: BinaryIO) -> BinaryIO:
+    """Wrap a raw object stream so reads return decompressed bytes"""
+    head = stream.read(4)
+    prefixed = _PrefixedStream(head, stream)
+    compression = sniff_compression(head)
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=prefixed, mode='rb')
+    if compression == "zstd":
+        return _zstd_decompressor().stream_reader(prefixed)
+    return prefixed
+
+
+def json_loads(data) -> Any:
+    """
+    Parse JSON straight from bytes (or a memoryview) without decoding to str
+    first. Uses orjson when installed.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def json_dumps(data: Any) -> bytes:
+    """
+    Encode to UTF-8 JSON bytes: compact unless STORAGE_JSON_INDENT is set.
+    Uses orjson when installed (it only supports an indent of 2).
+    """
+    indent = settings.STORAGE_JSON_INDENT
+    if orjson is not None and indent in (0, 2):
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=indent, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+# S3/MinIO error codes worth retrying: throttling and server-side hiccups
+TRANSIENT_ERROR_CODES = {
+    'SlowDown',
+    'Throttling',
+    'ThrottlingException',
+    'RequestLimitExceeded',
+    'RequestTimeout',
+    'InternalError',
+    'ServiceUnavailable',
+    '500',
+    '502',
+    '503',
+    '504',
+}
+
+
+# Slot the caller of the read running on this thread asked for (e.g. an
+# ingestion budget), taken per request attempt together with a limiter slot
+_caller_slot = threading.local()
+
+
+@contextmanager
+def _using_slot(slot: Optional[Callable[[], ContextManager]]):
+    """Make `slot` the caller slot of the requests made in the with-block"""
+    previous = getattr(_caller_slot, 'slot', None)
+    _caller_slot.slot = slot
+    try:
+        yield
+    finally:
+        _caller_slot.slot = previous
+
+
+class TransientStorageError(Exception):
+    """A read kept failing with throttling/server errors after all retries"""
+    pass
+
+
+class AdaptiveLimiter:
+    """
+    AIMD limit on concurrent storage requests.
+
+    Every throttled request halves the limit (at most once per
+    `cooldown` seconds, so one burst of 503s counts as one signal); every
+    `limit` successful requests raise it by one again, up to `max_limit`.
+    """
+
+    def __init__(self, max_limit: int, min_limit: int = 1, cooldown: float = 1.0):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = float(self.max_limit)
+        self.cooldown = cooldown
+        self.throttled = 0
+        self.in_flight = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def slot(self):
+        """Hold one request slot for the duration of the with-block"""
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self.in_flight -= 1
+                self._condition.notify()
+
+    def record_success(self):
+        with self._condition:
+            if self.limit < self.max_limit:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+                self._condition.notify()
+
+    def record_throttle(self):
+        with self._condition:
+            self.throttled += 1
+            now = time.monotonic()
+            if now - self._last_decrease >= self.cooldown:
+                self.limit = max(self.min_limit, self.limit / 2)
+                self._last_decrease = now
+
+    def stats(self) -> Dict[str, Any]:
+        with self._condition:
+            return {"limit": int(self.limit), "max_limit": self.max_limit, "throttled": self.throttled}
+
+
+def iter_lines(stream: BinaryIO, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """Split a binary stream into lines (without the newline), chunk by chunk"""
+    remainder = b''
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        lines = (remainder + chunk).split(b'\n')
+        remainder = lines.pop()
+        yield from lines
+    if remainder:
+        yield remainder
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff for the given retry attempt (0-based)"""
+    cap = min(settings.STORAGE_RETRY_MAX_SECONDS, settings.STORAGE_RETRY_BASE_SECONDS * 2 ** attempt)
+    return random.uniform(0, cap)
+
+
+class ObjectInfo(NamedTuple):
+    """Key and change-detection metadata of a stored object"""
+    key: str
+    size: int
+    etag: Optional[str]
+
+
+class GetResult(NamedTuple):
+    """One object fetched by get_many"""
+    key: str
+    data: Dict[Any, Any]  # {} when the object is missing or unreadable
+    error: Optional[str]  # Set when decoding failed or the request raised
+    seconds: float  # Request time (including retries and cache reads)
+    decode_seconds: float  # Decompression + JSON parsing time
+    size: int  # Body bytes as stored (before decompression)
+
 
 class StorageBackend(ABC):
-    """Abstract base class for storage backends"""
+    """
+    Abstract base class for storage backends.
+
+    Backends move raw bytes; JSON encoding and decoding happen once here
+    through json_dumps/json_loads.
+
+    With a `cache` attached, reads that know the object's ETag (e.g. from
+    a listing) are served from the local ObjectCache when possible.
+    """
+
+    cache: Optional[ObjectCache] = None
+    # Identifies the endpoint/bucket in cache keys
+    cache_namespace: str = ""
 
     @abstractmethod
-    def upload_json(self, object_name: str, data: Dict[Any, Any]) -> bool:
+    def put_bytes(self, object_name: str, data: bytes, content_type: str = 'application/json') -> bool:
         pass
 
     @abstractmethod
-    def get_json(self, object_name: str) -> Dict[Any, Any]:
+    def get_bytes(self, object_name: str) -> Optional[bytes]:
+        """
+        Return the object body, or None when it does not exist (or can't be
+        read for a permanent reason). Raises TransientStorageError when
+        throttling or server errors outlast the retries.
+        """
         pass
 
+    @cached_property
+    def limiter(self) -> AdaptiveLimiter:
+        """Concurrency limit shared by every get_many call on this backend"""
+        return AdaptiveLimiter(self.pool_size, min_limit=settings.STORAGE_MIN_CONCURRENCY)
+
+    def _is_transient(self, error: Exception) -> bool:
+        """Whether a failed request is worth retrying (backends override)"""
+        return False
+
+    @contextmanager
+    def _attempt_slot(self):
+        """The caller's slot (see _using_slot) and a limiter slot, for one request attempt"""
+        slot = getattr(_caller_slot, 'slot', None)
+        with (slot() if slot else nullcontext()), self.limiter.slot():
+            yield
+
+    def _with_retries(self, request, description: str):
+        """
+        Run `request()`, retrying transient errors with jittered backoff.
+        Outcomes feed the adaptive limiter, so throttling also lowers
+        get_many concurrency. Slots are held per attempt and released
+        during the backoff, so a throttled request doesn't keep them while
+        it sleeps.
+        """
+        for attempt in range(settings.STORAGE_MAX_RETRIES + 1):
+            try:
+                with self._attempt_slot():
+                    response = request()
+                self.limiter.record_success()
+                return response
+            except Exception as e:
+                if not self._is_transient(e):
+                    raise
+                self.limiter.record_throttle()
+                if attempt == settings.STORAGE_MAX_RETRIES:
+                    raise TransientStorageError(f"{description}: {e}") from e
+                time.sleep(backoff_delay(attempt))
+
+    @contextmanager
+    def open_stream(self, object_name: str) -> Iterator[BinaryIO]:
+        """
+        Open the object body as a readable binary stream. Backends override
+        this to stream from the network instead of buffering the whole body.
+        Raises FileNotFoundError when the object can't be read.
+        """
+        body = self.get_bytes(object_name)
+        if body is None:
+            raise FileNotFoundError(f"Could not read {object_name}")
+        yield BytesIO(body)
+
+    def upload_json(self, object_name: str, data: Dict[Any, Any]) -> bool:
+        return self.put_bytes(object_name, json_dumps(data))
+
+    def iter_jsonl(
+        self,
+        object_name: str,
+        slot: Optional[Callable[[], ContextManager]] = None
+    ) -> Iterator[Any]:
+        """
+        Stream the records of a (possibly gzip/zstd compressed) JSON Lines
+        object, decompressing and parsing one chunk/line at a time. `slot`,
+        when given, is held while opening the object and around each chunk
+        read, so a long object shares a concurrency budget with other reads
+        instead of holding a slot while its records are processed.
+        """
+        with ExitStack() as stack:
+            with _using_slot(slot):
+                stream = stack.enter_context(self.open_stream(object_name))
+            if slot:
+                stream = _SlottedStream(stream, slot)
+            for line in iter_lines(decompressing_stream(stream)):
+                if line.strip():
+                    yield json_loads(line)
+
+    def get_json(self, object_name: str, etag: Optional[str] = None) -> Dict[Any, Any]:
+        with self._open_body(object_name, etag) as body:
+            if body is None:
+                return {}
+            return json_loads(decompress(body))
+
+    @contextmanager
+    def _open_body(self, object_name: str, etag: Optional[str]) -> Iterator[Optional[bytes]]:
+        """
+        The object body (None when missing) for the with-block. Backends
+        override this to hand out a buffer that is only valid inside it.
+        """
+        yield self._read(object_name, etag)
+
+    def _read(self, object_name: str, etag: Optional[str]) -> Optional[bytes]:
+        """get_bytes through the cache, when there is one and the ETag is known"""
+        if self.cache is None or not etag:
+            return self.get_bytes(object_name)
+
+        body = self.cache.get(self.cache_namespace, object_name, etag)
+        if body is None:
+            body = self.get_bytes(object_name)
+            if body is not None:
+                self.cache.put(self.cache_namespace, object_name, etag, body)
+        return body
+
     @abstractmethod
-    def list_objects(self, prefix: str = "") -> list:
+    def iter_objects(self, prefix: str = "", max_keys: int = 0) -> Iterator[ObjectInfo]:
+        """
+        Yield objects under prefix page by page, without building a full list.
+        With max_keys > 0, stop after that many objects.
+        """
         pass
 
+    @abstractmethod
+    def list_prefixes(self, prefix: str = "") -> List[str]:
+        """List the immediate sub-folders of prefix (delimiter listing), e.g. ['batch/en/', 'batch/es/']"""
+        pass
+
+    def list_objects(self, prefix: str = "") -> list:
+        return [info.key for info in self.iter_objects(prefix)]
+
+    # Concurrent requests get_many may run; backends size their HTTP
+    # connection pool to match, so workers never wait on a free connection
+    pool_size: int = settings.STORAGE_MAX_POOL_CONNECTIONS
+
+    def _timed_get(
+        self,
+        obj: Union[str, ObjectInfo],
+        slot: Optional[Callable[[], ContextManager]] = None
+    ) -> GetResult:
+        object_name, etag = (obj.key, obj.etag) if isinstance(obj, ObjectInfo) else (obj, None)
+        start = fetched = time.perf_counter()
+        data, error, size = {}, None, 0
+        try:
+            # The slots are taken per request attempt (see _with_retries)
+            with _using_slot(slot), self._open_body(object_name, etag) as body:
+                fetched = time.perf_counter()
+                if body is not None:
+                    size = len(body)
+                    data = json_loads(decompress(body))
+        except Exception as e:
+            data, error = {}, str(e)
+        end = time.perf_counter()
+        return GetResult(object_name, data, error, fetched - start, end - fetched, size)
+
+    def get_many(
+        self,
+        object_names: Iterable[Union[str, ObjectInfo]],
+        max_workers: Optional[int] = None,
+        slot: Optional[Callable[[], ContextManager]] = None
+    ) -> Iterator[GetResult]:
+        """
+        Fetch many objects concurrently over the backend's shared connection
+        pool and yield them as they complete (not in input order). Passing
+        ObjectInfo items (from iter_objects) lets reads use the object cache.
+
+        `object_names` is consumed lazily and at most 2 x workers results are
+        held at once, so a slow consumer throttles the downloads. Workers are
+        capped at pool_size, and the backend's AdaptiveLimiter lowers the
+        number of requests in flight while storage is throttling. Objects
+        that still fail after retries come back with `error` set, never as
+        missing. `slot`, when given, is entered around every request attempt, not
+        during retry backoff (e.g. a concurrency budget shared with other loads).
+        """
+        workers = max(1, min(max_workers or self.pool_size, self.pool_size))
+        names = iter(object_names)
+        get = partial(self._timed_get, slot=slot)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="storage-get") as executor:
+            pending = {executor.submit(get, name) for name in islice(names, workers * 2)}
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+                    next_name = next(names, None)
+                    if next_name is not None:
+                        pending.add(executor.submit(get, next_name))
+
 
 class MinIOBackend(StorageBackend):
     """MinIO storage backend"""
 
     def __init__(self):
         from minio import Minio
-        from minio.error import S3Error
+        from minio.error import S3Error, ServerError
+
+        import certifi
+        import urllib3
 
         self.S3Error = S3Error
+        self.ServerError = ServerError
+        self.HTTPError = urllib3.exceptions.HTTPError
+        # Same settings as the MinIO default client, with a pool sized for
+        # get_many. 5xx responses are not retried here but in _with_retries,
+        # so they reach the adaptive limiter.
+        http_client = urllib3.PoolManager(
+            timeout=urllib3.Timeout(connect=300, read=300),
+            maxsize=self.pool_size,
+            cert_reqs='CERT_REQUIRED',
+            ca_certs=os.environ.get('SSL_CERT_FILE') or certifi.where(),
+            retries=urllib3.Retry(total=2, backoff_factor=0.2)
+        )
         self.client = Minio(
             settings.MINIO_ENDPOINT,
             access_key=settings.MINIO_ACCESS_KEY,
             secret_key=settings.MINIO_SECRET_KEY,
-            secure=settings.MINIO_SECURE
+            secure=settings.MINIO_SECURE,
+            http_client=http_client
         )
         self.bucket = settings.MINIO_BUCKET
+        self.cache_namespace = f"minio/{settings.MINIO_ENDPOINT}/{self.bucket}"
         self._ensure_bucket_exists()
         print(f"Using MinIO backend: {settings.MINIO_ENDPOINT}/{self.bucket}")
 
@@ -48,40 +536,71 @@ class MinIOBackend(StorageBackend):
         except self.S3Error as e:
             print(f"Error creating bucket: {e}")
 
-    def upload_json(self, object_name: str, data: Dict[Any, Any]) -> bool:
+    def put_bytes(self, object_name: str, data: bytes, content_type: str = 'application/json') -> bool:
         try:
-            json_data = json.dumps(data, indent=2).encode('utf-8')
             self.client.put_object(
                 self.bucket,
                 object_name,
-                BytesIO(json_data),
-                len(json_data),
-                content_type='application/json'
+                BytesIO(data),
+                len(data),
+                content_type=content_type
             )
             return True
         except self.S3Error as e:
             print(f"Error uploading to MinIO: {e}")
             return False
 
-    def get_json(self, object_name: str) -> Dict[Any, Any]:
+    def _is_transient(self, error: Exception) -> bool:
+        if isinstance(error, self.S3Error):
+            return error.code in TRANSIENT_ERROR_CODES
+        return isinstance(error, (self.ServerError, self.HTTPError))
+
+    def _get_object(self, object_name: str) -> bytes:
+        response = self.client.get_object(self.bucket, object_name)
         try:
-            response = self.client.get_object(self.bucket, object_name)
-            data = json.loads(response.read().decode('utf-8'))
-            return data
+            return response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
+    def get_bytes(self, object_name: str) -> Optional[bytes]:
+        try:
+            return self._with_retries(lambda: self._get_object(object_name), f"Error getting {object_name} from MinIO")
         except self.S3Error as e:
             print(f"Error getting from MinIO: {e}")
-            return {}
+            return None
+
+    @contextmanager
+    def open_stream(self, object_name: str):
+        try:
+            response = self._with_retries(
+                lambda: self.client.get_object(self.bucket, object_name),
+                f"Error opening {object_name} in MinIO"
+            )
+        except self.S3Error as e:
+            raise FileNotFoundError(f"Could not read {object_name}: {e}") from e
+        try:
+            yield response
         finally:
-            if 'response' in locals():
-                response.close()
-                response.release_conn()
+            response.close()
+            response.release_conn()
 
-    def list_objects(self, prefix: str = ""):
+    def iter_objects(self, prefix: str = "", max_keys: int = 0):
         try:
+            # The MinIO client already fetches listing pages lazily
             objects = self.client.list_objects(self.bucket, prefix=prefix, recursive=True)
-            return [obj.object_name for obj in objects]
+            for obj in islice(objects, max_keys or None):
+                yield ObjectInfo(obj.object_name, obj.size or 0, (obj.etag or '').strip('"') or None)
         except self.S3Error as e:
             print(f"Error listing objects: {e}")
+
+    def list_prefixes(self, prefix: str = ""):
+        try:
+            folder = f"{prefix.rstrip('/')}/" if prefix else ""
+            objects = self.client.list_objects(self.bucket, prefix=folder, recursive=False)
+            return [obj.object_name for obj in objects if obj.is_dir]
+        except self.S3Error as e:
+            print(f"Error listing prefixes: {e}")
             return []
 
 
@@ -90,17 +609,27 @@ class AWSS3Backend(StorageBackend):
 
     def __init__(self):
         import boto3
-        from botocore.exceptions import ClientError
+        from botocore.config import Config
+        from botocore.exceptions import ClientError, ConnectionError, HTTPClientError
 
         self.ClientError = ClientError
+        self.NetworkErrors = (ConnectionError, HTTPClientError)
         self.bucket = settings.AWS_S3_BUCKET
         self.prefix = settings.AWS_S3_PREFIX
+        self.cache_namespace = f"s3/{self.bucket}/{self.prefix or ''}"
+        # Keep-alive pool sized for get_many, so TLS connections are reused.
+        # botocore's own retries are off: _with_retries retries throttling
+        # so the adaptive limiter sees it.
+        client_config = Config(
+            max_pool_connections=self.pool_size,
+            retries={'mode': 'standard', 'total_max_attempts': 1}
+        )
 
         # Initialize boto3 client with different credential strategies
         if settings.AWS_PROFILE:
             # Use AWS SSO or named profile from ~/.aws/config
             session = boto3.Session(profile_name=settings.AWS_PROFILE)
-            self.client = session.client('s3', region_name=settings.AWS_REGION)
+            self.client = session.client('s3', region_name=settings.AWS_REGION, config=client_config)
             print(f"Using AWS S3 backend with profile '{settings.AWS_PROFILE}': s3://{self.bucket}/{self.prefix or ''}")
         elif settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY:
             # Use explicit access keys
@@ -108,12 +637,13 @@ class AWSS3Backend(StorageBackend):
                 's3',
                 region_name=settings.AWS_REGION,
                 aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
+                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                config=client_config
             )
             print(f"Using AWS S3 backend with access keys: s3://{self.bucket}/{self.prefix or ''}")
         else:
             # Use default credentials (IAM role, environment, or default profile)
-            self.client = boto3.client('s3', region_name=settings.AWS_REGION)
+            self.client = boto3.client('s3', region_name=settings.AWS_REGION, config=client_config)
             print(f"Using AWS S3 backend with default credentials: s3://{self.bucket}/{self.prefix or ''}")
 
     def _get_full_key(self, object_name: str) -> str:
@@ -122,74 +652,286 @@ class AWSS3Backend(StorageBackend):
             return f"{self.prefix.rstrip('/')}/{object_name}"
         return object_name
 
-    def upload_json(self, object_name: str, data: Dict[Any, Any]) -> bool:
+    def put_bytes(self, object_name: str, data: bytes, content_type: str = 'application/json') -> bool:
         try:
-            json_data = json.dumps(data, indent=2).encode('utf-8')
             full_key = self._get_full_key(object_name)
             self.client.put_object(
                 Bucket=self.bucket,
                 Key=full_key,
-                Body=json_data,
-                ContentType='application/json'
+                Body=data,
+                ContentType=content_type
             )
             return True
         except self.ClientError as e:
             print(f"Error uploading to S3: {e}")
             return False
 
-    def get_json(self, object_name: str) -> Dict[Any, Any]:
-        try:
-            full_key = self._get_full_key(object_name)
+    def _is_transient(self, error: Exception) -> bool:
+        if isinstance(error, self.ClientError):
+            code = error.response.get('Error', {}).get('Code', '')
+            status = error.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0)
+            return code in TRANSIENT_ERROR_CODES or status >= 500
+        return isinstance(error, self.NetworkErrors)
+
+    def get_bytes(self, object_name: str) -> Optional[bytes]:
+        full_key = self._get_full_key(object_name)
+
+        def request():
             response = self.client.get_object(Bucket=self.bucket, Key=full_key)
-            data = json.loads(response['Body'].read().decode('utf-8'))
-            return data
+            return response['Body'].read()
+
+        try:
+            return self._with_retries(request, f"Error getting {full_key} from S3")
         except self.ClientError as e:
             print(f"Error getting from S3: {e}")
-            return {}
+            return None
+
+    @contextmanager
+    def open_stream(self, object_name: str):
+        full_key = self._get_full_key(object_name)
+        try:
+            response = self._with_retries(
+                lambda: self.client.get_object(Bucket=self.bucket, Key=full_key),
+                f"Error opening {full_key} in S3"
+            )
+        except self.ClientError as e:
+            raise FileNotFoundError(f"Could not read {full_key}: {e}") from e
+        body = response['Body']
+        try:
+            yield body
+        finally:
+            body.close()
+
+    def _strip_prefix(self, key: str) -> str:
+        """Remove the configured prefix from a returned key"""
+        if self.prefix and key.startswith(self.prefix):
+            return key[len(self.prefix):].lstrip('/')
+        return key
 
-    def list_objects(self, prefix: str = ""):
+    def iter_objects(self, prefix: str = "", max_keys: int = 0):
         try:
             full_prefix = self._get_full_key(prefix)
-            objects = []
             paginator = self.client.get_paginator('list_objects_v2')
+            pagination = {'PageSize': settings.S3_LIST_PAGE_SIZE}
+            if max_keys:
+                pagination = {'PageSize': min(max_keys, settings.S3_LIST_PAGE_SIZE), 'MaxItems': max_keys}
+
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=full_prefix, PaginationConfig=pagination):
+                for obj in page.get('Contents', []):
+                    key = self._strip_prefix(obj['Key'])
+                    yield ObjectInfo(key, obj.get('Size', 0), obj.get('ETag', '').strip('"') or None)
+        except self.ClientError as e:
+            print(f"Error listing objects: {e}")
 
-            for page in paginator.paginate(Bucket=self.bucket, Prefix=full_prefix):
-                if 'Contents' in page:
-                    for obj in page['Contents']:
-                        key = obj['Key']
-                        # Remove the configured prefix from the returned keys
-                        if self.prefix and key.startswith(self.prefix):
-                            key = key[len(self.prefix):].lstrip('/')
-                        objects.append(key)
+    def list_prefixes(self, prefix: str = ""):
+        try:
+            folder = f"{self._get_full_key(prefix).rstrip('/')}/" if prefix or self.prefix else ""
+            paginator = self.client.get_paginator('list_objects_v2')
+            prefixes = []
 
-            return objects
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=folder, Delimiter='/'):
+                for common_prefix in page.get('CommonPrefixes', []):
+                    prefixes.append(self._strip_prefix(common_prefix['Prefix']))
+
+            return prefixes
         except self.ClientError as e:
-            print(f"Error listing objects: {e}")
+            print(f"Error listing prefixes: {e}")
+            return []
+
+
+class LocalBackend(StorageBackend):
+    """
+    Local filesystem storage backend.
+
+    Object keys map to files under a root directory (e.g. sample_data, whose
+    llm-output/YYYY/MM/latest layout matches the buckets), so ingestion can
+    run and be profiled without an object store. Files at or above
+    LOCAL_STORAGE_MMAP_THRESHOLD bytes are read through mmap.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = Path(root or settings.LOCAL_STORAGE_ROOT).resolve()
+        self.root.mkdir(parents=True, exist_ok=True)
+        print(f"Using local storage backend: {self.root}")
+
+    def _path(self, object_name: str) -> Path:
+        path = (self.root / object_name.lstrip('/')).resolve()
+        if path != self.root and self.root not in path.parents:
+            raise ValueError(f"Object key escapes storage root: {object_name}")
+        return path
+
+    def _key(self, path: Path) -> str:
+        return path.relative_to(self.root).as_posix()
+
+    def put_bytes(self, object_name: str, data: bytes, content_type: str = 'application/json') -> bool:
+        try:
+            path = self._path(object_name)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so readers never see a partial file
+            tmp_path = path.with_name(f".{path.name}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+            return True
+        except (OSError, ValueError) as e:
+            print(f"Error writing to local storage: {e}")
+            return False
+
+    def get_bytes(self, object_name: str) -> Optional[bytes]:
+        try:
+            return self._path(object_name).read_bytes()
+        except (OSError, ValueError) as e:
+            print(f"Error reading from local storage: {e}")
+            return None
+
+    @contextmanager
+    def open_stream(self, object_name: str):
+        try:
+            stream = open(self._path(object_name), 'rb')
+        except (OSError, ValueError) as e:
+            raise FileNotFoundError(f"Could not read {object_name}: {e}") from e
+        with stream:
+            yield stream
+
+    def get_json(self, object_name: str, etag: Optional[str] = None) -> Dict[Any, Any]:
+        try:
+            return super().get_json(object_name, etag)
+        except (OSError, ValueError) as e:
+            print(f"Error reading from local storage: {e}")
+            return {}
+
+    @contextmanager
+    def _open_body(self, object_name: str, etag: Optional[str]):
+        # Files are already local: never cached, and read in one attempt
+        # that holds the slots for the with-block
+        try:
+            f = open(self._path(object_name), 'rb')
+        except (OSError, ValueError) as e:
+            print(f"Error reading from local storage: {e}")
+            yield None
+            return
+
+        with f, self._attempt_slot():
+            size = os.fstat(f.fileno()).st_size
+            if size and size >= settings.LOCAL_STORAGE_MMAP_THRESHOLD:
+                # Parse straight from the mapping, without a read copy
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as view:
+                        yield view
+            else:
+                yield f.read()
+
+    def iter_objects(self, prefix: str = "", max_keys: int = 0):
+        # Prefixes are not necessarily folders: start from the deepest folder
+        # they name and only descend into its sub-folders that match the
+        # rest of the prefix, so a sample of a folder doesn't walk its
+        # siblings. Keys are relative to the root, so a leading '/' is
+        # dropped as in _path, and a prefix that points outside the root
+        # holds no objects
+        prefix = prefix.lstrip('/')
+        try:
+            folder = self._path(prefix.rsplit('/', 1)[0]) if '/' in prefix else self.root
+        except ValueError:
+            return
+        if not folder.is_dir():
+            return
+        partial_name = prefix.rsplit('/', 1)[-1]
+
+        count = 0
+        for dirpath, dirnames, filenames in os.walk(folder):
+            if partial_name and dirpath == str(folder):
+                dirnames[:] = [name for name in dirnames if name.startswith(partial_name)]
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if filename.startswith('.'):
+                    continue
+                path = Path(dirpath) / filename
+                key = self._key(path)
+                if not key.startswith(prefix):
+                    continue
+                stat = path.stat()
+                yield ObjectInfo(key, stat.st_size, f"{stat.st_mtime_ns:x}-{stat.st_size:x}")
+                count += 1
+                if max_keys and count >= max_keys:
+                    return
+
+    def list_prefixes(self, prefix: str = ""):
+        try:
+            folder = self._path(prefix) if prefix else self.root
+            if not folder.is_dir():
+                return []
+            return sorted(f"{self._key(child)}/" for child in folder.iterdir() if child.is_dir())
+        except (OSError, ValueError) as e:
+            print(f"Error listing prefixes: {e}")
             return []
 
 
 class S3Service:
-    """Unified S3 service that switches between MinIO and AWS S3"""
+    """Unified S3 service that switches between MinIO, AWS S3 and local storage"""
+
+    def __init__(self, backend: Optional[StorageBackend] = None):
+        if backend is not None:
+            self.backend = backend
+            return
 
-    def __init__(self):
         backend_type = settings.STORAGE_BACKEND.lower()
 
         if backend_type == "s3":
             self.backend = AWSS3Backend()
         elif backend_type == "minio":
             self.backend = MinIOBackend()
+        elif backend_type == "local":
+            self.backend = LocalBackend()
         else:
-            raise ValueError(f"Invalid STORAGE_BACKEND: {backend_type}. Must be 'minio' or 's3'")
+            raise ValueError(f"Invalid STORAGE_BACKEND: {backend_type}. Must be 'minio', 's3' or 'local'")
+
+        # Remote backends only: local files gain nothing from a second copy
+        if backend_type != "local":
+            self.backend.cache = ObjectCache.from_settings()
+            if self.backend.cache is not None:
+                print(f"Using storage cache: {settings.STORAGE_CACHE_DIR} "
+                      f"({settings.STORAGE_CACHE_MAX_BYTES // (1024 * 1024)} MiB)")
 
     def upload_json(self, object_name: str, data: Dict[Any, Any]) -> bool:
         return self.backend.upload_json(object_name, data)
 
-    def get_json(self, object_name: str) -> Dict[Any, Any]:
-        return self.backend.get_json(object_name)
+    def get_json(self, object_name: str, etag: Optional[str] = None) -> Dict[Any, Any]:
+        return self.backend.get_json(object_name, etag)
+
+    def get_bytes(self, object_name: str) -> Optional[bytes]:
+        return self.backend.get_bytes(object_name)
+
+    def get_many(
+        self,
+        object_names: Iterable[Union[str, ObjectInfo]],
+        max_workers: Optional[int] = None,
+        slot: Optional[Callable[[], ContextManager]] = None
+    ) -> Iterator[GetResult]:
+        return self.backend.get_many(object_names, max_workers, slot)
+
+    def iter_jsonl(
+        self,
+        object_name: str,
+        slot: Optional[Callable[[], ContextManager]] = None
+    ) -> Iterator[Any]:
+        return self.backend.iter_jsonl(object_name, slot)
+
+    def limiter_stats(self) -> Dict[str, Any]:
+        """Current adaptive concurrency limit and throttled request count"""
+        return self.backend.limiter.stats()
+
+    def cache_stats(self) -> Optional[Dict[str, int]]:
+        """Hit/miss and size counters of the object cache, if enabled"""
+        return self.backend.cache.stats() if self.backend.cache is not None else None
 
     def list_objects(self, prefix: str = "") -> list:
         return self.backend.list_objects(prefix)
 
+    def iter_objects(self, prefix: str = "", max_keys: int = 0) -> Iterator[ObjectInfo]:
+        return self.backend.iter_objects(prefix, max_keys)
+
+    def list_prefixes(self, prefix: str = "") -> List[str]:
+        return self.backend.list_prefixes(prefix)
+
 
 # Global instance
 s3_service = S3Service()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Ingestion throughput benchmark
+Usage: python benchmark_ingestion.py [--pairs N] [--baseline FILE] [--save-baseline] [--migrate]
+
+Generates N synthetic en/es pairs in a temporary local object store
+(STORAGE_BACKEND=local layout), runs the S3 ingestion pipeline against the
+database in DATABASE_URL (use a local Postgres, never production) and
+reports pairs/sec, per-stage time and peak RSS. The benchmark rows are
+deleted afterwards unless --keep is given. The database must already be
+at the latest migration; --migrate upgrades it first (only point it at a
+scratch database).
+
+Only load_from_s3 is measured. load_sample_data.py is a one-off seeding
+script for the fixed sample_data folder (it uploads every file to MinIO
+and writes fixed execution IDs), and its database writes go through the
+same PromptCache / upsert_translations / refresh_report_aggregates path
+whose time shows up here as the prompts, insert, commit and aggregates
+stages.
+
+With --baseline, the run fails (exit code 1) when throughput drops more
+than --threshold below the stored baseline. --save-baseline writes the
+current result as the new baseline.
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+# The pipeline reads from the temporary local store, never from MinIO/S3
+os.environ.setdefault("STORAGE_BACKEND", "local")
+
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+from alembic.runtime.migration import MigrationContext  # noqa: E402
+from alembic.script import ScriptDirectory  # noqa: E402
+from app.database import SessionLocal, engine  # noqa: E402
+from app import models  # noqa: E402
+from app.ingestion import STAGES, LoadProgress, load_from_s3  # noqa: E402
+from app.s3_service import LocalBackend, S3Service  # noqa: E402
+
+DEFAULT_BASELINE = Path(__file__).parent / "benchmark_baseline.json"
+ALEMBIC_CONFIG = Path(__file__).parent / "alembic.ini"
+BENCH_PREFIX = "benchmark/llm-output/2099/01/latest"
+WORDS = (
+    "revenue spending savings balance account monthly increase decrease category "
+    "transfer income budget groceries travel subscription payment trend average"
+).split()
+
+
+def synthetic_text(rng, sentences):
+    return " ".join(
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 20))).capitalize() + "."
+        for _ in range(sentences)
+    )
+
+
+def generate_pairs(root, pairs, prompts, seed):
+    """Write `pairs` synthetic en/es JSON pairs under root/BENCH_PREFIX"""
+    rng = random.Random(seed)
+    storage = LocalBackend(root)
+
+    for i in range(pairs):
+        translation_id = uuid.UUID(int=rng.getrandbits(128)).hex
+        prompt_number = i % prompts
+        en_data = {
+            "prompt_id": f"benchmark_prompt_{prompt_number}",
+            "prompt_name": f"Benchmark prompt {prompt_number}",
+            "summary": synthetic_text(rng, 3),
+            **{f"insight{n}": {"text": synthetic_text(rng, 4)} for n in range(1, 4)},
+        }
+        es_data = {
+            "summary": synthetic_text(rng, 3),
+            **{f"insight{n}": {"text": synthetic_text(rng, 4)} for n in range(1, 4)},
+            "score": {
+                "coherence": round(rng.uniform(0.5, 1), 2),
+                "fidelity": round(rng.uniform(0.5, 1), 2),
+                "naturalness": round(rng.uniform(0.5, 1), 2),
+                "overall": round(rng.uniform(0.5, 1), 2),
+            },
+        }
+        storage.upload_json(f"{BENCH_PREFIX}/en/{translation_id}.json", en_data)
+        storage.upload_json(f"{BENCH_PREFIX}/es/{translation_id}.json", es_data)
+
+    return storage
+
+
+def cleanup(execution_id):
+    """Delete the rows written by the benchmark run"""
+    db = SessionLocal()
+    try:
+        db.query(models.Translation).filter(
+            models.Translation.execution_id == execution_id
+        ).delete(synchronize_session=False)
+        db.query(models.S3ObjectManifest).filter(
+            models.S3ObjectManifest.execution_id == execution_id
+        ).delete(synchronize_session=False)
+        db.query(models.ReportAggregate).filter(
+            models.ReportAggregate.execution_id == execution_id
+        ).delete(synchronize_session=False)
+        db.query(models.Execution).filter(
+            models.Execution.id == execution_id
+        ).delete(synchronize_session=False)
+        unused_prompts = db.query(models.Prompt.id).filter(
+            models.Prompt.prompt_id.like("benchmark_prompt_%"),
+            ~models.Prompt.translations.any()
+        )
+        db.query(models.Prompt).filter(
+            models.Prompt.id.in_(unused_prompts.scalar_subquery())
+        ).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def schema_is_current():
+    """Whether the database in DATABASE_URL is at the latest migration"""
+    heads = ScriptDirectory.from_config(Config(str(ALEMBIC_CONFIG))).get_heads()
+    with engine.connect() as connection:
+        current = MigrationContext.configure(connection).get_current_heads()
+    return set(current) == set(heads)
+
+
+def run_benchmark(args):
+    root = tempfile.mkdtemp(prefix="ingestion-bench-")
+
+    try:
+        print(f"Generating {args.pairs} synthetic pairs in {root}...")
+        start = time.perf_counter()
+        storage = S3Service(backend=generate_pairs(root, args.pairs, args.prompts, args.seed))
+        print(f"  done in {time.perf_counter() - start:.1f}s")
+
+        description = f"benchmark {uuid.uuid4()}"
+        progress = LoadProgress()
+
+        print(f"Running ingestion (workers={args.workers or 'default'}, batch size={args.batch_size or 'default'})...")
+        start = time.perf_counter()
+        result = load_from_s3(
+            BENCH_PREFIX,
+            description,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            progress=progress,
+            storage=storage
+        )
+        elapsed = time.perf_counter() - start
+
+        if not args.keep:
+            cleanup(result["execution_id"])
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    snapshot = progress.snapshot()
+    return {
+        "pairs": args.pairs,
+        "translations_loaded": result["translations_loaded"],
+        "errors": snapshot["error_count"],
+        "elapsed_seconds": round(elapsed, 3),
+        "pairs_per_second": round(result["translations_loaded"] / elapsed, 2) if elapsed > 0 else 0.0,
+        "stage_seconds": snapshot["stage_seconds"],
+        "object_latency_ms": snapshot["object_latency_ms"],
+        "bytes_per_second": snapshot["bytes_per_second"],
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def print_report(report):
+    print(f"\n{'='*60}")
+    print("Ingestion benchmark")
+    print(f"{'='*60}")
+    print(f"   Pairs:               {report['pairs']}")
+    print(f"   Translations loaded: {report['translations_loaded']}")
+    print(f"   Errors:              {report['errors']}")
+    print(f"   Wall time:           {report['elapsed_seconds']}s")
+    print(f"   Throughput:          {report['pairs_per_second']} pairs/s")
+    print(f"   Peak RSS:            {report['peak_rss_mb']} MB")
+    print(f"   Object latency:      p50 {report['object_latency_ms']['p50']} ms, "
+          f"p95 {report['object_latency_ms']['p95']} ms")
+    print(f"   Read throughput:     {report['bytes_per_second'] / (1024 * 1024):.2f} MiB/s")
+    print("\n   Stage time (fetch and decode add up all concurrent objects):")
+    for stage in STAGES:
+        print(f"      {stage:<10} {report['stage_seconds'].get(stage, 0.0):.3f}s")
+
+
+def check_baseline(report, baseline_path, threshold):
+    """Return False when throughput regressed beyond the threshold"""
+    if not baseline_path.exists():
+        print(f"\n⚠️  No baseline at {baseline_path}; run with --save-baseline to create one")
+        return True
+
+    baseline = json.loads(baseline_path.read_text())
+    expected = baseline["pairs_per_second"]
+    floor = expected * (1 - threshold)
+    change = (report["pairs_per_second"] - expected) / expected * 100 if expected else 0.0
+
+    print(f"\n   Baseline:            {expected} pairs/s ({change:+.1f}%)")
+    if report["pairs_per_second"] < floor:
+        print(f"❌ Throughput regression: {report['pairs_per_second']} < {floor:.2f} pairs/s "
+              f"(baseline - {threshold:.0%})")
+        return False
+
+    print("✅ Throughput within threshold")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark S3 ingestion throughput")
+    parser.add_argument("--pairs", type=int, default=2000, help="Synthetic en/es pairs to load (default: 2000)")
+    parser.add_argument("--prompts", type=int, default=3, help="Distinct prompts in the data (default: 3)")
+    parser.add_argument("--workers", type=int, default=None, help="Fetch workers (default: S3_LOAD_WORKERS)")
+    parser.add_argument("--batch-size", type=int, default=None, help="Insert batch size (default: S3_LOAD_BATCH_SIZE)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the synthetic data")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Allowed throughput drop vs. baseline, as a fraction (default: 0.2)")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument("--keep", action="store_true", help="Keep the benchmark rows in the database")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--migrate", action="store_true",
+                        help="Upgrade the database to the latest migration first (scratch databases only)")
+    args = parser.parse_args()
+
+    if args.migrate:
+        command.upgrade(Config(str(ALEMBIC_CONFIG)), "head")
+    elif not schema_is_current():
+        print("❌ The database is not at the latest migration; run 'alembic upgrade head' "
+              "or pass --migrate (scratch databases only)")
+        sys.exit(2)
+
+    report = run_benchmark(args)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\n💾 Baseline saved to {args.baseline}")
+        sys.exit(0)
+
+    sys.exit(0 if check_baseline(report, args.baseline, args.threshold) else 1)
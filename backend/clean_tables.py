@@ -2,8 +2,11 @@
 Script to clean (truncate) specific tables in the PostgreSQL database.
 This script removes all data from the following tables:
 - prompts
+- executions
+- report_aggregates
 - translations
 - manual_scores
+- s3_object_manifest
 
 The tables are truncated in the correct order to respect foreign key constraints.
 """
@@ -16,7 +19,8 @@ from app.config import get_settings
 
 def clean_tables():
     """
-    Truncate the prompts, translations, and manual_scores tables.
+    Truncate the prompts, executions, report_aggregates, translations, manual_scores and
+    s3_object_manifest tables.
     Tables are truncated in order to respect foreign key constraints.
     """
 
@@ -29,7 +33,10 @@ def clean_tables():
     print("\nTables to be cleaned (all data will be deleted):")
     print("  - manual_scores")
     print("  - translations")
+    print("  - report_aggregates")
+    print("  - executions")
     print("  - prompts")
+    print("  - s3_object_manifest")
     print("\n" + "=" * 60)
 
     # Ask for confirmation
@@ -56,10 +63,23 @@ def clean_tables():
                 connection.execute(text("TRUNCATE TABLE translations CASCADE"))
                 print("  ✓ Cleaned translations")
 
+                # Report aggregates (depend on executions and prompts)
+                connection.execute(text("TRUNCATE TABLE report_aggregates CASCADE"))
+                print("  ✓ Cleaned report_aggregates")
+
+                # Executions next (translations reference them)
+                connection.execute(text("TRUNCATE TABLE executions CASCADE"))
+                print("  ✓ Cleaned executions")
+
                 # Prompts last
                 connection.execute(text("TRUNCATE TABLE prompts CASCADE"))
                 print("  ✓ Cleaned prompts")
 
+                # S3 manifest too, or the next incremental sync would skip
+                # every object as already loaded
+                connection.execute(text("TRUNCATE TABLE s3_object_manifest"))
+                print("  ✓ Cleaned s3_object_manifest")
+
                 # Commit transaction
                 trans.commit()
 
@@ -1,219 +1,196 @@
 #!/usr/bin/env python3
 """
 Script to load data directly from AWS S3 into the database
-Usage: python load_from_s3.py <s3_prefix> <description>
+Usage: python load_from_s3.py <s3_prefix> <description> [--workers N] [--batch-size N]
+       [--source-language CODE] [--incremental | --scores-only]
+
+--scores-only re-reads the same source/target objects as a full load (the
+scores may be in either) but only updates the automated score columns.
+
+The loading logic lives in app.ingestion so the admin API can run it
+in-process as a background job.
 """
-import sys
-import hashlib
-import uuid
-from pathlib import Path
+import argparse
 from app.database import SessionLocal
 from app import models
+from app.config import get_settings
+from app.ingestion import STAGES, LoadProgress, load_from_s3, load_scores_from_s3
 from app.s3_service import s3_service
 
+settings = get_settings()
+
+
+def print_performance(snapshot):
+    """Print where the run spent its time (from a progress snapshot)"""
+    counters = snapshot["counters"]
+    latency = snapshot["object_latency_ms"]
+    print(f"\n⏱️  Performance:")
+    print(f"   Wall time: {snapshot['elapsed_seconds']}s ({snapshot['pairs_per_second']} pairs/s)")
+    print(f"   Objects fetched: {counters.get('objects_fetched', 0)} "
+          f"({counters.get('bytes_fetched', 0) / (1024 * 1024):.1f} MiB, "
+          f"{snapshot['bytes_per_second'] / (1024 * 1024):.2f} MiB/s)")
+    print(f"   Object latency: p50 {latency['p50']} ms, p95 {latency['p95']} ms, max {latency['max']} ms")
+    print(f"   Batches written: {counters.get('batches_written', 0)} ({counters.get('rows_written', 0)} rows)")
+    print(f"   Stage time (fetch and decode add up all concurrent objects):")
+    for stage in STAGES:
+        if stage in snapshot["stage_seconds"]:
+            print(f"      {stage:<10} {snapshot['stage_seconds'][stage]:.3f}s")
+
+
+def print_summary(result, progress):
+    """Print the end-of-run summary"""
+    if not result["pairs_found"]:
+        return
+
+    print(f"\n{'='*60}")
+    print(f"✅ Successfully loaded {result['translations_loaded']} translation(s) from S3!")
+    print(f"{'='*60}")
+
+    print(f"\n📊 Summary:")
+    print(f"   Execution ID: {result['execution_id']}")
+    print(f"   Languages: {result['source_language']} -> {', '.join(result['target_languages'])}")
+    print(f"   Translations loaded: {result['translations_loaded']}")
+    print(f"   Translations updated: {result['translations_updated']}")
+    print(f"   Pairs unchanged: {result['pairs_unchanged']}")
+    if result['shards_found'] or result['shards_unchanged']:
+        print(f"   JSON Lines shards loaded: {result['shards_found']} ({result['shards_unchanged']} unchanged)")
+    print(f"   Prompts created: {result['prompts_created']}")
+    print(f"   Pairs skipped: {result['pairs_skipped']}")
+    print(f"   Pairs failed: {result['pairs_failed']}")
+    limiter_stats = s3_service.limiter_stats()
+    if limiter_stats['throttled']:
+        print(f"   Throttled requests: {limiter_stats['throttled']} "
+              f"(concurrency limit now {limiter_stats['limit']}/{limiter_stats['max_limit']})")
+    cache_stats = s3_service.cache_stats()
+    if cache_stats:
+        print(f"   Storage cache: {cache_stats['hits']} hit(s), {cache_stats['misses']} miss(es), "
+              f"{cache_stats['bytes'] // (1024 * 1024)}/{cache_stats['max_bytes'] // (1024 * 1024)} MiB used")
+    print_performance(progress.snapshot())
+    if progress.errors:
+        print(f"\n❌ Errors:")
+        for translation_id, error in progress.errors:
+            print(f"   {translation_id}: {error}")
 
-def extract_text_content(data):
-    """Extract summary and insight texts from JSON"""
-    texts = []
-
-    # Add summary
-    if 'summary' in data:
-        texts.append(data['summary'])
-
-    # Add insight texts
-    for i in range(1, 4):
-        insight_key = f'insight{i}'
-        if insight_key in data and 'text' in data[insight_key]:
-            texts.append(data[insight_key]['text'])
-
-    return '\n\n'.join(texts)
-
-
-def load_from_s3(prefix, description):
-    """Load all translations from S3 with given prefix and description"""
     db = SessionLocal()
-
-    # Remove trailing slash for consistency
-    prefix = prefix.strip().rstrip('/')
-
     try:
-        # Generate execution_id from prefix + description (deterministic UUID)
-        combined = f"{prefix}|{description}"
-        combined_hash = hashlib.md5(combined.encode()).hexdigest()
-        execution_id = str(uuid.UUID(combined_hash))
-
-        print(f"\n📋 Execution ID: {execution_id}")
-        print(f"   (generated from prefix + description hash)")
-
-        # Check if this execution_id already exists
-        existing_count = db.query(models.Translation).filter(
-            models.Translation.execution_id == execution_id
-        ).count()
-
-        if existing_count > 0:
-            print(f"\n⚠️  Translations from this prefix already loaded!")
-            print(f"   Execution ID: {execution_id}")
-            print(f"   Existing translations: {existing_count}")
-            print(f"\n   Skipping load to avoid duplicates.")
-            return
-
-        # List all objects in S3 for the given prefix
-        print(f"\n🔍 Scanning S3 for prefix: {prefix}")
-        all_objects = s3_service.list_objects(prefix=prefix)
-
-        # Get English and Spanish files separately
-        en_files = [obj for obj in all_objects if '/en/' in obj and obj.endswith('.json')]
-        es_files = [obj for obj in all_objects if '/es/' in obj and obj.endswith('.json')]
-
-        # Create a set of translation IDs that have Spanish translations
-        es_ids = set()
-        for es_path in es_files:
-            translation_id = es_path.split('/')[-1].replace('.json', '')
-            es_ids.add(translation_id)
-
-        # Filter English files to only those with Spanish translations
-        en_files_with_translation = []
-        for en_path in en_files:
-            translation_id = en_path.split('/')[-1].replace('.json', '')
-            if translation_id in es_ids:
-                en_files_with_translation.append(en_path)
-
-        print(f"✓ Found {len(en_files)} English files")
-        print(f"✓ Found {len(es_files)} Spanish files")
-        print(f"✓ Found {len(en_files_with_translation)} complete translation pairs\n")
-
-        if not en_files_with_translation:
-            print("⚠️  No complete translation pairs found in S3.")
-            print("   Make sure you have matching files in:")
-            print("   s3://your-bucket/base-path/llm-output/2025/10/latest/en/*.json")
-            print("   s3://your-bucket/base-path/llm-output/2025/10/latest/es/*.json")
-            return
-
-        # Process each translation
-        loaded_count = 0
-        prompts_created = set()
-
-        for idx, en_path in enumerate(en_files_with_translation):
-            try:
-                # Extract translation ID
-                translation_id = en_path.split('/')[-1].replace('.json', '')
-
-                # Construct ES path
-                es_path = en_path.replace('/en/', '/es/')
-
-                print(f"[{idx + 1}/{len(en_files_with_translation)}] Processing: {translation_id}")
-
-                # Load English original from S3
-                en_data = s3_service.get_json(en_path)
-                if not en_data:
-                    print(f"  ⚠️  Could not load English file, skipping...")
-                    continue
-
-                # Load Spanish translation from S3
-                es_data = s3_service.get_json(es_path)
-                if not es_data:
-                    print(f"  ⚠️  Could not load Spanish file, skipping...")
-                    continue
-
-                # Extract fields from JSON
-                original_content = en_data.get('original_content') or en_data.get('original') or extract_text_content(en_data)
-                translated_content = es_data.get('translated_content') or es_data.get('translation') or extract_text_content(es_data)
-                prompt_id_str = en_data.get('prompt_id', 'default')
-                prompt_name = en_data.get('prompt_name', prompt_id_str)
-
-                # Get or create prompt
-                prompt = db.query(models.Prompt).filter(
-                    models.Prompt.prompt_id == prompt_id_str
-                ).first()
-
-                if not prompt:
-                    prompt = models.Prompt(
-                        prompt_id=prompt_id_str,
-                        name=prompt_name,
-                        description=f"Auto-created from S3 import: {prefix}"
-                    )
-                    db.add(prompt)
-                    db.flush()
-                    prompts_created.add(prompt_id_str)
-                    print(f"  ✓ Created prompt: {prompt_name}")
-
-                # Extract automated scores
-                automated_scores = en_data.get('automated_scores') or es_data.get('automated_scores') or es_data.get('score', {})
-                coherence = automated_scores.get('coherence', 0)
-                fidelity = automated_scores.get('fidelity', 0)
-                naturalness = automated_scores.get('naturalness', 0)
-                overall = automated_scores.get('overall', 0)
-
-                if coherence or fidelity or naturalness:
-                    print(f"  ✓ Scores: coherence={coherence}, fidelity={fidelity}, naturalness={naturalness}")
-                else:
-                    print(f"  ⚠️  No scores found, using defaults")
-
-                # Create translation
-                translation = models.Translation(
-                    execution_id=execution_id,
-                    execution_description=description,
-                    prompt_id=prompt.id,
-                    original_content=original_content,
-                    translated_content=translated_content,
-                    source_language="en",
-                    target_language="es",
-                    automated_coherence=coherence,
-                    automated_fidelity=fidelity,
-                    automated_naturalness=naturalness,
-                    automated_overall=overall,
-                    s3_insights_path=en_path,
-                    s3_automated_qa_path=es_path
-                )
-                db.add(translation)
-                db.commit()
-                print(f"  ✓ Created translation for {translation_id}")
-                loaded_count += 1
-
-            except Exception as e:
-                print(f"  ❌ Error processing {en_path}: {e}")
-                db.rollback()
-                continue
-
-        print(f"\n{'='*60}")
-        print(f"✅ Successfully loaded {loaded_count} translation(s) from S3!")
-        print(f"{'='*60}")
-
-        # Print summary
-        total_translations = db.query(models.Translation).count()
-        print(f"\n📊 Summary:")
-        print(f"   Execution ID: {execution_id}")
-        print(f"   Translations loaded: {loaded_count}")
-        print(f"   Prompts created: {len(prompts_created)}")
         print(f"\n📊 Database Totals:")
         print(f"   Total Prompts: {db.query(models.Prompt).count()}")
-        print(f"   Total Translations: {total_translations}")
-
-    except Exception as e:
-        print(f"\n{'='*60}")
-        print(f"❌ Error loading from S3: {e}")
-        print(f"{'='*60}")
-        db.rollback()
-        raise
+        print(f"   Total Translations: {db.query(models.Translation).count()}")
     finally:
         db.close()
 
 
-if __name__ == "__main__":
-    if len(sys.argv) < 3:
-        print("\n❌ Usage: python load_from_s3.py <s3_prefix> <description>")
-        print("\nExample:")
-        print("   docker compose exec backend python load_from_s3.py 'translations/batch-01' 'October 2024 batch'")
-        print("   docker compose exec backend python load_from_s3.py 'translations/llm-output/2025/10/latest' 'Latest translations'")
-        sys.exit(1)
+def print_scores_summary(result, progress):
+    """Print the end-of-run summary of a scores-only re-import"""
+    print(f"\n{'='*60}")
+    print(f"✅ Updated automated scores of {result['translations_updated']} translation(s)")
+    print(f"{'='*60}")
+
+    print(f"\n📊 Summary:")
+    print(f"   Execution ID: {result['execution_id']}")
+    print(f"   Score pairs/records read: {result['scores_found']}")
+    print(f"   Without a loaded translation: {result['scores_unmatched']}")
+    print(f"   Skipped (no scores): {result['scores_skipped']}")
+    print(f"   Failed: {result['scores_failed']}")
+    print_performance(progress.snapshot())
+    if progress.errors:
+        print(f"\n❌ Errors:")
+        for key, error in progress.errors:
+            print(f"   {key}: {error}")
 
-    prefix = sys.argv[1]
-    description = sys.argv[2]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Load translations from S3",
+        epilog=(
+            "Example:\n"
+            "   docker compose exec backend python load_from_s3.py 'translations/batch-01' 'October 2024 batch'\n"
+            "   docker compose exec backend python load_from_s3.py 'translations/llm-output/2025/10/latest' 'Latest translations'"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("prefix", help="S3 prefix containing one folder per language (en/, es/, ...)")
+    parser.add_argument("description", help="Execution description")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.S3_LOAD_WORKERS,
+        help=f"Number of concurrent fetch workers (default: {settings.S3_LOAD_WORKERS})"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help=(
+            f"Translations written per transaction (default: {settings.S3_LOAD_BATCH_SIZE}, "
+            f"or {settings.S3_SCORES_BATCH_SIZE} with --scores-only)"
+        )
+    )
+    parser.add_argument(
+        "--source-language",
+        default=settings.SOURCE_LANGUAGE,
+        help=(
+            f"Folder holding the originals (default: {settings.SOURCE_LANGUAGE}); "
+            "every other language folder is loaded as a target"
+        )
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Sync an already loaded execution: only load new or changed objects"
+    )
+    mode.add_argument(
+        "--scores-only",
+        action="store_true",
+        help=(
+            "Re-import only the automated scores of an already loaded execution: source and "
+            "target objects of every target language are still read in full, but only the "
+            "score columns are written"
+        )
+    )
+    args = parser.parse_args()
+    progress = LoadProgress()
 
     print("="*60)
     print("Loading translations from AWS S3...")
     print("="*60)
-    print(f"Prefix: {prefix}")
-    print(f"Description: {description}")
+    print(f"Prefix: {args.prefix}")
+    print(f"Description: {args.description}")
+    if args.incremental:
+        print("Mode: incremental sync")
+    if args.scores_only:
+        print("Mode: automated scores only")
+
+    try:
+        if args.scores_only:
+            result = load_scores_from_s3(
+                args.prefix,
+                args.description,
+                workers=args.workers,
+                batch_size=args.batch_size,
+                progress=progress,
+                verbose=True,
+                source_language=args.source_language
+            )
+        else:
+            result = load_from_s3(
+                args.prefix,
+                args.description,
+                workers=args.workers,
+                batch_size=args.batch_size,
+                incremental=args.incremental,
+                progress=progress,
+                verbose=True,
+                source_language=args.source_language
+            )
+    except Exception as e:
+        print(f"\n{'='*60}")
+        print(f"❌ Error loading from S3: {e}")
+        print(f"{'='*60}")
+        raise
 
-    load_from_s3(prefix, description)
+    if args.scores_only:
+        print_scores_summary(result, progress)
+    else:
+        print_summary(result, progress)
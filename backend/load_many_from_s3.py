@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Script to load several S3 prefixes (one execution each) in parallel
+Usage: python load_many_from_s3.py <description> <s3_prefix> [<s3_prefix> ...] [--discover]
+       [--fetch-workers N] [--db-connections N] [--source-language CODE] [--incremental]
+
+All executions share one budget of concurrent object fetches and DB writes,
+split fairly between them, so a large prefix can't starve the small ones.
+"""
+import argparse
+import threading
+from app.config import get_settings
+from app.ingestion import MultiLoadProgress, discover_prefixes, load_many_from_s3
+from load_from_s3 import print_performance
+
+settings = get_settings()
+
+# Seconds between progress lines
+PROGRESS_INTERVAL = 5
+
+
+def print_progress(progress):
+    snapshot = progress.snapshot()
+    latency = snapshot["object_latency_ms"]
+    print(f"\n⏳ {snapshot['processed']}/{snapshot['total']} pair(s), "
+          f"{snapshot['pairs_per_second']} pairs/s, "
+          f"object p50/p95 {latency['p50']}/{latency['p95']} ms, {snapshot['error_count']} error(s)")
+    for execution in snapshot["executions"]:
+        print(f"   {execution['prefix']}: {execution['phase']}, "
+              f"{execution['processed']}/{execution['total']} pair(s)")
+
+
+def print_summary(result, progress):
+    print(f"\n{'='*60}")
+    print(f"✅ Loaded {len(result['executions'])} execution(s), {len(result['failed'])} failed")
+    print(f"{'='*60}")
+
+    for execution in result["executions"]:
+        print(f"\n📊 {execution['prefix']}")
+        print(f"   Execution ID: {execution['execution_id']}")
+        print(f"   Languages: {execution['source_language']} -> {', '.join(execution['target_languages'])}")
+        print(f"   Translations loaded: {execution['translations_loaded']}")
+        print(f"   Translations updated: {execution['translations_updated']}")
+        print(f"   Pairs unchanged: {execution['pairs_unchanged']}")
+        print(f"   Pairs skipped: {execution['pairs_skipped']}")
+        print(f"   Pairs failed: {execution['pairs_failed']}")
+
+    for failure in result["failed"]:
+        print(f"\n❌ {failure['prefix']}: {failure['error']}")
+
+    print_performance(progress.snapshot())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Load several S3 prefixes in parallel",
+        epilog=(
+            "Example:\n"
+            "   docker compose exec backend python load_many_from_s3.py 'October runs' "
+            "'translations/llm-output/2025/10/01' 'translations/llm-output/2025/10/02'\n"
+            "   docker compose exec backend python load_many_from_s3.py 'October runs' "
+            "'translations/llm-output/2025/10' --discover"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("description", help="Execution description (shared by all prefixes)")
+    parser.add_argument("prefixes", nargs="+", help="S3 prefixes containing one folder per language (en/, es/, ...)")
+    parser.add_argument(
+        "--discover",
+        action="store_true",
+        help="Treat the prefixes as parents and load every sub-folder with source and target language folders"
+    )
+    parser.add_argument(
+        "--source-language",
+        default=settings.SOURCE_LANGUAGE,
+        help=f"Folder holding the originals (default: {settings.SOURCE_LANGUAGE})"
+    )
+    parser.add_argument(
+        "--fetch-workers",
+        type=int,
+        default=settings.INGESTION_FETCH_BUDGET,
+        help=f"Concurrent object fetches shared by all executions (default: {settings.INGESTION_FETCH_BUDGET})"
+    )
+    parser.add_argument(
+        "--db-connections",
+        type=int,
+        default=settings.INGESTION_DB_CONNECTIONS,
+        help=f"Concurrent batch writes shared by all executions (default: {settings.INGESTION_DB_CONNECTIONS})"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only load new or changed objects of already loaded executions"
+    )
+    args = parser.parse_args()
+
+    prefixes = args.prefixes
+    if args.discover:
+        prefixes = [
+            found for parent in prefixes
+            for found in discover_prefixes(parent, source_language=args.source_language)
+        ]
+        if not prefixes:
+            print(f"❌ No prefixes with {args.source_language}/ and target language folders found")
+            raise SystemExit(1)
+
+    print("="*60)
+    print(f"Loading {len(prefixes)} prefix(es) from S3...")
+    print("="*60)
+    for prefix in prefixes:
+        print(f"   {prefix}")
+    print(f"Description: {args.description}")
+    print(f"Fetch workers: {args.fetch_workers}, DB connections: {args.db_connections}")
+
+    progress = MultiLoadProgress()
+    outcome = {}
+
+    def run():
+        try:
+            outcome["result"] = load_many_from_s3(
+                prefixes,
+                args.description,
+                fetch_workers=args.fetch_workers,
+                db_connections=args.db_connections,
+                incremental=args.incremental,
+                progress=progress,
+                source_language=args.source_language
+            )
+        except Exception as e:
+            outcome["error"] = e
+
+    loader = threading.Thread(target=run, name="load-many")
+    loader.start()
+    while loader.is_alive():
+        loader.join(PROGRESS_INTERVAL)
+        if loader.is_alive():
+            print_progress(progress)
+
+    if "error" in outcome:
+        print(f"\n{'='*60}")
+        print(f"❌ Error loading from S3: {outcome['error']}")
+        print(f"{'='*60}")
+        raise outcome["error"]
+
+    print_summary(outcome["result"], progress)
+    if outcome["result"]["failed"]:
+        raise SystemExit(1)
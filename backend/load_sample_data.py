@@ -2,18 +2,19 @@
 """
 Script to load sample data into the database and MinIO
 """
-import json
 import os
 from pathlib import Path
 from app.database import SessionLocal
 from app import models
-from app.s3_service import s3_service
+from app.ingestion import PromptCache, ensure_execution, extract_text_content, upsert_translations
+from app.report_aggregates import refresh_report_aggregates
+from app.s3_service import json_loads, s3_service
 
 
 def load_json_file(filepath):
     """Load JSON data from file"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        return json_loads(f.read())
 
 
 def upload_to_minio(local_path, s3_path):
@@ -23,23 +24,6 @@ def upload_to_minio(local_path, s3_path):
     return s3_path
 
 
-def extract_text_content(data):
-    """Extract summary and insight texts from JSON"""
-    texts = []
-
-    # Add summary
-    if 'summary' in data:
-        texts.append(data['summary'])
-
-    # Add insight texts
-    for i in range(1, 4):
-        insight_key = f'insight{i}'
-        if insight_key in data and 'text' in data[insight_key]:
-            texts.append(data[insight_key]['text'])
-
-    return '\n\n'.join(texts)
-
-
 def load_sample_data():
     """Load all sample data"""
     db = SessionLocal()
@@ -54,22 +38,15 @@ def load_sample_data():
             }
         ]
 
-        prompts = {}
+        # Load all prompts once and create the missing ones in one statement
+        prompt_cache = PromptCache(db)
+        prompts = prompt_cache.resolve({
+            prompt_data["prompt_id"]: prompt_data for prompt_data in prompts_data
+        })
         for prompt_data in prompts_data:
-            # Check if prompt exists
-            existing = db.query(models.Prompt).filter(
-                models.Prompt.prompt_id == prompt_data["prompt_id"]
-            ).first()
-
-            if not existing:
-                prompt = models.Prompt(**prompt_data)
-                db.add(prompt)
-                db.commit()
-                db.refresh(prompt)
-                prompts[prompt_data["prompt_id"]] = prompt
+            if prompt_data["prompt_id"] in prompt_cache.created:
                 print(f"Created prompt: {prompt_data['name']}")
             else:
-                prompts[prompt_data["prompt_id"]] = existing
                 print(f"Prompt already exists: {prompt_data['name']}")
 
         # Load sample data files
@@ -109,6 +86,8 @@ def load_sample_data():
 
             # Upload to MinIO and create translations
             execution_id = f"exec_{year}_{month}"
+            ensure_execution(db, execution_id, f"Sample data {year}/{month}", f"llm-output/{year}/{month}/latest")
+            rows = []
 
             for idx, translation_id in enumerate(translation_ids):
                 print(f"\n  Processing translation {idx + 1}/{len(translation_ids)}: {translation_id}")
@@ -142,24 +121,28 @@ def load_sample_data():
                 s3_es_path = upload_to_minio(es_file_path, f"llm-output/{year}/{month}/latest/es/{translation_id}.json")
                 print(f"    Uploaded to MinIO: {translation_id}")
 
-                # Create translation
-                translation = models.Translation(
-                    execution_id=execution_id,
-                    prompt_id=prompts["prompt_001"].id,
-                    original_content=en_text,
-                    translated_content=es_text,
-                    source_language="en",
-                    target_language="es",
-                    automated_coherence=coherence,
-                    automated_fidelity=fidelity,
-                    automated_naturalness=naturalness,
-                    automated_overall=overall,
-                    s3_insights_path=s3_en_path,
-                    s3_automated_qa_path=s3_es_path
-                )
-                db.add(translation)
-                db.commit()
-                print(f"    Created translation for {translation_id}")
+                rows.append((translation_id, {
+                    'execution_id': execution_id,
+                    'prompt_id': prompts["prompt_001"],
+                    'original_content': en_text,
+                    'translated_content': es_text,
+                    'source_language': "en",
+                    'target_language': "es",
+                    'automated_coherence': coherence,
+                    'automated_fidelity': fidelity,
+                    'automated_naturalness': naturalness,
+                    'automated_overall': overall,
+                    's3_insights_path': s3_en_path,
+                    's3_automated_qa_path': s3_es_path,
+                    'source_key': translation_id,
+                }))
+
+            # Upsert by (execution_id, source_key, target_language): re-running the script updates in place
+            inserted, updated, errors = upsert_translations(db, rows)
+            print(f"\n  Created {inserted} and updated {updated} translation(s)")
+            for translation_id, error in errors:
+                print(f"  Error saving translation {translation_id}: {error}")
+            refresh_report_aggregates(db, execution_id)
 
         print("\nSample data loaded successfully!")
 
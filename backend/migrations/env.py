@@ -0,0 +1,50 @@
+"""
+Alembic environment: migrations run against DATABASE_URL with the app's
+models as the target metadata (for `alembic revision --autogenerate`).
+"""
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+from app import models  # noqa: F401  (registers the tables on Base.metadata)
+from app.config import get_settings
+from app.database import Base
+
+settings = get_settings()
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline():
+    """Emit the migration SQL without a database connection (alembic upgrade head --sql)"""
+    context.configure(
+        url=settings.DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    # A dedicated connection: migrations don't need the app's pool
+    connectable = create_engine(settings.DATABASE_URL, poolclass=pool.NullPool)
+
+    with connectable.connect() as connection:
+        context.configure(connection=connection, target_metadata=target_metadata)
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,95 @@
+"""Baseline schema: users, prompts, translations, manual_scores
+
+Databases created by the old Base.metadata.create_all at startup already
+have these tables; they are only created when missing, so such databases
+can simply run `alembic upgrade head`.
+
+Revision ID: 0001
+Revises:
+Create Date: 2025-11-03
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _has_table(name):
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade():
+    if not _has_table('users'):
+        op.create_table(
+            'users',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('username', sa.String(50), nullable=False),
+            sa.Column('email', sa.String(100), nullable=False),
+            sa.Column('hashed_password', sa.String(255), nullable=False),
+            sa.Column('is_admin', sa.Boolean()),
+            sa.Column('is_active', sa.Boolean()),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column('updated_at', sa.DateTime(timezone=True)),
+        )
+        op.create_index('ix_users_id', 'users', ['id'])
+        op.create_index('ix_users_username', 'users', ['username'], unique=True)
+        op.create_index('ix_users_email', 'users', ['email'], unique=True)
+
+    if not _has_table('prompts'):
+        op.create_table(
+            'prompts',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('prompt_id', sa.String(100), nullable=False),
+            sa.Column('name', sa.String(255), nullable=False),
+            sa.Column('description', sa.Text()),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+        op.create_index('ix_prompts_id', 'prompts', ['id'])
+        op.create_index('ix_prompts_prompt_id', 'prompts', ['prompt_id'], unique=True)
+
+    if not _has_table('translations'):
+        op.create_table(
+            'translations',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('execution_id', sa.String(100), nullable=False),
+            sa.Column('prompt_id', sa.Integer(), sa.ForeignKey('prompts.id'), nullable=False),
+            sa.Column('original_content', sa.Text(), nullable=False),
+            sa.Column('translated_content', sa.Text(), nullable=False),
+            sa.Column('source_language', sa.String(10), nullable=False),
+            sa.Column('target_language', sa.String(10), nullable=False),
+            sa.Column('automated_coherence', sa.Float()),
+            sa.Column('automated_fidelity', sa.Float()),
+            sa.Column('automated_naturalness', sa.Float()),
+            sa.Column('automated_overall', sa.Float()),
+            sa.Column('s3_insights_path', sa.String(500)),
+            sa.Column('s3_automated_qa_path', sa.String(500)),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+        op.create_index('ix_translations_id', 'translations', ['id'])
+        op.create_index('ix_translations_execution_id', 'translations', ['execution_id'])
+
+    if not _has_table('manual_scores'):
+        op.create_table(
+            'manual_scores',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('translation_id', sa.Integer(), sa.ForeignKey('translations.id'), nullable=False),
+            sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=False),
+            sa.Column('coherence', sa.Float()),
+            sa.Column('fidelity', sa.Float()),
+            sa.Column('naturalness', sa.Float()),
+            sa.Column('overall', sa.Float()),
+            sa.Column('notes', sa.Text()),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column('updated_at', sa.DateTime(timezone=True)),
+        )
+        op.create_index('ix_manual_scores_id', 'manual_scores', ['id'])
+
+
+def downgrade():
+    op.drop_table('manual_scores')
+    op.drop_table('translations')
+    op.drop_table('prompts')
+    op.drop_table('users')
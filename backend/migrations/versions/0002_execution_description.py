@@ -0,0 +1,25 @@
+"""Add translations.execution_description
+
+Replaces add_execution_description.py.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-11-03
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    columns = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('translations')}
+    if 'execution_description' not in columns:
+        op.add_column('translations', sa.Column('execution_description', sa.Text()))
+
+
+def downgrade():
+    op.drop_column('translations', 'execution_description')
@@ -0,0 +1,34 @@
+"""Add s3_object_manifest (objects loaded per execution, for incremental sync)
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-11-03
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if sa.inspect(op.get_bind()).has_table('s3_object_manifest'):
+        return
+
+    op.create_table(
+        's3_object_manifest',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('execution_id', sa.String(100), nullable=False),
+        sa.Column('object_key', sa.String(1024), nullable=False),
+        sa.Column('etag', sa.String(100)),
+        sa.Column('size', sa.BigInteger()),
+        sa.Column('loaded_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint('execution_id', 'object_key', name='uq_s3_object_manifest_execution_key'),
+    )
+    op.create_index('ix_s3_object_manifest_id', 's3_object_manifest', ['id'])
+
+
+def downgrade():
+    op.drop_table('s3_object_manifest')
@@ -0,0 +1,76 @@
+"""Add translations.source_key and the unique (execution_id, source_key, target_language)
+
+source_key is backfilled from s3_insights_path. When an execution holds
+the same ID twice for a target language, only the oldest row gets the key
+(the others keep NULL). A unique (execution_id, source_key) constraint left
+by add_source_key.py is replaced. Replaces add_source_key.py.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-11-03
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+# Translation ID from s3_insights_path: the record id after '#' for JSON
+# Lines shards, otherwise the file name without .json/.gz/.zst extensions
+SOURCE_KEY_FROM_PATH = r"""
+    CASE
+        WHEN s3_insights_path LIKE '%#%' THEN split_part(s3_insights_path, '#', 2)
+        ELSE regexp_replace(
+            regexp_replace(s3_insights_path, '^.*/', ''),
+            '\.(json|jsonl|ndjson)(\.(gz|zst))?$', ''
+        )
+    END
+"""
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    columns = {column['name'] for column in inspector.get_columns('translations')}
+    if 'source_key' not in columns:
+        op.add_column('translations', sa.Column('source_key', sa.String(255)))
+
+    constraints = {constraint['name'] for constraint in inspector.get_unique_constraints('translations')}
+    if 'uq_translations_execution_source_key' in constraints:
+        op.drop_constraint('uq_translations_execution_source_key', 'translations', type_='unique')
+
+    op.execute(f"""
+        UPDATE translations t
+        SET source_key = keyed.source_key
+        FROM (
+            SELECT id, source_key,
+                   row_number() OVER (
+                       PARTITION BY execution_id, target_language, source_key ORDER BY id
+                   ) AS position
+            FROM (
+                SELECT id, execution_id, target_language, {SOURCE_KEY_FROM_PATH} AS source_key
+                FROM translations
+                WHERE source_key IS NULL AND s3_insights_path IS NOT NULL
+            ) candidates
+        ) keyed
+        WHERE t.id = keyed.id AND keyed.position = 1
+        AND NOT EXISTS (
+            SELECT 1 FROM translations existing
+            WHERE existing.execution_id = t.execution_id
+            AND existing.target_language = t.target_language
+            AND existing.source_key = keyed.source_key
+        )
+    """)
+
+    if 'uq_translations_execution_source_key_target' not in constraints:
+        op.create_unique_constraint(
+            'uq_translations_execution_source_key_target',
+            'translations',
+            ['execution_id', 'source_key', 'target_language']
+        )
+
+
+def downgrade():
+    op.drop_constraint('uq_translations_execution_source_key_target', 'translations', type_='unique')
+    op.drop_column('translations', 'source_key')
@@ -0,0 +1,59 @@
+"""Composite indexes for the hot queries; one manual score per user and translation
+
+- manual_scores (translation_id, user_id), unique: the "has this user
+  scored this translation" lookup and the score joins of listings and
+  reports. Duplicate scores are removed first, keeping the most recently
+  updated one.
+- manual_scores (user_id): per-reviewer filters and contributor stats.
+- translations (execution_id, prompt_id): listings and reports filtered by
+  execution and prompt.
+- translations (execution_id, created_at): listings of an execution in
+  load order.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-11-03
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    score_constraints = {constraint['name'] for constraint in inspector.get_unique_constraints('manual_scores')}
+
+    if 'uq_manual_scores_translation_user' not in score_constraints:
+        op.execute("""
+            DELETE FROM manual_scores m
+            USING (
+                SELECT id, row_number() OVER (
+                    PARTITION BY translation_id, user_id
+                    ORDER BY COALESCE(updated_at, created_at) DESC NULLS LAST, id DESC
+                ) AS position
+                FROM manual_scores
+            ) ranked
+            WHERE m.id = ranked.id AND ranked.position > 1
+        """)
+        op.create_unique_constraint(
+            'uq_manual_scores_translation_user', 'manual_scores', ['translation_id', 'user_id']
+        )
+
+    op.execute("CREATE INDEX IF NOT EXISTS ix_manual_scores_user_id ON manual_scores (user_id)")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_translations_execution_prompt ON translations (execution_id, prompt_id)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_translations_execution_created ON translations (execution_id, created_at)"
+    )
+
+
+def downgrade():
+    op.drop_index('ix_translations_execution_created', table_name='translations')
+    op.drop_index('ix_translations_execution_prompt', table_name='translations')
+    op.drop_index('ix_manual_scores_user_id', table_name='manual_scores')
+    op.drop_constraint('uq_manual_scores_translation_user', 'manual_scores', type_='unique')
@@ -0,0 +1,62 @@
+"""Executions table with maintained counters; translations reference it
+
+Backfills one execution per distinct translations.execution_id (its
+description, translation and manual score counts, first and last load
+times), adds the foreign key and drops translations.execution_description.
+The source prefix of existing executions is unknown and left NULL; the
+next load of the prefix fills it in.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2025-11-04
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'executions',
+        sa.Column('id', sa.String(100), primary_key=True),
+        sa.Column('description', sa.Text()),
+        sa.Column('source_prefix', sa.String(1024)),
+        sa.Column('translation_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('manual_score_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('last_loaded_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+
+    op.execute("""
+        INSERT INTO executions (id, description, translation_count, manual_score_count, created_at, last_loaded_at)
+        SELECT t.execution_id,
+               max(t.execution_description),
+               count(*),
+               COALESCE(sum(scores.count), 0),
+               min(t.created_at),
+               max(t.created_at)
+        FROM translations t
+        LEFT JOIN (
+            SELECT translation_id, count(*) AS count FROM manual_scores GROUP BY translation_id
+        ) scores ON scores.translation_id = t.id
+        GROUP BY t.execution_id
+    """)
+
+    op.create_foreign_key(
+        'fk_translations_execution_id', 'translations', 'executions', ['execution_id'], ['id']
+    )
+    op.drop_column('translations', 'execution_description')
+
+
+def downgrade():
+    op.add_column('translations', sa.Column('execution_description', sa.Text()))
+    op.execute("""
+        UPDATE translations t SET execution_description = e.description
+        FROM executions e WHERE e.id = t.execution_id
+    """)
+    op.drop_constraint('fk_translations_execution_id', 'translations', type_='foreignkey')
+    op.drop_table('executions')
@@ -0,0 +1,68 @@
+"""report_aggregates: per-(execution, prompt) sums and counts for the reports
+
+Backfilled for every execution; from then on the scores API applies manual
+score changes as deltas and ingestion refreshes the execution's rows.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2025-11-04
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+METRICS = ('coherence', 'fidelity', 'naturalness', 'overall')
+
+
+def _metric_columns():
+    columns = []
+    for kind in ('automated', 'reviewed_automated', 'manual'):
+        for metric in METRICS:
+            columns.append(sa.Column(f'{kind}_{metric}_sum', sa.Float(), nullable=False, server_default='0'))
+            columns.append(sa.Column(f'{kind}_{metric}_count', sa.Integer(), nullable=False, server_default='0'))
+    return columns
+
+
+def upgrade():
+    op.create_table(
+        'report_aggregates',
+        sa.Column('execution_id', sa.String(100), sa.ForeignKey('executions.id'), primary_key=True),
+        sa.Column('prompt_id', sa.Integer(), sa.ForeignKey('prompts.id'), primary_key=True),
+        sa.Column('translation_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('reviewed_translation_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('manual_score_count', sa.Integer(), nullable=False, server_default='0'),
+        *_metric_columns(),
+    )
+
+    reviewed = "FILTER (WHERE s.translation_id IS NOT NULL)"
+    names = ['translation_count', 'reviewed_translation_count', 'manual_score_count']
+    selects = ['count(*)', 'count(s.translation_id)', 'COALESCE(sum(s.scores), 0)']
+    for metric in METRICS:
+        names += [f'automated_{metric}_sum', f'automated_{metric}_count']
+        selects += [f'COALESCE(sum(t.automated_{metric}), 0)', f'count(t.automated_{metric})']
+    for metric in METRICS:
+        names += [f'reviewed_automated_{metric}_sum', f'reviewed_automated_{metric}_count']
+        selects += [f'COALESCE(sum(t.automated_{metric}) {reviewed}, 0)', f'count(t.automated_{metric}) {reviewed}']
+    for metric in METRICS:
+        names += [f'manual_{metric}_sum', f'manual_{metric}_count']
+        selects += [f'COALESCE(sum(s.{metric}_sum), 0)', f'COALESCE(sum(s.{metric}_count), 0)']
+    score_totals = ', '.join(f'sum({metric}) AS {metric}_sum, count({metric}) AS {metric}_count' for metric in METRICS)
+
+    op.execute(f"""
+        INSERT INTO report_aggregates (execution_id, prompt_id, {', '.join(names)})
+        SELECT t.execution_id, t.prompt_id, {', '.join(selects)}
+        FROM translations t
+        LEFT JOIN (
+            SELECT translation_id, count(*) AS scores, {score_totals}
+            FROM manual_scores GROUP BY translation_id
+        ) s ON s.translation_id = t.id
+        GROUP BY t.execution_id, t.prompt_id
+    """)
+
+
+def downgrade():
+    op.drop_table('report_aggregates')
@@ -0,0 +1,81 @@
+"""
+Shared test fixtures.
+
+Tests that use the `db` fixture need a disposable PostgreSQL database in
+TEST_DATABASE_URL (it is migrated to head and emptied after every test);
+without it they are skipped. Objects are read from a local storage root.
+"""
+import os
+import tempfile
+from pathlib import Path
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL", "")
+
+# Settings are read when the app modules are imported, so point them at the
+# test database and storage first (environment variables win over .env)
+if TEST_DATABASE_URL:
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+    os.environ["ASYNC_DATABASE_URL"] = ""
+os.environ["STORAGE_BACKEND"] = "local"
+os.environ["LOCAL_STORAGE_ROOT"] = tempfile.mkdtemp(prefix="translator-qa-tests-")
+os.environ["STORAGE_CACHE_DIR"] = ""
+
+# Emptied after every test, dependents first
+TABLES = [
+    "manual_scores",
+    "report_aggregates",
+    "s3_object_manifest",
+    "translations",
+    "executions",
+    "prompts",
+    "users",
+]
+
+
+@pytest.fixture(scope="session")
+def database():
+    """Migrate the test database to head, once per run"""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+
+    from alembic import command
+    from alembic.config import Config
+
+    command.upgrade(Config(str(BACKEND_DIR / "alembic.ini")), "head")
+
+
+@pytest.fixture
+def db(database):
+    """A session on the test database; every table is emptied afterwards"""
+    from sqlalchemy import text
+    from app.database import SessionLocal
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.execute(text(f"TRUNCATE {', '.join(TABLES)} RESTART IDENTITY CASCADE"))
+        session.commit()
+        session.close()
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """An S3Service over an empty local storage root"""
+    from app.s3_service import LocalBackend, S3Service
+
+    return S3Service(backend=LocalBackend(str(tmp_path / "storage")))
+
+
+@pytest.fixture
+def upload_pair(storage):
+    """Upload a source object and one object per target language (language -> data)"""
+    def upload(prefix: str, translation_id: str, source: dict, targets: dict):
+        storage.upload_json(f"{prefix}/en/{translation_id}.json", source)
+        for language, data in targets.items():
+            storage.upload_json(f"{prefix}/{language}/{translation_id}.json", data)
+
+    return upload
@@ -0,0 +1,44 @@
+"""
+The executions row of a load: only created once a batch is written, with
+counters matching its translations.
+"""
+from app import models
+from app.ingestion import compute_execution_id, ensure_execution, load_from_s3
+
+PREFIX = "llm-output/2025/10/latest"
+
+
+def test_load_without_pairs_leaves_no_execution(db, storage):
+    # A source object without any target, and an unrelated prefix
+    storage.upload_json(f"{PREFIX}/en/t0.json", {"original_content": "original"})
+
+    for prefix in (PREFIX, "llm-output/2025/11/latest"):
+        result = load_from_s3(prefix, "empty", storage=storage)
+        assert result["pairs_found"] == 0
+
+    assert db.query(models.Execution).count() == 0
+
+
+def test_load_creates_execution_with_counters(db, storage, upload_pair):
+    for i in range(2):
+        upload_pair(PREFIX, f"t{i}", {"original_content": f"original {i}"}, {
+            "es": {"translated_content": f"traducción {i}"},
+        })
+
+    result = load_from_s3(PREFIX + "/", "counters", storage=storage)
+
+    execution = db.get(models.Execution, compute_execution_id(PREFIX, "counters"))
+    assert execution.id == result["execution_id"]
+    assert execution.description == "counters"
+    assert execution.source_prefix == PREFIX
+    assert execution.translation_count == 2
+    assert execution.manual_score_count == 0
+
+
+def test_ensure_execution_keeps_first_source_prefix(db):
+    ensure_execution(db, "exec-a", "run")
+    ensure_execution(db, "exec-a", "run", "llm-output/a")
+    ensure_execution(db, "exec-a", "run", "llm-output/b")
+
+    db.expire_all()
+    assert db.get(models.Execution, "exec-a").source_prefix == "llm-output/a"
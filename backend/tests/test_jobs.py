@@ -0,0 +1,78 @@
+"""
+JobRegistry conflict handling: two active jobs never share a key.
+"""
+import threading
+import time
+import pytest
+from app.jobs import JobConflictError, JobRegistry
+
+
+@pytest.fixture
+def registry():
+    registry = JobRegistry(max_workers=4)
+    yield registry
+    registry._executor.shutdown(wait=True)
+
+
+@pytest.fixture
+def release(registry):
+    """Event the jobs of a test block on; set when the test ends"""
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def blocking(release):
+    def run(progress):
+        release.wait(timeout=10)
+        return {}
+    return run
+
+
+def test_same_type_and_keys_returns_active_job(registry, release):
+    job = registry.submit("s3-load", ["exec-a"], {}, blocking(release))
+
+    assert registry.submit("s3-load", ["exec-a"], {"other": "params"}, blocking(release)) is job
+
+
+def test_other_type_on_same_key_conflicts(registry, release):
+    job = registry.submit("s3-load", ["exec-a"], {}, blocking(release))
+
+    with pytest.raises(JobConflictError, match="s3-load job is already running for exec-a") as error:
+        registry.submit("s3-scores", ["exec-a"], {}, blocking(release))
+    assert error.value.job is job
+
+
+def test_overlapping_keys_conflict(registry, release):
+    job = registry.submit("s3-load-many", ["exec-a", "exec-b"], {}, blocking(release))
+
+    for job_type, keys in [
+        ("s3-load", ["exec-b"]),
+        ("s3-load-many", ["exec-b", "exec-c"]),
+        ("s3-load-many", ["exec-a", "exec-b", "exec-c"]),
+    ]:
+        with pytest.raises(JobConflictError) as error:
+            registry.submit(job_type, keys, {}, blocking(release))
+        assert error.value.job is job
+
+
+def test_disjoint_keys_run_side_by_side(registry, release):
+    jobs = [
+        registry.submit("s3-load-many", ["exec-a", "exec-b"], {}, blocking(release)),
+        registry.submit("s3-load-many", ["exec-c", "exec-d"], {}, blocking(release)),
+        registry.submit("s3-load", ["exec-e"], {}, blocking(release)),
+    ]
+
+    assert len({job.id for job in jobs}) == 3
+    assert all(job.is_active for job in jobs)
+
+
+def test_keys_are_free_once_the_job_finishes(registry, release):
+    job = registry.submit("s3-load", ["exec-a"], {}, blocking(release))
+    release.set()
+    deadline = time.monotonic() + 10
+    while job.is_active and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert job.status == "succeeded"
+
+    assert registry.submit("s3-scores", ["exec-a"], {}, blocking(release)) is not job
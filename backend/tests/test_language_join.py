@@ -0,0 +1,73 @@
+"""
+LanguageJoin pairs every target-language object with the source object of
+the same key, whatever order the languages are listed in.
+"""
+from app.ingestion import LanguageJoin
+from app.s3_service import ObjectInfo
+
+PREFIX = "llm-output/2025/10/latest"
+
+
+def obj(language, key):
+    return ObjectInfo(f"{PREFIX}/{language}/{key}.json", 10, f"etag-{language}-{key}")
+
+
+def add_all(join, listing):
+    """Add (language, key) objects in listing order; return every pair completed"""
+    pairs = []
+    for language, key in listing:
+        pairs += join.add(language, key, obj(language, key))
+    return pairs
+
+
+def test_pairs_in_either_listing_order():
+    source_first = add_all(LanguageJoin("en"), [("en", "t0"), ("es", "t0")])
+    target_first = add_all(LanguageJoin("en"), [("es", "t0"), ("en", "t0")])
+
+    assert source_first == target_first == [(obj("en", "t0"), obj("es", "t0"), "es")]
+
+
+def test_every_target_language_gets_a_pair():
+    join = LanguageJoin("en")
+    pairs = add_all(join, [
+        ("de", "t0"), ("en", "t0"), ("es", "t0"), ("fr", "t0"), ("es", "t1"), ("en", "t1"),
+    ])
+
+    assert sorted(pairs) == [
+        (obj("en", "t0"), obj("de", "t0"), "de"),
+        (obj("en", "t0"), obj("es", "t0"), "es"),
+        (obj("en", "t0"), obj("fr", "t0"), "fr"),
+        (obj("en", "t1"), obj("es", "t1"), "es"),
+    ]
+    assert join.target_languages == ["de", "es", "fr"]
+
+
+def test_missing_languages_leave_objects_unpaired():
+    join = LanguageJoin("en")
+    pairs = add_all(join, [
+        ("en", "t0"),  # No target
+        ("es", "t1"),  # No source
+        ("es", "t2"), ("en", "t2"),
+    ])
+
+    assert pairs == [(obj("en", "t2"), obj("es", "t2"), "es")]
+    assert join.listed == {"en": 2, "es": 2}
+    assert join.target_languages == ["es"]
+
+
+def test_other_source_language():
+    join = LanguageJoin("es")
+    pairs = add_all(join, [("en", "t0"), ("es", "t0")])
+
+    assert pairs == [(obj("es", "t0"), obj("en", "t0"), "en")]
+    assert join.target_languages == ["en"]
+
+
+def test_shard_keys():
+    join = LanguageJoin("en")
+    shard = (PREFIX, "part-0")
+    source = ObjectInfo(f"{PREFIX}/en/part-0.jsonl", 10, None)
+    target = ObjectInfo(f"{PREFIX}/fr/part-0.jsonl", 10, None)
+
+    assert join.add("fr", shard, target) == []
+    assert join.add("en", shard, source) == [(source, target, "fr")]
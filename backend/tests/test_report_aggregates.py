@@ -0,0 +1,140 @@
+"""
+Report aggregates maintained through the API (score create, update and
+delete, translation create) must always equal a full
+refresh_report_aggregates of the execution.
+"""
+import pytest
+from app import models
+from app.auth import create_access_token
+from app.ingestion import load_from_s3
+from app.report_aggregates import AGGREGATE_COLUMNS, refresh_report_aggregates
+
+PREFIX = "llm-output/2025/10/latest"
+
+
+@pytest.fixture(scope="session")
+def client(database):
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    # One client (and event loop) for the whole run: the async engine's
+    # pooled connections belong to the loop that opened them
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def reviewers(db):
+    """Authorization headers of two reviewers"""
+    names = ["ana", "ben"]
+    db.add_all([
+        models.User(username=name, email=f"{name}@example.com", hashed_password="-", is_active=True)
+        for name in names
+    ])
+    db.commit()
+    return [{"Authorization": f"Bearer {create_access_token({'sub': name})}"} for name in names]
+
+
+@pytest.fixture
+def loaded(db, storage, upload_pair):
+    """
+    Load three translations over two prompts; return the execution ID and
+    the translation IDs by source key
+    """
+    for i, prompt in enumerate(["p1", "p1", "p2"]):
+        upload_pair(PREFIX, f"t{i}", {"original_content": f"original {i}", "prompt_id": prompt}, {
+            "es": {
+                "translated_content": f"traducción {i}",
+                "automated_scores": {"coherence": 0.5 + i / 10, "fidelity": 0.7, "naturalness": 0.8, "overall": 0.6},
+            },
+        })
+    execution_id = load_from_s3(PREFIX, "aggregates", storage=storage)["execution_id"]
+    translation_ids = {
+        source_key: id_ for source_key, id_ in db.query(models.Translation.source_key, models.Translation.id)
+    }
+    return execution_id, translation_ids
+
+
+def aggregates(db, execution_id):
+    """The execution's report groups by prompt, and its (translation, manual score) counters"""
+    db.commit()
+    groups = {
+        row.prompt_id: {column: getattr(row, column) for column in AGGREGATE_COLUMNS}
+        for row in db.query(models.ReportAggregate).filter_by(execution_id=execution_id)
+    }
+    execution = db.get(models.Execution, execution_id)
+    return groups, (execution.translation_count, execution.manual_score_count)
+
+
+def assert_matches_refresh(db, execution_id):
+    maintained_groups, maintained_counts = aggregates(db, execution_id)
+    refresh_report_aggregates(db, execution_id)
+    refreshed_groups, refreshed_counts = aggregates(db, execution_id)
+
+    assert maintained_counts == refreshed_counts
+    assert maintained_groups.keys() == refreshed_groups.keys()
+    for prompt_id, columns in refreshed_groups.items():
+        assert maintained_groups[prompt_id] == pytest.approx(columns), f"prompt {prompt_id}"
+
+
+def test_score_changes_match_refresh(db, client, reviewers, loaded):
+    execution_id, translations = loaded
+    ana, ben = reviewers
+
+    def create(headers, source_key, **values):
+        response = client.post(
+            "/api/scores/", headers=headers, json={"translation_id": translations[source_key], **values}
+        )
+        assert response.status_code == 200, response.text
+        assert_matches_refresh(db, execution_id)
+        return response.json()["id"]
+
+    def update(headers, score_id, **values):
+        response = client.put(f"/api/scores/{score_id}", headers=headers, json=values)
+        assert response.status_code == 200, response.text
+        assert_matches_refresh(db, execution_id)
+
+    def delete(headers, score_id):
+        response = client.delete(f"/api/scores/{score_id}", headers=headers)
+        assert response.status_code == 200, response.text
+        assert_matches_refresh(db, execution_id)
+
+    # First score of a translation makes it reviewed; a second one doesn't
+    ana_t0 = create(ana, "t0", coherence=0.9, fidelity=0.8, naturalness=0.7)
+    ben_t0 = create(ben, "t0", coherence=0.4, fidelity=0.6, naturalness=0.5, overall=0.5)
+    ana_t2 = create(ana, "t2", overall=1.0)
+
+    # Metrics set, changed and cleared
+    update(ana, ana_t0, coherence=None, overall=0.3)
+    update(ana, ana_t2, coherence=0.2, notes="fluent")
+
+    # The translation stays reviewed until its last score is deleted
+    delete(ben, ben_t0)
+    delete(ana, ana_t0)
+    delete(ana, ana_t2)
+
+    groups, counts = aggregates(db, execution_id)
+    assert counts == (3, 0)
+    assert all(group["reviewed_translation_count"] == 0 for group in groups.values())
+
+
+def test_translation_create_matches_refresh(db, client, reviewers, loaded):
+    execution_id, _ = loaded
+    ana, _ = reviewers
+    prompt_id = db.query(models.Prompt.id).filter_by(prompt_id="p2").scalar()
+
+    # Without automated scores, then scored manually
+    response = client.post("/api/translations/", headers=ana, json={
+        "execution_id": execution_id,
+        "prompt_id": prompt_id,
+        "original_content": "original",
+        "translated_content": "traducción",
+        "source_language": "en",
+        "target_language": "es",
+    })
+    assert response.status_code == 200, response.text
+    assert_matches_refresh(db, execution_id)
+
+    response = client.post("/api/scores/", headers=ana, json={"translation_id": response.json()["id"], "overall": 0.8})
+    assert response.status_code == 200, response.text
+    assert_matches_refresh(db, execution_id)
@@ -0,0 +1,102 @@
+"""
+Idempotent translation loads: upserts keyed by (execution_id, source_key,
+target_language) never duplicate rows, and executions.translation_count
+only counts inserted rows.
+"""
+import pytest
+from app import models
+from app.ingestion import PromptCache, ensure_execution, load_from_s3, upsert_translations
+
+PREFIX = "llm-output/2025/10/latest"
+
+
+def translation_rows(execution_id, prompt_id, count, content="traducción"):
+    return [
+        (f"t{i} (es)", {
+            "execution_id": execution_id,
+            "prompt_id": prompt_id,
+            "original_content": f"original {i}",
+            "translated_content": f"{content} {i}",
+            "source_language": "en",
+            "target_language": "es",
+            "automated_coherence": 4.0,
+            "automated_fidelity": 3.5,
+            "automated_naturalness": 4.5,
+            "automated_overall": 4.0,
+            "s3_insights_path": f"{PREFIX}/en/t{i}.json",
+            "s3_automated_qa_path": f"{PREFIX}/es/t{i}.json",
+            "source_key": f"t{i}",
+        })
+        for i in range(count)
+    ]
+
+
+def translation_count(db, execution_id):
+    db.expire_all()
+    return db.get(models.Execution, execution_id).translation_count
+
+
+@pytest.fixture
+def prompt_id(db):
+    return PromptCache(db).resolve({"default": {"name": "Default"}})["default"]
+
+
+@pytest.mark.parametrize("use_copy", [True, False])
+def test_upsert_again_updates_in_place(db, prompt_id, use_copy):
+    ensure_execution(db, "exec-a", "first run")
+
+    assert upsert_translations(db, translation_rows("exec-a", prompt_id, 3), use_copy=use_copy) == (3, 0, [])
+    assert upsert_translations(
+        db, translation_rows("exec-a", prompt_id, 3, content="revisada"), use_copy=use_copy
+    ) == (0, 3, [])
+
+    rows = db.query(models.Translation).filter_by(execution_id="exec-a").all()
+    assert len(rows) == 3
+    assert {row.translated_content for row in rows} == {f"revisada {i}" for i in range(3)}
+    assert translation_count(db, "exec-a") == 3
+
+
+@pytest.mark.parametrize("use_copy", [True, False])
+def test_upsert_counts_inserts_per_execution(db, prompt_id, use_copy):
+    ensure_execution(db, "exec-a", "first run")
+    ensure_execution(db, "exec-b", "second run")
+    upsert_translations(db, translation_rows("exec-a", prompt_id, 2), use_copy=use_copy)
+
+    # One batch mixing updates of exec-a with inserts of both executions
+    rows = translation_rows("exec-a", prompt_id, 4) + translation_rows("exec-b", prompt_id, 3)
+    assert upsert_translations(db, rows, use_copy=use_copy) == (5, 2, [])
+
+    assert translation_count(db, "exec-a") == 4
+    assert translation_count(db, "exec-b") == 3
+
+
+def test_upsert_bad_row_only_loses_itself(db, prompt_id):
+    ensure_execution(db, "exec-a", "first run")
+    rows = translation_rows("exec-a", prompt_id, 3)
+    rows[1][1]["prompt_id"] = prompt_id + 1000
+
+    inserted, updated, errors = upsert_translations(db, rows)
+
+    assert (inserted, updated) == (2, 0)
+    assert [label for label, _ in errors] == ["t1 (es)"]
+    assert translation_count(db, "exec-a") == 2
+
+
+def test_reload_from_storage_has_no_duplicates(db, storage, upload_pair):
+    for i in range(3):
+        upload_pair(PREFIX, f"t{i}", {"original_content": f"original {i}", "prompt_id": "p1"}, {
+            "es": {"translated_content": f"traducción {i}", "automated_scores": {"overall": 4}},
+            "fr": {"translated_content": f"traduction {i}"},
+        })
+
+    first = load_from_s3(PREFIX, "reload test", storage=storage)
+    second = load_from_s3(PREFIX, "reload test", storage=storage)
+
+    assert first["execution_id"] == second["execution_id"]
+    assert (first["translations_loaded"], first["translations_updated"]) == (6, 0)
+    assert (second["translations_loaded"], second["translations_updated"]) == (0, 6)
+    execution_id = first["execution_id"]
+    assert db.query(models.Translation).filter_by(execution_id=execution_id).count() == 6
+    assert translation_count(db, execution_id) == 6
+    aggregate = db.query(models.ReportAggregate).filter_by(execution_id=execution_id).one()
+    assert aggregate.translation_count == 6
@@ -1,14 +1,27 @@
 #!/usr/bin/env python3
 """
 Script to validate S3 prefix for translation loading
-Usage: docker compose exec backend python validate_s3_prefix.py <prefix>
+Usage: docker compose exec backend python validate_s3_prefix.py <prefix> [--max-objects N] [--source-language CODE]
 """
+import argparse
 import sys
-from app.s3_service import s3_service
+from app.config import get_settings
+from app.ingestion import language_of, shard_of
+from app.s3_service import parse_object_key, s3_service
 
+settings = get_settings()
 
-def validate_prefix(prefix: str):
-    """Validate S3 prefix and show structure"""
+
+def validate_prefix(prefix: str, max_objects: int = 0, source_language: str = None):
+    """
+    Validate S3 prefix and show structure.
+
+    Every language folder is discovered in one streamed listing; only the
+    file IDs needed for pair matching are kept in memory. With
+    max_objects > 0 the scan stops after that many objects and the counts
+    cover only the scanned part.
+    """
+    source_language = source_language or settings.SOURCE_LANGUAGE
     print(f"\n{'='*70}")
     print(f"Validating S3 prefix: {prefix}")
     print(f"{'='*70}\n")
@@ -21,11 +34,44 @@ def validate_prefix(prefix: str):
         return False
 
     try:
-        # List all objects with the prefix
+        # Stream objects with the prefix, keeping only counters and file IDs
         print(f"🔍 Scanning S3 bucket for prefix: {prefix}")
-        objects = s3_service.list_objects(prefix=prefix)
-
-        if not objects:
+        object_count = 0
+        json_files = []
+        json_count = 0
+        # Per language: objects, JSON file IDs and JSON Lines shards
+        # ((prefix, shard name))
+        language_counts = {}
+        ids = {}
+        shards = {}
+        truncated = False
+
+        for info in s3_service.iter_objects(prefix=prefix):
+            if max_objects and object_count >= max_objects:
+                truncated = True
+                break
+            obj = info.key
+            object_count += 1
+
+            shard = shard_of(obj)
+            if shard:
+                language, shard_key = shard
+                language_counts[language] = language_counts.get(language, 0) + 1
+                shards.setdefault(language, set()).add(shard_key)
+                if len(json_files) < 10:
+                    json_files.append(obj)
+
+            if parse_object_key(obj).format == "json":
+                json_count += 1
+                if len(json_files) < 10:
+                    json_files.append(obj)
+                # Extract file IDs (x.json pairs with x.json.gz)
+                language = language_of(obj)
+                if language:
+                    language_counts[language] = language_counts.get(language, 0) + 1
+                    ids.setdefault(language, set()).add(parse_object_key(obj).name)
+
+        if not object_count:
             print(f"\n❌ No objects found at prefix: {prefix}")
             print(f"\n💡 Tips:")
             print(f"   - Check that the prefix path is correct")
@@ -33,39 +79,43 @@ def validate_prefix(prefix: str):
             print(f"   - Make sure the prefix doesn't start with '/'")
             return False
 
-        print(f"✓ Found {len(objects)} objects\n")
-
-        # Check for en/ and es/ folders
-        en_files = [obj for obj in objects if '/en/' in obj or obj.startswith('en/')]
-        es_files = [obj for obj in objects if '/es/' in obj or obj.startswith('es/')]
-        json_files = [obj for obj in objects if obj.endswith('.json')]
+        print(f"✓ Found {object_count} objects" + (" (scan stopped at --max-objects)" if truncated else "") + "\n")
 
-        has_en = len(en_files) > 0
-        has_es = len(es_files) > 0
+        target_languages = sorted(language for language in language_counts if language != source_language)
+        has_source = source_language in language_counts
+        is_valid = has_source and bool(target_languages)
 
         print(f"📂 Folder Structure:")
-        print(f"   {'✓' if has_en else '✗'} en/ folder: {len(en_files)} files")
-        print(f"   {'✓' if has_es else '✗'} es/ folder: {len(es_files)} files")
-        print(f"   📄 JSON files: {len(json_files)} files")
+        print(f"   {'✓' if has_source else '✗'} {source_language}/ folder (source): "
+              f"{language_counts.get(source_language, 0)} files")
+        for language in target_languages:
+            print(f"   ✓ {language}/ folder (target): {language_counts[language]} files")
+        if not target_languages:
+            print(f"   ✗ no target language folder")
+        print(f"   📄 JSON files (incl. .gz/.zst): {json_count} files")
+        if shards:
+            print(f"   📦 JSON Lines shards: " + ", ".join(
+                f"{len(shards[language])} {language}" for language in sorted(shards)
+            ))
 
         # Show validation result
         print(f"\n{'='*70}")
-        if has_en and has_es:
-            print(f"✅ VALID PREFIX - Contains both en/ and es/ folders")
+        if is_valid:
+            print(f"✅ VALID PREFIX - {source_language} -> {', '.join(target_languages)}")
         else:
             missing = []
-            if not has_en:
-                missing.append("en/")
-            if not has_es:
-                missing.append("es/")
+            if not has_source:
+                missing.append(f"{source_language}/")
+            if not target_languages:
+                missing.append("a target language folder (e.g. es/)")
             print(f"❌ INVALID PREFIX - Missing required folders: {', '.join(missing)}")
 
         print(f"{'='*70}")
 
         # Show sample files
         if json_files:
-            print(f"\n📋 Sample JSON files (first 10):")
-            for i, file_path in enumerate(json_files[:10], 1):
+            print(f"\n📋 Sample JSON/JSONL files (first 10):")
+            for i, file_path in enumerate(json_files, 1):
                 # Show relative path from prefix
                 display_path = file_path
                 if file_path.startswith(prefix):
@@ -74,53 +124,43 @@ def validate_prefix(prefix: str):
 
         # Show detailed breakdown
         print(f"\n📊 File Breakdown:")
-        print(f"   English JSON files: {len([f for f in en_files if f.endswith('.json')])}")
-        print(f"   Spanish JSON files: {len([f for f in es_files if f.endswith('.json')])}")
+        for language in sorted(ids):
+            print(f"   {language} JSON files: {len(ids[language])}")
 
         # Check for matching pairs
-        if has_en and has_es:
-            en_json = [f for f in en_files if f.endswith('.json')]
-            es_json = [f for f in es_files if f.endswith('.json')]
-
-            # Extract file IDs
-            en_ids = set()
-            for f in en_json:
-                filename = f.split('/')[-1]
-                en_ids.add(filename)
-
-            es_ids = set()
-            for f in es_json:
-                filename = f.split('/')[-1]
-                es_ids.add(filename)
-
-            matching = en_ids & es_ids
-            en_only = en_ids - es_ids
-            es_only = es_ids - en_ids
-
+        if is_valid:
+            source_ids = ids.get(source_language, set())
+            source_shards = shards.get(source_language, set())
             print(f"\n🔗 Translation Pairs:")
-            print(f"   Matching pairs: {len(matching)}")
-            if en_only:
-                print(f"   ⚠️  English only: {len(en_only)}")
-            if es_only:
-                print(f"   ⚠️  Spanish only: {len(es_only)}")
+            for language in target_languages:
+                target_ids = ids.get(language, set())
+                print(f"   {source_language} -> {language}: {len(source_ids & target_ids)} matching pairs")
+                if source_ids - target_ids:
+                    print(f"      ⚠️  Without {language}: {len(source_ids - target_ids)}")
+                if target_ids - source_ids:
+                    print(f"      ⚠️  {language} only: {len(target_ids - source_ids)}")
+                target_shards = shards.get(language, set())
+                if source_shards or target_shards:
+                    print(f"      Matching shard pairs: {len(source_shards & target_shards)} "
+                          f"(records are matched by ID when loading)")
 
         # Show next steps
-        if has_en and has_es:
+        if is_valid:
             print(f"\n✨ Next Steps:")
             print(f"   You can now load translations using the Admin panel or:")
-            print(f"   docker compose exec backend python load_from_s3_prefix.py '{prefix}'")
+            print(f"   docker compose exec backend python load_from_s3.py '{prefix}' '<description>'")
         else:
             print(f"\n💡 Please ensure your S3 structure looks like:")
             print(f"   {prefix}/")
-            print(f"   ├── en/")
+            print(f"   ├── {source_language}/")
             print(f"   │   ├── file1.json")
             print(f"   │   └── file2.json")
-            print(f"   └── es/")
+            print(f"   └── es/   (one folder per target language)")
             print(f"       ├── file1.json")
             print(f"       └── file2.json")
 
         print(f"\n{'='*70}\n")
-        return has_en and has_es
+        return is_valid
 
     except Exception as e:
         print(f"\n❌ Error validating prefix: {e}")
@@ -132,15 +172,30 @@ def validate_prefix(prefix: str):
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("\n❌ Usage: python validate_s3_prefix.py <prefix>")
-        print("\nExample:")
-        print("   docker compose exec backend python validate_s3_prefix.py 'translations/batch-01'")
-        print("   docker compose exec backend python validate_s3_prefix.py 'translations/llm-output/2025/10/latest'")
-        sys.exit(1)
-
-    prefix = sys.argv[1]
-    is_valid = validate_prefix(prefix)
+    parser = argparse.ArgumentParser(
+        description="Validate an S3 prefix for translation loading",
+        epilog=(
+            "Example:\n"
+            "   docker compose exec backend python validate_s3_prefix.py 'translations/batch-01'\n"
+            "   docker compose exec backend python validate_s3_prefix.py 'translations/llm-output/2025/10/latest'"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("prefix", help="S3 prefix containing one folder per language (en/, es/, ...)")
+    parser.add_argument(
+        "--max-objects",
+        type=int,
+        default=0,
+        help="Stop scanning after this many objects (default: scan everything)"
+    )
+    parser.add_argument(
+        "--source-language",
+        default=settings.SOURCE_LANGUAGE,
+        help=f"Folder holding the originals (default: {settings.SOURCE_LANGUAGE})"
+    )
+    args = parser.parse_args()
+
+    is_valid = validate_prefix(args.prefix, max_objects=args.max_objects, source_language=args.source_language)
 
     # Exit with appropriate code
     sys.exit(0 if is_valid else 1)
@@ -714,11 +714,26 @@ async function loadTranslationsFromS3() {
             body: JSON.stringify({ prefix, description })
         });
 
-        // Hide loading overlay
+        if (!result.success) {
+            loadingOverlay.classList.add('hidden');
+            loadResult.textContent = `✗ ${result.message}`;
+            loadResult.className = 'message error';
+            return;
+        }
+
+        // The load runs as a background job: show its progress until it finishes
         loadingOverlay.classList.add('hidden');
+        const job = await waitForJob(result.job_id, (progress) => {
+            loadResult.textContent = formatJobProgress(progress);
+            loadResult.className = 'message info';
+        });
 
-        if (result.success) {
-            loadResult.textContent = `✓ ${result.message}\n\nExecution ID: ${result.execution_id}\nTranslations loaded: ${result.translations_loaded}\nPrompts created: ${result.prompts_created}`;
+        if (job.status === 'succeeded') {
+            const summary = job.result || {};
+            loadResult.textContent = `✓ Successfully loaded ${summary.translations_loaded || 0} translations\n\nExecution ID: ${result.execution_id}\nTranslations loaded: ${summary.translations_loaded || 0}\nPrompts created: ${summary.prompts_created || 0}`;
+            if (job.error_count > 0) {
+                loadResult.textContent += `\nPairs failed: ${job.error_count}`;
+            }
             loadResult.className = 'message success';
 
             // Clear form after successful load
@@ -732,7 +747,7 @@ async function loadTranslationsFromS3() {
                 loadPrompts();
             }
         } else {
-            loadResult.textContent = `✗ ${result.message}`;
+            loadResult.textContent = `✗ Error loading translations: ${job.error || 'job failed'}`;
             loadResult.className = 'message error';
         }
     } catch (error) {
@@ -745,6 +760,25 @@ async function loadTranslationsFromS3() {
     }
 }
 
+// Background Jobs
+const JOB_POLL_INTERVAL_MS = 2000;
+
+async function waitForJob(jobId, onProgress) {
+    while (true) {
+        const job = await apiRequest(`/admin/jobs/${jobId}`);
+        if (job.status === 'succeeded' || job.status === 'failed') {
+            return job;
+        }
+        onProgress(job);
+        await new Promise(resolve => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+    }
+}
+
+function formatJobProgress(job) {
+    const total = job.listing_complete ? `/${job.total}` : ` (${job.total} found so far)`;
+    return `Loading (${job.phase})... ${job.processed}${total} pairs processed, ${job.pairs_per_second} pairs/s, ${job.error_count} error(s)`;
+}
+
 // Utility Functions
 function escapeHtml(text) {
     const div = document.createElement('div');